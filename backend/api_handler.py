@@ -4,12 +4,10 @@ import os
 from argparse import Namespace
 from time import perf_counter
 
-from ariadne import (
-    gql,
-    graphql_sync,
-)
+from ariadne import graphql_sync
 
 from dataall.base.api import bootstrap as bootstrap_schema, get_executable_schema
+from dataall.base.api.schema_artifact import get_executable_schema_from_artifact, load_schema_artifact
 from dataall.base.utils.api_handler_utils import (
     extract_groups,
     attach_tenant_policy_for_groups,
@@ -18,10 +16,12 @@ from dataall.base.utils.api_handler_utils import (
     redact_creds,
 )
 from dataall.core.tasks.service_handlers import Worker
+from dataall.core.tasks.task_outbox import TaskOutbox
 from dataall.base.aws.sqs import SqsQueue
 from dataall.base.context import set_context, dispose_context, RequestContext
 from dataall.base.db import get_engine
 from dataall.base.loader import load_modules, ImportMode
+from dataall.base.utils import Parameter
 
 from graphql.pyutils import did_you_mean
 
@@ -30,6 +30,16 @@ logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 log = logging.getLogger(__name__)
 
 start = perf_counter()
+# duration in seconds of the phases of the cold start, logged once the handler is initialized
+cold_start_phases = {}
+
+
+def _end_phase(name, phase_start):
+    now = perf_counter()
+    cold_start_phases[name] = round(now - phase_start, 3)
+    return now
+
+
 for name in ['boto3', 's3transfer', 'botocore', 'boto']:
     logging.getLogger(name).setLevel(logging.ERROR)
 
@@ -38,13 +48,35 @@ ALLOW_INTROSPECTION = True if os.getenv('ALLOW_INTROSPECTION') == 'True' else Fa
 if not ALLOW_INTROSPECTION:
     did_you_mean.__globals__['MAX_LENGTH'] = 0
 
+phase_start = perf_counter()
 load_modules(modes={ImportMode.API})
-SCHEMA = bootstrap_schema()
-TYPE_DEFS = gql(SCHEMA.gql(with_directives=False))
+phase_start = _end_phase('load_modules', phase_start)
+
+# The schema is built from the artifact generated at build time, or bootstrapped from the loaded modules
+SCHEMA_ARTIFACT = load_schema_artifact(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'graphql_schema.json'))
+if SCHEMA_ARTIFACT:
+    SCHEMA = None
+    executable_schema = get_executable_schema_from_artifact(SCHEMA_ARTIFACT)
+else:
+    SCHEMA = bootstrap_schema()
+    executable_schema = get_executable_schema(SCHEMA)
+phase_start = _end_phase('schema', phase_start)
+
 ENVNAME = os.getenv('envname', 'local')
 ENGINE = get_engine(envname=ENVNAME)
+phase_start = _end_phase('db_engine', phase_start)
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', '*')
-Worker.queue = SqsQueue.send
+TASK_OUTBOX = TaskOutbox(SqsQueue.send, SqsQueue.send_batch)
+Worker.queue = TASK_OUTBOX.queue
+
+try:
+    # parameters read on every request are loaded in one call, then served from the cache
+    Parameter.prefetch_parameters(
+        env=ENVNAME, paths=['reauth/apis', 'pivotRole/externalId', 'pivotRole/pivotRoleName', 'sqs/queue_url']
+    )
+except Exception:
+    log.warning('Failed to prefetch SSM parameters', exc_info=True)
+phase_start = _end_phase('parameters', phase_start)
 
 
 def resolver_adapter(resolver):
@@ -64,9 +96,9 @@ def resolver_adapter(resolver):
     return adapted
 
 
-executable_schema = get_executable_schema()
 end = perf_counter()
 print(f'Lambda Context Initialization took: {end - start:.3f} sec')
+log.info('Cold start phases (sec): %s', json.dumps(cold_start_phases))
 
 
 def handler(event, context):
@@ -144,11 +176,19 @@ def handler(event, context):
     else:
         raise Exception(f'Could not initialize user context from event {event}')
 
-    success, response = graphql_sync(
-        schema=executable_schema, data=query, context_value=app_context, introspection=ALLOW_INTROSPECTION
-    )
-
-    dispose_context()
+    # the tasks queued by the request are sent in batches once the request is resolved
+    try:
+        with TASK_OUTBOX.collect() as outbox:
+            success, response = graphql_sync(
+                schema=executable_schema, data=query, context_value=app_context, introspection=ALLOW_INTROSPECTION
+            )
+    finally:
+        dispose_context()
+    if outbox['unsent']:
+        # the changes of the request are committed, the tasks that could not be queued are reported as failed
+        response.setdefault('errors', []).append(
+            {'message': f'The tasks {outbox["unsent"]} of the request could not be queued and are marked as failed'}
+        )
     response = json.dumps(response)
 
     log.info('Lambda Response Success: %s', success)
@@ -18,10 +18,24 @@ load_modules(modes={ImportMode.HANDLERS})
 
 
 def handler(event, context=None):
-    """Processes  messages received from sqs"""
+    """
+    Processes messages received from sqs, each message is a list of task ids.
+    Returns the records that failed so that only their messages are redelivered (partial batch response)
+    """
     log.info(f'Received Event: {event}')
-    for record in event['Records']:
+    records = event['Records']
+    messages = []
+    for record in records:
         log.info('Consumed record from queue: %s' % record)
-        message = json.loads(record['body'])
-        log.info(f'Extracted Message: {message}')
-        Worker.process(engine=engine, task_ids=message)
+        try:
+            messages.append(json.loads(record['body']))
+        except ValueError:
+            log.exception(f'Invalid message in record {record["messageId"]}')
+            messages.append(None)
+        log.info(f'Extracted Message: {messages[-1]}')
+
+    valid = [i for i, message in enumerate(messages) if message is not None]
+    results = Worker.process_batch(engine=engine, batches=[messages[i] for i in valid])
+    failed = [i for i, message in enumerate(messages) if message is None]
+    failed.extend(i for i, result in zip(valid, results) if result is None)
+    return {'batchItemFailures': [{'itemIdentifier': records[i]['messageId']} for i in sorted(failed)]}
@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import boto3
@@ -8,6 +9,7 @@ from botocore.exceptions import ClientError
 from fastapi import FastAPI, BackgroundTasks, status, Response
 
 import dataall.base.cdkproxy.cdk_cli_wrapper as wrapper
+from dataall.base.cdkproxy.cdk_synth_pool import CdkSynthPool
 from dataall.base import db
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.core.stacks.db.stack_models import Stack
@@ -20,6 +22,12 @@ logger = logging.getLogger('cdksass')
 ENVNAME = os.getenv('envname', 'local')
 logger.warning(f'Application started for envname= `{ENVNAME}` DH_DOCKER_VERSION:{os.environ.get("DH_DOCKER_VERSION")}')
 
+# Deployments are queued and run at most CDKPROXY_MAX_CONCURRENT_DEPLOYS at a time.
+# With CDKPROXY_WARM_SYNTH=true the stacks are synthesized in long-lived worker processes, see cdk_synth_pool
+MAX_CONCURRENT_DEPLOYS = int(os.getenv('CDKPROXY_MAX_CONCURRENT_DEPLOYS', 4))
+deploy_queue = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DEPLOYS, thread_name_prefix='cdk-deploy')
+synth_pool = CdkSynthPool() if os.getenv('CDKPROXY_WARM_SYNTH', 'false').lower() == 'true' else None
+
 
 def connect():
     logger.info(f'Connecting to database for environment: `{ENVNAME}`')
@@ -35,6 +43,13 @@ def connect():
 app = FastAPI()
 
 
+@app.on_event('shutdown')
+def shutdown():
+    deploy_queue.shutdown(wait=False, cancel_futures=True)
+    if synth_pool:
+        synth_pool.shutdown()
+
+
 @app.get('/', status_code=status.HTTP_200_OK)
 def up(response: Response):
     logger.info('GET /')
@@ -117,8 +132,8 @@ def check_cdk_installed(response: Response):
 
 
 @app.post('/stack/{stackid}', status_code=status.HTTP_202_ACCEPTED)
-async def create_stack(stackid: str, background_tasks: BackgroundTasks, response: Response):
-    """Deploys or updates the stack"""
+async def create_stack(stackid: str, response: Response, force: bool = False):
+    """Deploys or updates the stack, force deploys it even if its templates did not change"""
     logger.info(f'POST /stack/{stackid}')
     try:
         engine = connect()
@@ -154,7 +169,7 @@ async def create_stack(stackid: str, background_tasks: BackgroundTasks, response
                 }
             stack.status = 'RUNNING'
         logger.info('Adding bg task')
-        background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid)
+        deploy_queue.submit(wrapper.deploy_cdk_stack, engine, stackid, force=force, synth_pool=synth_pool)
         results.append(
             {
                 'DH_DOCKER_VERSION': os.environ.get('DH_DOCKER_VERSION'),
@@ -68,8 +68,9 @@ def resolver_adapter(resolver):
     return adapted
 
 
-def get_executable_schema():
-    schema = bootstrap()
+def get_executable_schema(schema=None):
+    """Returns the executable schema of the given or bootstrapped schema"""
+    schema = schema or bootstrap()
     _types = []
     for _type in schema.types:
         if _type.name == 'Query':
@@ -0,0 +1,88 @@
+"""
+Prebuilt GraphQL schema of the API handler. The artifact is generated at build time with
+    python -m dataall.base.api.schema_artifact <path>
+It contains the SDL of the schema of the active modules and the fields that have a resolver.
+The API handler builds its executable schema from the artifact instead of bootstrapping the schema.
+The modules are still loaded, the resolvers are taken from the GraphQL types they registered.
+"""
+
+import json
+import logging
+import os
+import sys
+from typing import Optional
+
+from ariadne import EnumType, MutationType, ObjectType, QueryType, UnionType, make_executable_schema
+
+from dataall.base.api import bootstrap, gql, resolver_adapter
+from dataall.base.loader import ImportMode, list_loaded_modules, load_modules
+
+log = logging.getLogger(__name__)
+
+ARTIFACT_PATH = os.getenv('GRAPHQL_SCHEMA_ARTIFACT', 'graphql_schema.json')
+
+
+def _registered_resolver(type_name: str, field_name: str = None):
+    """Returns the resolver of the registered field, or of the union if there is no field_name"""
+    if field_name is None:
+        return gql.Union.get_instance(type_name).resolver
+    if type_name == 'Query':
+        return gql.QueryField.get_instance(field_name).resolver
+    if type_name == 'Mutation':
+        return gql.MutationField.get_instance(field_name).resolver
+    return gql.ObjectType.get_instance(type_name).field(field_name).resolver
+
+
+def build_schema_artifact(schema) -> dict:
+    """Returns the SDL and the fields with a resolver of a bootstrapped schema"""
+    return {
+        'modules': sorted(list_loaded_modules()),
+        'sdl': schema.gql(with_directives=False),
+        'resolvers': {_type.name: [field.name for field in _type.fields if field.resolver] for _type in schema.types},
+        'enums': {enum.name: {value.name: value.value for value in enum.values} for enum in schema.enums},
+        'unions': [union.name for union in schema.unions],
+    }
+
+
+def write_schema_artifact(path: str) -> None:
+    load_modules(modes={ImportMode.API})
+    artifact = build_schema_artifact(bootstrap())
+    # the SDL is validated at build time
+    make_executable_schema(artifact['sdl'])
+    with open(path, 'w') as f:
+        json.dump(artifact, f)
+    log.info(f'GraphQL schema artifact written to {path}')
+
+
+def load_schema_artifact(path: str = ARTIFACT_PATH) -> Optional[dict]:
+    """Returns the artifact if it exists and was built for the loaded modules"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        artifact = json.load(f)
+    if artifact['modules'] != sorted(list_loaded_modules()):
+        log.warning(f'GraphQL schema artifact {path} was built for other modules, it is ignored')
+        return None
+    return artifact
+
+
+def get_executable_schema_from_artifact(artifact: dict):
+    bindables = []
+    for type_name, field_names in artifact['resolvers'].items():
+        if type_name == 'Query':
+            object_type = QueryType()
+        elif type_name == 'Mutation':
+            object_type = MutationType()
+        else:
+            object_type = ObjectType(name=type_name)
+        for field_name in field_names:
+            object_type.field(field_name)(resolver_adapter(_registered_resolver(type_name, field_name)))
+        bindables.append(object_type)
+
+    bindables.extend(EnumType(name, values) for name, values in artifact['enums'].items())
+    bindables.extend(UnionType(name, _registered_resolver(name)) for name in artifact['unions'])
+    return make_executable_schema(artifact['sdl'], *bindables)
+
+
+if __name__ == '__main__':
+    write_schema_artifact(sys.argv[1] if len(sys.argv) > 1 else ARTIFACT_PATH)
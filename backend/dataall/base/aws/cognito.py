@@ -3,6 +3,7 @@ import logging
 import boto3
 
 from dataall.base.services.service_provider import ServiceProvider
+from dataall.base.utils import Parameter
 
 log = logging.getLogger(__name__)
 
@@ -13,9 +14,8 @@ class Cognito(ServiceProvider):
 
     def get_cognito_users(self, groupName):
         envname = os.getenv('envname', 'local')
-        parameter_path = f'/dataall/{envname}/cognito/userpool'
-        ssm = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-        user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+        # the user pool id is served from the parameter cache
+        user_pool_id = Parameter.get_parameter(env=envname, path='cognito/userpool')
         paginator = self.client.get_paginator('list_users_in_group')
         pages = paginator.paginate(UserPoolId=user_pool_id, GroupName=groupName)
         cognito_user_list = []
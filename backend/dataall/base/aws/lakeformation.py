@@ -0,0 +1,123 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from botocore.exceptions import ClientError
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class LakeFormationBatchFailure:
+    """A grant/revoke entry rejected by BatchGrantPermissions/BatchRevokePermissions"""
+
+    operation: str
+    entry: dict
+    code: str
+    message: str
+
+    @property
+    def principal(self) -> str:
+        return self.entry['Principal']['DataLakePrincipalIdentifier']
+
+    def to_client_error(self) -> ClientError:
+        """Returns the error raised by the equivalent GrantPermissions/RevokePermissions call"""
+        return ClientError({'Error': {'Code': self.code, 'Message': self.message}}, self.operation)
+
+
+class LakeFormationBatch:
+    """
+    Collects Lake Formation grants and revokes of a catalog and sends them with BatchGrantPermissions and
+    BatchRevokePermissions, in chunks of up to 20 entries (the limit of the batch APIs).
+    Entries rejected with ConcurrentModificationException are sent again, the other rejected entries are
+    returned by flush() so that the callers can apply their own error handling.
+    """
+
+    BATCH_SIZE = 20
+    MAX_ATTEMPTS = 5
+    WAIT_MIN_SECONDS = 1
+    WAIT_MAX_SECONDS = 3
+
+    def __init__(self, client, catalog_id: str = None):
+        self._client = client
+        self._catalog_id = catalog_id
+        self._entries = {'grant': [], 'revoke': []}
+
+    def grant(self, principal: str, resource: dict, permissions: List, permissions_with_grant_options: List = None):
+        self._entries['grant'].append(self._entry(principal, resource, permissions, permissions_with_grant_options))
+
+    def revoke(self, principal: str, resource: dict, permissions: List, permissions_with_grant_options: List = None):
+        self._entries['revoke'].append(self._entry(principal, resource, permissions, permissions_with_grant_options))
+
+    def flush(self) -> List[LakeFormationBatchFailure]:
+        """Sends the collected entries and returns the entries that failed"""
+        failures = []
+        for operation, send in (
+            ('grant', self._client.batch_grant_permissions),
+            ('revoke', self._client.batch_revoke_permissions),
+        ):
+            entries, self._entries[operation] = self._entries[operation], []
+            for i in range(0, len(entries), self.BATCH_SIZE):
+                failures.extend(self._send(operation, send, entries[i : i + self.BATCH_SIZE]))
+        return failures
+
+    def _send(self, operation, send, entries) -> List[LakeFormationBatchFailure]:
+        entries = [dict(entry, Id=str(i)) for i, entry in enumerate(entries)]
+        name = 'BatchGrantPermissions' if operation == 'grant' else 'BatchRevokePermissions'
+        failures = []
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            kwargs = {'Entries': entries}
+            if self._catalog_id:
+                kwargs['CatalogId'] = self._catalog_id
+            response = send(**kwargs)
+            by_id = {entry['Id']: entry for entry in entries}
+            retry = []
+            failures = []
+            for failure in response.get('Failures', []):
+                entry = by_id[failure['RequestEntry']['Id']]
+                error = failure.get('Error', {})
+                if error.get('ErrorCode') == 'ConcurrentModificationException' and attempt < self.MAX_ATTEMPTS:
+                    retry.append(entry)
+                else:
+                    failures.append(
+                        LakeFormationBatchFailure(name, entry, error.get('ErrorCode'), error.get('ErrorMessage', ''))
+                    )
+            log.info(f'{name} of {len(entries)} entries: {len(failures)} failed, {len(retry)} to retry')
+            if not retry:
+                break
+            entries = retry
+            time.sleep(random.uniform(self.WAIT_MIN_SECONDS, self.WAIT_MAX_SECONDS))
+        return failures
+
+    @staticmethod
+    def _entry(principal, resource, permissions, permissions_with_grant_options):
+        entry = dict(
+            Principal={'DataLakePrincipalIdentifier': principal},
+            Resource=resource,
+            Permissions=permissions,
+        )
+        if permissions_with_grant_options:
+            entry['PermissionsWithGrantOption'] = permissions_with_grant_options
+        return entry
+
+    @staticmethod
+    def list_permissions_by_principal(client, resource: dict) -> Dict[str, Tuple[set, set]]:
+        """
+        Returns the permissions and permissions with grant option of every principal on the resource,
+        with one (paginated) ListPermissions request instead of one request per principal
+        """
+        permissions = {}
+        kwargs = dict(Resource=resource)
+        while True:
+            response = client.list_permissions(**kwargs)
+            for permission in response['PrincipalResourcePermissions']:
+                current, current_grant = permissions.setdefault(
+                    permission['Principal']['DataLakePrincipalIdentifier'], (set(), set())
+                )
+                current.update(permission.get('Permissions', []))
+                current_grant.update(permission.get('PermissionsWithGrantOption', []))
+            if not response.get('NextToken'):
+                return permissions
+            kwargs['NextToken'] = response['NextToken']
@@ -4,6 +4,7 @@ from typing import List
 from botocore.exceptions import ClientError
 
 from .sts import SessionHelper
+from dataall.base.utils.parameter import parameter_cache
 
 log = logging.getLogger(__name__)
 
@@ -28,14 +29,26 @@ class ParameterStoreManager:
 
     @staticmethod
     def get_parameter_value(AwsAccountId=None, region=None, parameter_path=None):
+        """Parameters of the central account are cached, see ParameterCache"""
         if not parameter_path:
             raise Exception('Parameter name is None')
+        central_account = not AwsAccountId
+        if central_account:
+            cached, parameter_value = parameter_cache.get(region, parameter_path)
+            if cached and parameter_value is None:
+                raise Exception(f'Parameter {parameter_path} not found')
+            if cached:
+                return parameter_value
         try:
             parameter_value = ParameterStoreManager.client(AwsAccountId, region).get_parameter(Name=parameter_path)[
                 'Parameter'
             ]['Value']
         except ClientError as e:
+            if central_account and e.response['Error']['Code'] == 'ParameterNotFound':
+                parameter_cache.put(region, parameter_path, None)
             raise Exception(e)
+        if central_account:
+            parameter_cache.put(region, parameter_path, parameter_value)
         return parameter_value
 
     @staticmethod
@@ -64,4 +77,5 @@ class ParameterStoreManager:
         except ClientError as e:
             raise Exception(e)
         else:
+            parameter_cache.invalidate(parameter_name)
             return str(response)
@@ -1,11 +1,28 @@
+import json
 import logging
 import os
+import threading
+import time
+from typing import List
+
 import boto3
 
 log = logging.getLogger(__name__)
 
 
 class Ses:
+    # SendBulkEmail accepts up to 50 destinations per request
+    MAX_BULK_ENTRIES = 50
+    # used when the send rate of the account can not be read
+    DEFAULT_MAX_SEND_RATE = float(os.getenv('SES_MAX_SEND_RATE', 1))
+    TEMPLATE_NAME = f'dataall-{os.getenv("envname", "local")}-notification'
+
+    # shared by the clients of the process, as get_ses_client returns a new client on every call
+    _template_created = False
+    _max_send_rate = None
+    _next_send_time = 0
+    _lock = threading.Lock()
+
     def __init__(self, fromEmailId: str = None):
         self.fromEmailId = fromEmailId
         self.client = boto3.client('sesv2', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
@@ -41,3 +58,84 @@ class Ses:
                 return True
             log.error(f'Error while sending email {e})')
             raise e
+
+    def send_bulk_email(self, emails: List[dict]) -> List[dict]:
+        """
+        Sends emails {'to', 'subject', 'message'} with a template whose subject and html body are replaced per email.
+        Each destination receives its own message, up to MAX_BULK_ENTRIES per SendBulkEmail request,
+        and the requests are paced to the maximum send rate of the SES account.
+        Returns the result of each email: {'to', 'messageId', 'status', 'error'}
+        """
+        try:
+            self._create_template()
+        except Exception as e:
+            envname = os.getenv('envname', 'local')
+            if envname in ['local', 'dkrcompose']:
+                log.error('Local development environment does not support SES notifications')
+                return [{'to': email['to'], 'messageId': None, 'status': 'SKIPPED', 'error': None} for email in emails]
+            raise e
+
+        results = []
+        for start in range(0, len(emails), self.MAX_BULK_ENTRIES):
+            chunk = emails[start : start + self.MAX_BULK_ENTRIES]
+            self._throttle(len(chunk))
+            response = self.client.send_bulk_email(
+                FromEmailAddress=self.fromEmailId,
+                DefaultContent={'Template': {'TemplateName': self.TEMPLATE_NAME, 'TemplateData': '{}'}},
+                BulkEmailEntries=[
+                    {
+                        'Destination': {'ToAddresses': [email['to']]},
+                        'ReplacementEmailContent': {
+                            'ReplacementTemplate': {
+                                'ReplacementTemplateData': json.dumps(
+                                    {'subject': email['subject'], 'message': email['message']}
+                                )
+                            }
+                        },
+                    }
+                    for email in chunk
+                ],
+            )
+            for email, result in zip(chunk, response['BulkEmailEntryResults']):
+                results.append(
+                    {
+                        'to': email['to'],
+                        'messageId': result.get('MessageId'),
+                        'status': result.get('Status'),
+                        'error': result.get('Error'),
+                    }
+                )
+        for result in results:
+            if result['status'] != 'SUCCESS':
+                log.error(f'Failed to send email to {result["to"]}: {result["status"]} {result["error"]}')
+        return results
+
+    def _create_template(self):
+        if Ses._template_created:
+            return
+        # triple braces insert the subject and the html message without escaping them
+        content = {'Subject': '{{{subject}}}', 'Html': '{{{message}}}'}
+        try:
+            template = self.client.get_email_template(TemplateName=self.TEMPLATE_NAME)
+            if {key: template['TemplateContent'].get(key) for key in content} != content:
+                log.info(f'Updating SES email template {self.TEMPLATE_NAME}')
+                self.client.update_email_template(TemplateName=self.TEMPLATE_NAME, TemplateContent=content)
+        except self.client.exceptions.NotFoundException:
+            log.info(f'Creating SES email template {self.TEMPLATE_NAME}')
+            self.client.create_email_template(TemplateName=self.TEMPLATE_NAME, TemplateContent=content)
+        Ses._template_created = True
+
+    def _throttle(self, count: int):
+        """Waits until count emails can be sent without exceeding the maximum send rate"""
+        if Ses._max_send_rate is None:
+            try:
+                Ses._max_send_rate = self.client.get_account()['SendQuota']['MaxSendRate']
+            except Exception as e:
+                log.warning(f'Failed to read the SES send quota, using {self.DEFAULT_MAX_SEND_RATE} emails/s: {e}')
+                Ses._max_send_rate = self.DEFAULT_MAX_SEND_RATE
+        with Ses._lock:
+            now = time.monotonic()
+            send_time = max(now, Ses._next_send_time)
+            Ses._next_send_time = send_time + count / Ses._max_send_rate
+        if send_time > now:
+            time.sleep(send_time - now)
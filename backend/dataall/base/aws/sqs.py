@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import uuid
+from typing import List
 
 import boto3
 from botocore.exceptions import ClientError
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 class SqsQueue:
     disabled = True
     queue_url = None
+    _client = None
+
+    MAX_BATCH_SIZE = 10  # maximum number of messages of a SendMessageBatch request
+    TASKS_PER_MESSAGE = int(os.getenv('SQS_TASKS_PER_MESSAGE', 10))
 
     @classmethod
     def configure_(cls, queue_url):
@@ -38,12 +43,18 @@ class SqsQueue:
     @classmethod
     def get_sqs_client(cls):
         if not cls.disabled:
-            client = boto3.client('sqs', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-            return client
+            if cls._client is None:  # boto3 clients are thread safe and can be reused
+                cls._client = boto3.client('sqs', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
+            return cls._client
+
+    @classmethod
+    def _configure(cls):
+        if cls.queue_url is None:
+            cls.configure_(Parameter().get_parameter(env=cls.get_envname(), path='sqs/queue_url'))
 
     @classmethod
     def send(cls, engine, task_ids: [str]):
-        cls.configure_(Parameter().get_parameter(env=cls.get_envname(), path='sqs/queue_url'))
+        cls._configure()
         client = cls.get_sqs_client()
         logger.debug(f'Sending task {task_ids} through SQS {cls.queue_url}')
         try:
@@ -57,6 +68,40 @@ class SqsQueue:
             logger.error(e)
             raise e
 
+    @classmethod
+    def send_batch(cls, task_ids: List[str]) -> List[str]:
+        """
+        Sends the tasks in order, with up to TASKS_PER_MESSAGE tasks per message and MAX_BATCH_SIZE messages
+        per request. Returns the ids of the tasks whose message could not be sent.
+        """
+        cls._configure()
+        client = cls.get_sqs_client()
+        messages = [
+            task_ids[start : start + cls.TASKS_PER_MESSAGE] for start in range(0, len(task_ids), cls.TASKS_PER_MESSAGE)
+        ]
+        logger.debug(f'Sending tasks {task_ids} in {len(messages)} messages through SQS {cls.queue_url}')
+        unsent = []
+        for start in range(0, len(messages), cls.MAX_BATCH_SIZE):
+            batch = messages[start : start + cls.MAX_BATCH_SIZE]
+            entries = [
+                {
+                    'Id': str(index),
+                    'MessageBody': json.dumps(message),
+                    'MessageGroupId': cls._get_random_message_id(),
+                    'MessageDeduplicationId': cls._get_random_message_id(),
+                }
+                for index, message in enumerate(batch)
+            ]
+            try:
+                failed = client.send_message_batch(QueueUrl=cls.queue_url, Entries=entries).get('Failed', [])
+            except ClientError as e:
+                logger.error(e)
+                failed = [{'Id': entry['Id']} for entry in entries]
+            for entry in failed:
+                logger.error(f'Failed to send SQS message {entry}')
+                unsent.extend(batch[int(entry['Id'])])
+        return unsent
+
     @classmethod
     def _get_random_message_id(cls):
         return str(uuid.uuid4())
@@ -1,12 +1,20 @@
 import json
 import logging
 import os
+import threading
 import urllib
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable
 
 import boto3
 from botocore.client import Config
+from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError
+from botocore.session import get_session as get_botocore_session
 from dataall.base.config import config
+from dataall.base.utils.parameter import parameter_cache
 
 from dataall.version import __version__, __pkg_name__
 
@@ -20,6 +28,76 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# botocore refreshes the credentials it holds 15 minutes before they expire, and fails if they are still
+# within 10 minutes of the expiration after the refresh. The cache must not hand out credentials closer than that.
+_MIN_REFRESH_MARGIN = 10 * 60
+CREDENTIALS_REFRESH_MARGIN = max(int(os.getenv('CREDENTIALS_REFRESH_MARGIN_SECONDS', 15 * 60)), _MIN_REFRESH_MARGIN)
+
+
+class AssumedRoleCredentialsCache:
+    """
+    Process wide, thread safe cache of the credentials returned by sts:AssumeRole.
+    Credentials are reused until refresh_margin seconds before their Expiration, then the role is assumed again.
+    """
+
+    def __init__(self, refresh_margin: int = CREDENTIALS_REFRESH_MARGIN):
+        self.refresh_margin = timedelta(seconds=refresh_margin)
+        self.hits = 0
+        self.misses = 0
+        self._credentials = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}  # key -> [lock, number of threads holding or waiting for it]
+
+    def get(self, key, assume_role: Callable[[], dict]) -> dict:
+        """Returns the cached credentials for the key, calling assume_role when they are missing or expiring"""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            key_lock[1] += 1
+        try:
+            with key_lock[0]:  # only one thread assumes the role, the others wait for its credentials
+                credentials = self._credentials.get(key)
+                hit = credentials is not None and not self._is_expiring(credentials)
+                if not hit:
+                    credentials = assume_role()
+                    self._credentials[key] = credentials
+        finally:
+            with self._lock:  # the lock of the key is removed once no thread holds or waits for it
+                key_lock[1] -= 1
+                if not key_lock[1] and self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return credentials
+
+    def _is_expiring(self, credentials) -> bool:
+        return credentials['Expiration'] - self.refresh_margin <= datetime.now(timezone.utc)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._credentials)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._credentials.clear()
+            self._key_locks.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_credentials_cache = AssumedRoleCredentialsCache()
+_clients = {}
+_clients_lock = threading.Lock()
+_call_limits = threading.local()
+
+
+def _limit_remote_call(accountid, **kwargs):
+    acquire = getattr(_call_limits, 'acquire', None)
+    if acquire:
+        acquire(accountid)
+
 
 class SessionHelper:
     """SessionHelpers is a class simplifying common aws boto3 session tasks and helpers"""
@@ -48,27 +126,100 @@ class SessionHelper:
                     RoleArn=role_arn,
                     RoleSessionName=role_arn.split('/')[1],
                 )
-            try:
-                region = os.getenv('AWS_REGION', 'eu-west-1')
-                sts = base_session.client(
-                    'sts',
-                    config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
-                    region_name=region,
-                    endpoint_url=f'https://sts.{region}.amazonaws.com',
-                )
-                response = sts.assume_role(**assume_role_dict)
-                return boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                )
-            except ClientError as e:
-                log.error(f'Failed to assume role {role_arn} due to: {e} ')
-                raise e
+            region = os.getenv('AWS_REGION', 'eu-west-1')
+
+            def assume_role():
+                try:
+                    sts = base_session.client(
+                        'sts',
+                        config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
+                        region_name=region,
+                        endpoint_url=f'https://sts.{region}.amazonaws.com',
+                    )
+                    return sts.assume_role(**assume_role_dict)['Credentials']
+                except ClientError as e:
+                    log.error(f'Failed to assume role {role_arn} due to: {e} ')
+                    raise e
+
+            return cls._cached_credentials_session(key=(role_arn, external_id_secret, region), assume_role=assume_role)
 
         else:
             return boto3.Session()
 
+    @classmethod
+    def _cached_credentials_session(cls, key, assume_role: Callable[[], dict]):
+        """
+        Returns a boto3 session using the cached credentials of the assumed role.
+        The session credentials are refreshable: when they get close to the expiration, boto3 gets new ones from the cache
+        """
+
+        def refresh():
+            credentials = _credentials_cache.get(key, assume_role)
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+
+        botocore_session = get_botocore_session()
+        botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+            metadata=refresh(), refresh_using=refresh, method='sts-assume-role'
+        )
+        return boto3.Session(botocore_session=botocore_session)
+
+    @classmethod
+    def remote_client(cls, accountid, region, service_name, role=None):
+        """Returns a boto3 client on the remote AWS account assuming the delegation role or the provided role.
+        Clients are thread safe and their credentials refresh themselves, so one client is reused
+        for every (account, region, service, role) in the process
+        Args:
+            accountid(string) : aws account id
+            region(string) : aws region
+            service_name(string) : name of the aws service e.g. 'glue'
+            role(string, optional) : arn of the IAM role to assume instead of the pivot role
+        Returns :
+            botocore.client.BaseClient: boto3 client
+        """
+        key = (accountid, region, service_name, role)
+        with _clients_lock:
+            client = _clients.get(key)
+        if client is None:
+            client = cls.remote_session(accountid=accountid, region=region, role=role).client(
+                service_name, region_name=region
+            )
+            with _clients_lock:
+                client = _clients.setdefault(key, client)
+        return client
+
+    @staticmethod
+    @contextmanager
+    def limit_remote_calls(acquire: Callable[[str], None]):
+        """
+        Calls acquire(accountid) before every API call made by the current thread with the sessions and clients
+        of remote_session and remote_client, e.g. to wait for a token of a per account rate limiter
+        """
+        _call_limits.acquire = acquire
+        try:
+            yield
+        finally:
+            _call_limits.acquire = None
+
+    @staticmethod
+    def get_cache_metrics() -> dict:
+        """Returns the hits/misses of the assumed role credentials cache and the number of cached clients"""
+        metrics = _credentials_cache.metrics()
+        with _clients_lock:
+            metrics['clients'] = len(_clients)
+        return metrics
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops the cached credentials and clients"""
+        _credentials_cache.clear()
+        with _clients_lock:
+            _clients.clear()
+
     @classmethod
     def _get_parameter_value(cls, parameter_path=None):
         """
@@ -80,6 +231,9 @@ class SessionHelper:
         region = os.getenv('AWS_REGION', 'eu-west-1')
         if not parameter_path:
             raise Exception('Parameter name is None')
+        cached, parameter_value = parameter_cache.get(region, parameter_path)
+        if cached:
+            return parameter_value
         try:
             session = SessionHelper.get_session()
             client = session.client('ssm', region_name=region)
@@ -87,6 +241,9 @@ class SessionHelper:
             log.debug(f'Found Parameter {parameter_path}|{parameter_value}')
         except ClientError as e:
             log.warning(f'Parameter {parameter_path} not found: {e}')
+            if e.response['Error']['Code'] != 'ParameterNotFound':
+                return parameter_value
+        parameter_cache.put(region, parameter_path, parameter_value)
         return parameter_value
 
     @classmethod
@@ -213,6 +370,9 @@ class SessionHelper:
             log.info(f'Remote boto3 session using pivot role for account= {accountid}')
             role_arn = cls.get_delegation_role_arn(accountid=accountid, region=region)
         session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
+        session.events.register(
+            'before-call.*.*', partial(_limit_remote_call, accountid), unique_id='dataall-limit-remote-calls'
+        )
         return session
 
     @classmethod
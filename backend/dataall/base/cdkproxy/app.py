@@ -18,9 +18,9 @@ load_modules(modes={ImportMode.CDK})
 
 class CdkRunner:
     @staticmethod
-    def create():
+    def create(app: App = None):
         logger.info('Ï')
-        app = App()
+        app = app or App()
         # 1. Reading info from context
         # 1.1 Reading account from context
         table = []
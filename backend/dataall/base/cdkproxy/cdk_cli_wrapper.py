@@ -4,10 +4,14 @@
 # see : https://github.com/aws-samples/cdk-assume-role-credential-plugin
 
 import ast
+import hashlib
+import json
 import logging
 import os
 import subprocess
 import sys
+import tempfile
+import time
 from abc import abstractmethod
 from typing import Dict
 
@@ -24,6 +28,10 @@ logger = logging.getLogger('cdksass')
 
 ENVNAME = os.getenv('envname', 'local')
 
+# In fingerprint mode the stack is synthesized first and only deployed if its templates changed since the last deploy
+FINGERPRINT_MODE = os.getenv('CDK_FINGERPRINT_MODE', 'false').lower() == 'true'
+DEPLOYED_STATUSES = ['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'IMPORT_COMPLETE']
+
 
 class CDKCliWrapperExtension:
     def __init__(self):
@@ -72,7 +80,90 @@ def update_stack_output(session, stack):
         stack.outputs = outputs
 
 
-def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: str = None):
+def fingerprint_cloud_assembly(assembly_dir: str) -> str:
+    """
+    Returns a hash of the CloudFormation templates and asset manifests of a synthesized cloud assembly.
+    Assets are referenced by the hash of their content, the JSON files are normalized before hashing.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(assembly_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(('.template.json', '.assets.json')) or os.path.basename(root).startswith('asset.'):
+                continue
+            file_path = os.path.join(root, name)
+            with open(file_path) as f:
+                content = json.load(f)
+            digest.update(os.path.relpath(file_path, assembly_dir).encode())
+            digest.update(json.dumps(content, sort_keys=True, separators=(',', ':')).encode())
+    return digest.hexdigest()
+
+
+def record_deployment_events(stack, timings: dict, template_hash: str = None, skipped: bool = False):
+    """Records the duration in seconds of the synth, diff and deploy phases next to the CloudFormation events"""
+    stack.events = {
+        **(stack.events or {}),
+        'deployment': {
+            'timings': {phase: round(duration, 3) for phase, duration in timings.items()},
+            'templateHash': template_hash,
+            'skipped': skipped,
+        },
+    }
+
+
+def _run_cdk(stack, command, app, env, cwd, extra_args=None):
+    input_args = [stack.name, stack.accountid, stack.region, stack.stack, stack.targetUri]
+
+    CommandSanitizer(input_args)
+
+    cmd = [
+        '. ~/.nvm/nvm.sh &&',
+        'cdk',
+        command,
+        '-c',
+        f"appid='{stack.name}'",
+        # the target accountid
+        '-c',
+        f"account='{stack.accountid}'",
+        # the target region
+        '-c',
+        f"region='{stack.region}'",
+        # the predefined stack
+        '-c',
+        f"stack='{stack.stack}'",
+        # the payload for the stack with additional parameters
+        '-c',
+        f"target_uri='{stack.targetUri}'",
+        '-c',
+        "data='{}'",
+        # skips synth step when no changes apply
+        '--app',
+        app,
+        *(extra_args or []),
+        '--verbose',
+    ]
+    logger.info(f'Running command : \n {" ".join(cmd)}')
+
+    # This command is too complex to be executed as a list of commands. We need to run it with shell=True
+    # However, the input arguments have to be sanitized with the CommandSanitizer
+
+    return subprocess.run(  # nosemgrep
+        ' '.join(cmd),  # nosemgrep
+        text=True,  # nosemgrep
+        shell=True,  # nosec  # nosemgrep
+        encoding='utf-8',  # nosemgrep
+        env=env,  # nosemgrep
+        cwd=cwd,  # nosemgrep
+    )
+
+
+def deploy_cdk_stack(
+    engine: Engine, stackid: str, app_path: str = None, path: str = None, force: bool = False, synth_pool=None
+):
+    """
+    Deploys the stack with the cdk cli. If a CdkSynthPool is given, the stack is synthesized in its warm
+    worker processes and only the deploy of the synthesized cloud assembly runs in a cdk subprocess.
+    """
     from dataall.base.loader import load_modules, ImportMode
 
     load_modules(modes={ImportMode.CDK_CLI_EXTENSION})
@@ -130,50 +221,40 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
             app_path = app_path or './app.py'
 
             logger.info(f'app_path: {app_path}')
-            input_args = [stack.name, stack.accountid, stack.region, stack.stack, stack.targetUri]
-
-            CommandSanitizer(input_args)
-
-            cmd = [
-                '. ~/.nvm/nvm.sh &&',
-                'cdk',
-                'deploy --all',
-                '--require-approval',
-                ' never',
-                '-c',
-                f"appid='{stack.name}'",
-                # the target accountid
-                '-c',
-                f"account='{stack.accountid}'",
-                # the target region
-                '-c',
-                f"region='{stack.region}'",
-                # the predefined stack
-                '-c',
-                f"stack='{stack.stack}'",
-                # the payload for the stack with additional parameters
-                '-c',
-                f"target_uri='{stack.targetUri}'",
-                '-c',
-                "data='{}'",
-                # skips synth step when no changes apply
-                '--app',
-                f'"{sys.executable} {app_path}"',
-                '--verbose',
-            ]
-            logger.info(f'Running command : \n {" ".join(cmd)}')
-
-            # This command is too complex to be executed as a list of commands. We need to run it with shell=True
-            # However, the input arguments have to be sanitized with the CommandSanitizer
-
-            process = subprocess.run(  # nosemgrep
-                ' '.join(cmd),  # nosemgrep
-                text=True,  # nosemgrep
-                shell=True,  # nosec  # nosemgrep
-                encoding='utf-8',  # nosemgrep
-                env=env,  # nosemgrep
-                cwd=cwd,  # nosemgrep
-            )
+            app = f'"{sys.executable} {app_path}"'
+            timings = {}
+            template_hash = None
+
+            with tempfile.TemporaryDirectory() as assembly_dir:
+                process = None
+                if (FINGERPRINT_MODE or synth_pool) and not extension:
+                    start_time = time.monotonic()
+                    if synth_pool:
+                        process = synth_pool.synth(stack, env, assembly_dir)
+                    if process is None:  # without a pool, or for apps with context lookups
+                        process = _run_cdk(stack, 'synth --all --quiet', app, env, cwd, ['--output', assembly_dir])
+                    timings['synth'] = time.monotonic() - start_time
+
+                    if process.returncode == 0 and FINGERPRINT_MODE:
+                        start_time = time.monotonic()
+                        template_hash = fingerprint_cloud_assembly(assembly_dir)
+                        meta = _find_deployed_stack(stack) if template_hash == stack.templateHash else None
+                        timings['diff'] = time.monotonic() - start_time
+
+                        if meta and meta['StackStatus'] in DEPLOYED_STATUSES and not force:
+                            logger.info(f'Templates of stack {stackid} did not change since last deploy, skipping')
+                            stack.stackid = meta['StackId']
+                            stack.status = meta['StackStatus']
+                            record_deployment_events(stack, timings, template_hash, skipped=True)
+                            return
+                    if process.returncode == 0:
+                        # deploys the synthesized cloud assembly instead of synthesizing the app again
+                        app = assembly_dir
+
+                if process is None or process.returncode == 0:
+                    start_time = time.monotonic()
+                    process = _run_cdk(stack, 'deploy --all', app, env, cwd, ['--require-approval', ' never'])
+                    timings['deploy'] = time.monotonic() - start_time
 
             if extension:
                 _CDK_CLI_WRAPPER_EXTENSIONS[stack.stack].post_deployment()
@@ -182,13 +263,16 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
                     f'There is no CDK deployment extension for {stack.stack}. Proceeding further with the post-deployment'
                 )
 
+            record_deployment_events(stack, timings, template_hash)
             if process.returncode == 0:
                 meta = describe_stack(stack)
                 stack.stackid = meta['StackId']
                 stack.status = meta['StackStatus']
+                stack.templateHash = template_hash
                 update_stack_output(session, stack)
             else:
                 stack.status = 'CREATE_FAILED'
+                stack.templateHash = None
                 logger.error(f'Failed to deploy stack {stackid} due to {str(process.stderr)}')
                 AlarmService().trigger_stack_deployment_failure_alarm(stack=stack)
 
@@ -215,6 +299,14 @@ def describe_stack(stack, engine: Engine = None, stackid: str = None):
         return {'StackId': meta.stack_id, 'StackStatus': meta.stack_status}
 
 
+def _find_deployed_stack(stack):
+    try:
+        return describe_stack(stack)
+    except ClientError as e:
+        logger.info(f'Could not describe the deployed stack {stack.name}, it will be deployed: {e}')
+        return None
+
+
 def cdk_installed():
     cmd1 = ['bash', '~/.nvm/nvm.sh']
     logger.info(f'Running command {" ".join(cmd1)}')
@@ -0,0 +1,106 @@
+# This module synthesizes the pre-defined stacks in a pool of long-lived worker processes.
+# Each worker imports dataall, loads the CDK modules and registers the stacks once, then synthesizes
+# the CDK apps of many deployments in-process to cloud assembly directories.
+# The cdk cli only runs `cdk deploy --app <cloud assembly>`, that does not synthesize the app again.
+# Context lookups (e.g. Vpc.from_lookup) are only resolved by the cdk cli: apps that need them are synthesized
+# again with `cdk synth`.
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List, Optional
+
+logger = logging.getLogger('cdksass')
+
+CDK_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cdk.json')
+
+
+def _initialize_worker():
+    from dataall.base.cdkproxy.stacks import StackManager
+    import dataall.base.cdkproxy.app  # noqa: F401 loads the CDK modules
+
+    StackManager.registered_stacks()
+
+
+def _synthesize(context: dict, env: dict, outdir: str) -> List[str]:
+    """Synthesizes the app to outdir and returns the keys of the context lookups it could not resolve"""
+    from aws_cdk import App
+    from dataall.base.cdkproxy.app import CdkRunner
+
+    with open(CDK_JSON) as f:
+        app_context = json.load(f).get('context', {})
+    with _environ(env):
+        CdkRunner.create(App(outdir=outdir, context={**app_context, **context}))
+    return _missing_context(outdir)
+
+
+@contextmanager
+def _environ(env: dict):
+    """Sets the environment variables of a deployment, and restores the environment of the worker afterwards"""
+    previous = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _missing_context(outdir: str) -> List[str]:
+    with open(os.path.join(outdir, 'manifest.json')) as f:
+        return [missing['key'] for missing in json.load(f).get('missing', [])]
+
+
+class CdkSynthPool:
+    """Process pool that synthesizes CDK apps without starting python and loading dataall for every stack"""
+
+    WORKERS = int(os.getenv('CDKPROXY_SYNTH_WORKERS', 2))
+    # Workers are replaced after some syntheses to release the memory of the CDK apps
+    TASKS_PER_WORKER = int(os.getenv('CDKPROXY_SYNTH_TASKS_PER_WORKER', 50))
+
+    def __init__(self, workers: int = None):
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers or self.WORKERS,
+            # jsii runs a node process per python process, that can not be shared with forked processes
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_initialize_worker,
+            max_tasks_per_child=self.TASKS_PER_WORKER,
+        )
+
+    def synth(self, stack, env: dict, outdir: str) -> Optional[subprocess.CompletedProcess]:
+        """
+        Synthesizes the stack to the outdir cloud assembly, the result has the same fields as a cdk synth run.
+        Returns None, with an empty outdir, if the app needs context lookups: it must be synthesized by the cdk cli
+        """
+        context = {
+            'appid': stack.name,
+            'account': stack.accountid,
+            'region': stack.region,
+            'stack': stack.stack,
+            'target_uri': stack.targetUri,
+            'data': '{}',
+        }
+        args = ['synth', stack.stack, stack.targetUri]
+        try:
+            missing = self._executor.submit(_synthesize, context, env, outdir).result()
+        except Exception as e:
+            logger.exception(f'Failed to synthesize stack {stack.stackUri}')
+            return subprocess.CompletedProcess(args, returncode=1, stderr=str(e))
+        if missing:
+            logger.info(f'Stack {stack.stackUri} needs the context lookups {missing}, it is synthesized by the cdk cli')
+            for name in os.listdir(outdir):
+                path = os.path.join(outdir, name)
+                shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+            return None
+        return subprocess.CompletedProcess(args, returncode=0)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -11,6 +11,7 @@
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import boto3
@@ -18,6 +19,7 @@ from botocore.exceptions import ClientError
 from fastapi import FastAPI, BackgroundTasks, status, Response
 
 import cdk_cli_wrapper as wrapper
+from cdk_synth_pool import CdkSynthPool
 from stacks import StackManager
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.core.stacks.db.stack_models import Stack
@@ -32,6 +34,12 @@ logger.warning(f'Application started for envname= `{ENVNAME}`')
 
 StackManager.registered_stacks()
 
+# Deployments are queued and run at most CDKPROXY_MAX_CONCURRENT_DEPLOYS at a time.
+# With CDKPROXY_WARM_SYNTH=true the stacks are synthesized in long-lived worker processes, see cdk_synth_pool
+MAX_CONCURRENT_DEPLOYS = int(os.getenv('CDKPROXY_MAX_CONCURRENT_DEPLOYS', 4))
+deploy_queue = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DEPLOYS, thread_name_prefix='cdk-deploy')
+synth_pool = CdkSynthPool() if os.getenv('CDKPROXY_WARM_SYNTH', 'false').lower() == 'true' else None
+
 
 def connect():
     logger.info(f'Connecting to database for environment: `{ENVNAME}`')
@@ -47,6 +55,13 @@ def connect():
 app = FastAPI()
 
 
+@app.on_event('shutdown')
+def shutdown():
+    deploy_queue.shutdown(wait=False, cancel_futures=True)
+    if synth_pool:
+        synth_pool.shutdown()
+
+
 @app.get('/', status_code=status.HTTP_200_OK)
 def up(response: Response):
     logger.info('GET /')
@@ -119,8 +134,8 @@ def check_cdk_installed(response: Response):
 
 
 @app.post('/stack/{stackid}', status_code=status.HTTP_202_ACCEPTED)
-async def create_stack(stackid: str, background_tasks: BackgroundTasks, response: Response):
-    """Deploys or updates the stack"""
+async def create_stack(stackid: str, response: Response, force: bool = False):
+    """Deploys or updates the stack, force deploys it even if its templates did not change"""
     logger.info(f'POST /stack/{stackid}')
     try:
         engine = connect()
@@ -146,7 +161,7 @@ async def create_stack(stackid: str, background_tasks: BackgroundTasks, response
             }  # yaml.safe_load(response.stdout)
         stack.status = 'RUNNING'
     logger.info('Adding bg task')
-    background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid)
+    deploy_queue.submit(wrapper.deploy_cdk_stack, engine, stackid, force=force, synth_pool=synth_pool)
     return {
         '_ts': datetime.now().isoformat(),
         'message': f'Starting creation of StackId {stack.stackUri} on Account {stack.accountid} / Region {stack.region}',
@@ -7,8 +7,8 @@ The class uses Flask's approach to handle request: ThreadLocal
 That approach should work fine for AWS Lambdas and local server that uses FastApi app
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from dataall.base.db.connection import Engine
 from threading import local
@@ -25,6 +25,7 @@ class RequestContext:
     username: str
     groups: List[str]
     user_id: str
+    cache: Dict = field(default_factory=dict, compare=False, repr=False)  # storage for request scoped caches
 
 
 def get_context() -> RequestContext:
@@ -32,6 +33,12 @@ def get_context() -> RequestContext:
     return _request_storage.context
 
 
+def find_context() -> Optional[RequestContext]:
+    """Retrieves context associated with a request or None when the code doesn't run in a request scope"""
+    context = getattr(_request_storage, 'context', None)
+    return context if isinstance(context, RequestContext) else None
+
+
 def set_context(context: RequestContext) -> None:
     """Retrieves context associated with a request"""
     _request_storage.context = context
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -62,6 +63,33 @@ class Engine:
                 s.close()
                 self._session = None
 
+    @contextmanager
+    def thread_session(self):
+        """
+        Independent session for worker threads. The session returned by session() is shared by all the
+        scoped_session() blocks of the engine and must not be used by more than one thread
+        """
+        s = sessionmaker(bind=self.engine, autoflush=True, expire_on_commit=False)()
+        try:
+            yield s
+            s.commit()
+        except Exception as e:
+            s.rollback()
+            raise e
+        finally:
+            s.close()
+
+    def fork(self) -> 'Engine':
+        """
+        Engine for a worker thread, that shares the connection pool of this engine but not its session,
+        so that the scoped_session() blocks of the thread run in their own session
+        """
+        engine = copy.copy(self)
+        engine.sessions = {}
+        engine._session = None
+        engine._active_sessions = 0
+        return engine
+
     def dispose(self):
         self.engine.dispose()
 
@@ -106,6 +134,7 @@ def drop_schema_if_exists(engine, envname):
 def get_engine(envname=ENVNAME):
     if envname not in ['local', 'pytest', 'dkrcompose']:
         param_store = Parameter()
+        param_store.prefetch_parameters(env=envname, paths=['aurora/dbcreds', 'aurora/hostname', 'aurora/db'])
         credential_arn = param_store.get_parameter(env=envname, path='aurora/dbcreds')
         creds = json.loads(SecretsManager().get_secret_value(credential_arn))
         user = creds['username']
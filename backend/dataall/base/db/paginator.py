@@ -1,10 +1,20 @@
+import base64
+import json
 import math
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 
-__version__ = '0.0.2'
+from sqlalchemy import and_, false, func, inspect, or_, select
+from sqlalchemy.exc import NoInspectionAvailable
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy.sql import operators
+
+__version__ = '0.0.3'
 
 
 class Page(object):
-    def __init__(self, items, page, page_size, total):
+    def __init__(self, items, page, page_size, total, has_next=None, next_cursor=None):
         self.page_size = page_size
         self.page = page
         self.items = items
@@ -13,12 +23,15 @@ class Page(object):
         self.has_previous = page > 1
         if self.has_previous:
             self.previous_page = page - 1
-        previous_items = (page - 1) * page_size
-        self.has_next = previous_items + len(items) < total
+        if has_next is None:
+            previous_items = (page - 1) * page_size
+            has_next = previous_items + len(items) < total
+        self.has_next = has_next
         if self.has_next:
             self.next_page = page + 1
         self.total = total
-        self.pages = int(math.ceil(total / float(page_size)))
+        self.pages = int(math.ceil(total / float(page_size))) if total is not None else None
+        self.next_cursor = next_cursor
 
     def to_dict(self):
         return {
@@ -31,19 +44,56 @@ class Page(object):
             'hasPrevious': self.has_previous,
             'nextPage': self.next_page,
             'previousPage': self.previous_page,
+            'nextCursor': self.next_cursor,
         }
 
 
-def paginate(query, page, page_size):
+def paginate(query, page, page_size, with_total=True, cursor=None, with_cursor=False):
+    """
+    Returns one page of the query results.
+    :param query: ORM query, ordered as the caller wants the results to be returned
+    :param page: 1-based page number, used for OFFSET pagination
+    :param page_size: max number of items in the page
+    :param with_total: when False the (potentially expensive) count query is skipped and count/pages are None
+    :param cursor: opaque nextCursor returned by a previous page. When set the page is fetched by seeking on
+    the ORDER BY columns (keyset pagination) instead of using OFFSET, which keeps deep pages cheap
+    :param with_cursor: returns the nextCursor of the page, to fetch the next pages with keyset pagination.
+    The ordering of the query is only completed with the primary key (see _keyset_ordering) when a cursor
+    is given or requested, OFFSET pages keep the ordering of the caller
+    """
     if page <= 0:
         raise AttributeError('page needs to be >= 1')
     if page_size <= 0:
         raise AttributeError('page_size needs to be >= 1')
-    items = query.limit(page_size).offset((page - 1) * page_size).all()
-    # count doesn't de-duplicate the rows as described here https://tinyurl.com/3f7d8d5a
-    # nosemgrep: python.sqlalchemy.performance.performance-improvements.len-all-count
-    total = len(query.order_by(None).all())
-    return Page(items, page, page_size, total)
+
+    keys = []
+    if cursor or with_cursor:
+        query, keys = _keyset_ordering(query)
+    if cursor:
+        paged_query = query.filter(_seek_condition(keys, _decode_cursor(cursor, len(keys))))
+    else:
+        paged_query = query.offset((page - 1) * page_size)
+    items = paged_query.limit(page_size + 1).all()
+
+    has_next = len(items) > page_size
+    items = items[:page_size]
+    next_cursor = _encode_cursor(keys, items[-1]) if has_next else None
+    total = count(query) if with_total else None
+    return Page(items, page, page_size, total, has_next=has_next, next_cursor=next_cursor)
+
+
+def count(query):
+    """
+    Counts the results of the query in the database with SELECT count(*) FROM (subquery).
+    Query.all() de-duplicates the rows of single entity queries (see https://tinyurl.com/3f7d8d5a),
+    so for those the distinct primary keys are counted to return the same number of items as Query.all()
+    """
+    query = query.order_by(None)
+    subquery = query.subquery()
+    pk_columns = [subquery.corresponding_column(column) for column in _entity_primary_key(query)]
+    if pk_columns and all(column is not None for column in pk_columns):
+        subquery = select(*pk_columns).distinct().subquery()
+    return query.session.execute(select(func.count()).select_from(subquery)).scalar()
 
 
 def paginate_list(items, page, page_size):
@@ -55,3 +105,132 @@ def paginate_list(items, page, page_size):
     end = start + page_size
     total = len(items)
     return Page(items[start:end], page, page_size, total)
+
+
+def _entity_primary_key(query):
+    descriptions = query.column_descriptions
+    if len(descriptions) != 1 or descriptions[0]['expr'] is not descriptions[0]['entity']:
+        return []
+    return list(inspect(descriptions[0]['entity']).primary_key)
+
+
+def _keyset_ordering(query):
+    """
+    Returns the query and the (column, descending, nulls_first) keys it is ordered by, used to seek the next page.
+    The selected primary key columns are added to the ordering so that the order is deterministic, and the NULL
+    ordering of each column is made explicit, keeping the one of the caller or the default of postgres
+    (NULLS FIRST for DESC columns, NULLS LAST otherwise), so that the seek condition can handle NULL values.
+    Queries that do not select a primary key can not be seeked on and have no keys
+    """
+    keys = []
+    for clause in query._order_by_clauses:
+        descending, nulls_first = False, None
+        while getattr(clause, 'modifier', None) in (
+            operators.desc_op,
+            operators.asc_op,
+            operators.nulls_first_op,
+            operators.nulls_last_op,
+        ):
+            if clause.modifier in (operators.nulls_first_op, operators.nulls_last_op):
+                nulls_first = clause.modifier == operators.nulls_first_op
+            descending = descending or clause.modifier == operators.desc_op
+            clause = clause.element
+        keys.append((clause, descending, descending if nulls_first is None else nulls_first))
+    ordered = {column for column, _, _ in keys}
+    keys.extend((column, False, False) for column in _selected_primary_key(query) if column not in ordered)
+    if not any(getattr(column, 'primary_key', False) for column, _, _ in keys):
+        return query, []
+    query = query.order_by(None).order_by(*[_order_by(*key) for key in keys])
+    return query, keys
+
+
+def _order_by(column, descending, nulls_first):
+    clause = column.desc() if descending else column.asc()
+    return clause.nulls_first() if nulls_first else clause.nulls_last()
+
+
+def _selected_primary_key(query):
+    """Returns the primary key columns of the selected entities and the selected primary key columns"""
+    columns = []
+    for description in query.column_descriptions:
+        expr = description['expr']
+        if expr is description['entity']:
+            columns.extend(inspect(expr).primary_key)
+        elif getattr(getattr(expr, 'expression', expr), 'primary_key', False):
+            columns.append(expr.expression)
+    return columns
+
+
+def _seek_condition(keys, values):
+    """
+    (c1 after v1) OR (c1 = v1 AND c2 after v2) OR ... honouring the direction and the NULL ordering of each column
+    """
+    conditions = []
+    for index, (column, descending, nulls_first) in enumerate(keys):
+        previous = [_equals(key, value) for (key, _, _), value in zip(keys[:index], values[:index])]
+        value = values[index]
+        if value is None:
+            condition = column.is_not(None) if nulls_first else false()
+        else:
+            condition = or_(
+                column < value if descending else column > value, false() if nulls_first else column.is_(None)
+            )
+        conditions.append(and_(*previous, condition))
+    return or_(*conditions)
+
+
+def _equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _key_value(item, column):
+    if hasattr(item, '_mapping'):
+        return item._mapping[column]
+    mapper = inspect(item).mapper
+    return getattr(item, mapper.get_property_by_column(column).key)
+
+
+def _encode_cursor(keys, item):
+    """
+    Returns None when the ordering can't be seeked on, e.g. queries ordered by computed expressions,
+    or ordered by values that can't be serialized in the cursor
+    """
+    if not keys:
+        return None
+    try:
+        values = [_encode_value(_key_value(item, column)) for column, _, _ in keys]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+    except (KeyError, NoInspectionAvailable, UnmappedColumnError, TypeError):
+        return None
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'date': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    if isinstance(value, Enum):  # stored by name or by value depending on the column type
+        raise TypeError(f'Enum {value} can not be used in a cursor')
+    return value
+
+
+_DECODERS = {'datetime': datetime.fromisoformat, 'date': date.fromisoformat, 'decimal': Decimal}
+
+
+def _decode_cursor(cursor, size):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise AttributeError('cursor does not match the query ordering')
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, ArithmeticError, KeyError):
+        raise AttributeError('cursor is not valid')
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    (kind, encoded), *_ = value.items()
+    return _DECODERS[kind](encoded)
@@ -1,7 +1,25 @@
-from .connect import connect
+from .connect import (
+    INDEX_ALIAS,
+    INDEX_VERSION,
+    connect,
+    create_versioned_index,
+    index_metadata,
+    index_version,
+    supports_aliases,
+    swap_alias,
+    update_index_metadata,
+)
 from .search import run_query
 
 __all__ = [
+    'INDEX_ALIAS',
+    'INDEX_VERSION',
     'connect',
+    'create_versioned_index',
+    'index_metadata',
+    'index_version',
     'run_query',
+    'supports_aliases',
+    'swap_alias',
+    'update_index_metadata',
 ]
@@ -1,4 +1,9 @@
+import hashlib
+import json
+import logging
 import os
+from datetime import datetime, timezone
+from typing import Optional
 from urllib.parse import urlparse
 
 import boto3
@@ -7,6 +12,9 @@ from requests_aws4auth import AWS4Auth
 
 from dataall.base import utils
 
+log = logging.getLogger(__name__)
+
+INDEX_ALIAS = 'dataall-index'
 CREATE_INDEX_REQUEST_BODY = {
     'mappings': {
         'properties': {
@@ -44,6 +52,9 @@ CREATE_INDEX_REQUEST_BODY = {
     }
 }
 
+# changes of the mappings change the version, and the catalog indexer rebuilds indices with another version
+INDEX_VERSION = hashlib.sha256(json.dumps(CREATE_INDEX_REQUEST_BODY, sort_keys=True).encode()).hexdigest()[:8]
+
 
 def connect(envname='local'):
     if envname in ['local', 'pytest', 'dkrcompose']:
@@ -56,7 +67,7 @@ def connect(envname='local'):
         token = creds.token
 
         host = utils.Parameter.get_parameter(env=envname, path='elasticsearch/endpoint')
-        service = utils.Parameter.get_parameter(env=envname, path='elasticsearch/service') or 'es'
+        service = _service(envname)
 
         awsauth = AWS4Auth(
             access_key,
@@ -78,9 +89,7 @@ def connect(envname='local'):
         if service != 'aoss':
             print(es.info())
 
-        if not es.indices.exists(index='dataall-index'):
-            es.indices.create(index='dataall-index', body=CREATE_INDEX_REQUEST_BODY)
-            print('Create "dataall-index" for dev env')
+        ensure_index(es, serverless=service == 'aoss')
         return es
 
 
@@ -95,8 +104,7 @@ def connect_dev_environment(envname):
             scheme=url.scheme,
             port='9200',
         )
-        if not es.indices.exists(index='dataall-index'):
-            es.indices.create(index='dataall-index', body=CREATE_INDEX_REQUEST_BODY)
+        ensure_index(es)
         print('Connected to ES', es.info())
         return es
     except Exception as e:
@@ -104,16 +112,83 @@ def connect_dev_environment(envname):
         raise e
 
 
+def _service(envname):
+    return utils.Parameter.get_parameter(env=envname, path='elasticsearch/service') or 'es'
+
+
+def supports_aliases(envname='local') -> bool:
+    """OpenSearch Serverless collections don't support index aliases"""
+    return envname in ['local', 'pytest', 'dkrcompose'] or _service(envname) != 'aoss'
+
+
+def ensure_index(es, alias=INDEX_ALIAS, serverless=False):
+    """Creates the index queried through alias if there is none yet"""
+    if es.indices.exists(index=alias):
+        return
+    if serverless:
+        es.indices.create(index=alias, body=CREATE_INDEX_REQUEST_BODY)
+    else:
+        create_versioned_index(es, alias)
+    print(f'Create "{alias}" index')
+
+
+def create_versioned_index(es, alias=INDEX_ALIAS, bulk_load=False) -> str:
+    """
+    Creates an index with the current mappings and version, named after the alias.
+    With bulk_load the index is not attached to the alias and is created without refresh and replicas,
+    which are restored by swap_alias once it's loaded
+    """
+    index = f'{alias}-{INDEX_VERSION}-{datetime.now(timezone.utc):%Y%m%d%H%M%S}'
+    body = {'mappings': {**CREATE_INDEX_REQUEST_BODY['mappings'], '_meta': {'version': INDEX_VERSION}}}
+    if bulk_load:
+        body['settings'] = {'index': {'refresh_interval': '-1', 'number_of_replicas': 0}}
+    else:
+        body['aliases'] = {alias: {}}
+    es.indices.create(index=index, body=body)
+    return index
+
+
+def index_metadata(es, alias=INDEX_ALIAS) -> dict:
+    """Returns the metadata (_meta of the mappings) of the index behind the alias"""
+    for mappings in es.indices.get_mapping(index=alias).values():
+        return mappings.get('mappings', {}).get('_meta', {})
+    return {}
+
+
+def update_index_metadata(es, alias=INDEX_ALIAS, **values) -> None:
+    """Sets values in the metadata of the index behind the alias, keeping the other values"""
+    es.indices.put_mapping(index=alias, body={'_meta': {**index_metadata(es, alias), **values}})
+
+
+def index_version(es, alias=INDEX_ALIAS) -> Optional[str]:
+    """Returns the version of the index behind the alias, None for indices created before versioning"""
+    return index_metadata(es, alias).get('version')
+
+
+def swap_alias(es, index, alias=INDEX_ALIAS, replicas=None):
+    """
+    Makes the loaded index searchable and atomically moves the alias to it, deleting the indices it pointed to.
+    A legacy index named as the alias is deleted in the same operation
+    """
+    current = list(es.indices.get(index=alias).keys()) if es.indices.exists(index=alias) else []
+    if replicas is None:
+        settings = es.indices.get_settings(index=alias).values() if current else []
+        replicas = max((int(s['settings']['index'].get('number_of_replicas', 1)) for s in settings), default=1)
+
+    es.indices.put_settings(index=index, body={'index': {'refresh_interval': None, 'number_of_replicas': replicas}})
+    es.indices.refresh(index=index)
+    actions = [{'add': {'index': index, 'alias': alias}}]
+    actions += [{'remove_index': {'index': old_index}} for old_index in current]
+    es.indices.update_aliases(body={'actions': actions})
+    log.info(f'Alias {alias} moved to {index}, removed indices {current}')
+
+
 def get_mappings_indice(es, es_index='dataall-index'):
     mappings = es.indices.get_mapping(index=es_index)
-    return mappings.get(es_index)
+    # the index can be an alias, the mappings are returned under the name of the index behind it
+    return next(iter(mappings.values()), None)
 
 
 def get_mappings_properties_indice(es, es_index='dataall-index'):
     mappings = get_mappings_indice(es, es_index)
     return mappings.get('mappings').get('properties').keys()
-
-
-def add_keyword_mapping(es, new_key, es_index='dataall-index'):
-    new_mapping_body = {'properties': {new_key: {'type': 'keyword'}}}
-    es.indices.put_mapping(index=es_index, body=new_mapping_body)
@@ -1,4 +1,47 @@
 import abc
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+
+class GroupEmailsCache:
+    """
+    Process wide TTL cache of the email ids of the members of the groups of the identity providers.
+    Tasks that send many emails resolve each group once per TTL_SECONDS.
+    """
+
+    TTL_SECONDS = int(os.getenv('GROUP_EMAILS_CACHE_TTL_SECONDS', 300))
+
+    def __init__(self):
+        self._emails = {}  # (identity provider, group) -> (email ids, expiry)
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, groups: [str]) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Returns the cached email ids of the groups and the groups that are not cached"""
+        now = time.monotonic()
+        cached, missing = {}, []
+        with self._lock:
+            for group in dict.fromkeys(groups):
+                emails, expiry = self._emails.get((provider, group), (None, 0))
+                if expiry > now:
+                    cached[group] = emails
+                else:
+                    missing.append(group)
+        return cached, missing
+
+    def put(self, provider: str, emails: Dict[str, List[str]]) -> None:
+        expiry = time.monotonic() + self.TTL_SECONDS
+        with self._lock:
+            for group, group_emails in emails.items():
+                self._emails[(provider, group)] = (list(group_emails), expiry)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._emails.clear()
+
+
+group_emails_cache = GroupEmailsCache()
 
 
 class ServiceProvider:
@@ -11,6 +54,20 @@ class ServiceProvider:
     def get_user_emailids_from_group(self, groupName):
         raise NotImplementedError
 
+    """
+    Function to fetch emailids for groups, the groups are resolved with get_user_emailids_from_group
+    and cached in the process for GroupEmailsCache.TTL_SECONDS
+        groups: [str] - Group / Team names present in the user pool service provider
+    """
+
+    def get_emails_for_groups(self, groups: [str]) -> Dict[str, List[str]]:
+        provider = type(self).__name__
+        emails, missing = group_emails_cache.get(provider, groups)
+        resolved = {group: self.get_user_emailids_from_group(group) for group in missing}
+        group_emails_cache.put(provider, resolved)
+        emails.update(resolved)
+        return emails
+
     """
     Abstract function to fetch groups belonging to a user
         user_id: str - user id information needed by the user pool service provider to fetch groups
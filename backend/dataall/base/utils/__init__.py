@@ -1,2 +1,2 @@
-from .parameter import Parameter
+from .parameter import Parameter, parameter_cache
 from .slugify import slugify
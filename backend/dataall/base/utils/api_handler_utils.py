@@ -101,16 +101,17 @@ def attach_tenant_policy_for_groups(groups=None):
     if groups is None:
         groups = []
     with ENGINE.scoped_session() as session:
-        for group in groups:
-            policy = TenantPolicyService.find_tenant_policy(session, group, TenantPolicyService.TENANT_NAME)
-            if not policy:
-                log.info(f'No policy found for Team {group}. Attaching TENANT_ALL permissions')
-                TenantPolicyService.attach_group_tenant_policy(
-                    session=session,
-                    group=group,
-                    permissions=TENANT_ALL,
-                    tenant_name=TenantPolicyService.TENANT_NAME,
-                )
+        # the tenant permissions of the groups are cached, and read with one query when they are not
+        policies = TenantPolicyService.get_groups_tenant_permissions(session, groups, TenantPolicyService.TENANT_NAME)
+        new_groups = [group for group in dict.fromkeys(groups) if group not in policies]
+        if new_groups:
+            log.info(f'No policy found for Teams {new_groups}. Attaching TENANT_ALL permissions')
+            TenantPolicyService.attach_groups_tenant_policy(
+                session=session,
+                groups=new_groups,
+                permissions=TENANT_ALL,
+                tenant_name=TenantPolicyService.TENANT_NAME,
+            )
 
 
 def check_reauth(query, auth_time, username):
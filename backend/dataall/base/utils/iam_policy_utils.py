@@ -1,4 +1,5 @@
-from typing import List, Callable, Dict
+import json
+from typing import List, Callable, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -6,6 +7,14 @@ logger = logging.getLogger(__name__)
 POLICY_LIMIT = 6144
 POLICY_HEADERS_BUFFER = 144  # The policy headers take around 60 chars. An extra buffer of 84 chars is added for any additional spacing or char that is unaccounted.
 MAXIMUM_NUMBER_MANAGED_POLICIES = 20  # Soft limit 10, hard limit 20
+POLICY_VERSION = '2012-10-17'
+
+
+def policy_size(value) -> int:
+    """
+    Size of a policy, statement or policy element as counted by IAM, i.e. the length of its JSON without whitespaces
+    """
+    return len(json.dumps(value, separators=(',', ':')))
 
 
 def split_policy_statements_in_chunks(statements: List[Dict]):
@@ -13,37 +22,144 @@ def split_policy_statements_in_chunks(statements: List[Dict]):
     Splitter used for IAM policies with an undefined number of statements
     - Ensures that the size of the IAM policy remains below the POLICY LIMIT
     - If it exceeds the POLICY LIMIT, it breaks the policy into multiple policies (chunks)
-    - Note the POLICY_HEADERS_BUFFER to account for the headers of the policy which usually take around ~60chars
+    - Statements are packed first-fit-decreasing on their JSON size, so that the number of chunks is kept to a minimum
+    - Note the POLICY_HEADERS_BUFFER kept as headroom for values that are only resolved at deployment time
     """
-    chunks = []
-    index = 0
-    statements_list_of_strings = [str(s) for s in statements]
-    total_length = len(', '.join(statements_list_of_strings))
+    statement_sizes = [policy_size(s) for s in statements]
     logger.info(f'Number of statements = {len(statements)}')
-    logger.info(f'Total length of statements = {total_length}')
-    max_length = max(statements_list_of_strings, key=len)
-    if len(max_length) > POLICY_LIMIT - POLICY_HEADERS_BUFFER:
-        raise Exception(f'Policy statement {max_length} exceeds maximum policy size')
-    while index < len(statements):
-        #  Iterating until all statements are assigned to a chunk.
-        #  "index" represents the statement position in the statements list
-        chunk = []
-        chunk_size = 0
-        while (
-            index < len(statements) and chunk_size + len(str(statements[index])) < POLICY_LIMIT - POLICY_HEADERS_BUFFER
-        ):
-            #  Appends a statement to the chunk until we reach its maximum size.
-            #  It compares, current size of the statements < allowed size for the statements section of a policy
-            chunk.append(statements[index])
-            chunk_size += len(str(statements[index]))
-            index += 1
-        chunks.append(chunk)
+    logger.info(f'Total length of statements = {sum(statement_sizes) + max(len(statements) - 1, 0)}')
+    max_size = POLICY_LIMIT - POLICY_HEADERS_BUFFER
+    for statement, size in zip(statements, statement_sizes):
+        if size > max_size:
+            raise Exception(f'Policy statement {statement} exceeds maximum policy size')
+
+    chunks: List[List[Dict]] = []
+    chunk_sizes: List[int] = []
+    for index in sorted(range(len(statements)), key=lambda i: -statement_sizes[i]):
+        #  Each statement goes to the first chunk with enough space left, statements are separated by a comma
+        size = statement_sizes[index]
+        position = next((i for i, chunk_size in enumerate(chunk_sizes) if chunk_size + size + 1 <= max_size), None)
+        if position is None:
+            chunks.append([statements[index]])
+            chunk_sizes.append(size)
+        else:
+            chunks[position].append(statements[index])
+            chunk_sizes[position] += size + 1
+    logger.info(f'Total number of managed policies = {len(chunks)}')
+    if len(chunks) > MAXIMUM_NUMBER_MANAGED_POLICIES:
+        raise Exception('The number of policies calculated exceeds the allowed maximum number of managed policies')
+    return chunks
+
+
+def pack_resource_statements_in_chunks(
+    statements: List[Dict], current_chunks: Optional[List[List[Dict]]] = None
+) -> List[List[Dict]]:
+    """
+    Packs statements that only differ by their resources into the statements of as few policies (chunks) as possible.
+    - Statements with the same Sid, Effect and Action are merged, the Sid of the statement in the n-th chunk is Sid + n
+    - The size of every chunk, headers included, is the exact size counted by IAM and remains below the POLICY LIMIT
+    - Resources are placed first-fit-decreasing: groups with the most bytes first, each resource in the first chunk
+      with enough space left (a statement can be spread over several chunks)
+    - If current_chunks (the statements of the existing policies) is given, resources that are still needed stay in
+      the chunk they are in, so that only the chunks gaining or losing resources change. The current placement is
+      discarded if it needs more chunks than packing from scratch
+    """
+    groups: Dict[tuple, Dict] = {}
+    for statement in statements:
+        key = (statement['Sid'], statement['Effect'], json.dumps(statement['Action']))
+        group = groups.setdefault(
+            key, {'Sid': statement['Sid'], 'Effect': statement['Effect'], 'Action': statement['Action'], 'Resource': []}
+        )
+        for resource in _to_list(statement.get('Resource')):
+            if resource not in group['Resource']:
+                group['Resource'].append(resource)
+
+    chunks = _pack_resources(list(groups.values()), current_chunks or [])
+    if current_chunks:
+        fresh_chunks = _pack_resources(list(groups.values()), [])
+        if len(fresh_chunks) < len(chunks):
+            logger.info(f'Repacking {len(chunks)} chunks into {len(fresh_chunks)} chunks')
+            chunks = fresh_chunks
     logger.info(f'Total number of managed policies = {len(chunks)}')
     if len(chunks) > MAXIMUM_NUMBER_MANAGED_POLICIES:
         raise Exception('The number of policies calculated exceeds the allowed maximum number of managed policies')
     return chunks
 
 
+def _pack_resources(groups: List[Dict], current_chunks: List[List[Dict]]) -> List[List[Dict]]:
+    def _statement(group, index, resources):
+        return {
+            'Sid': f'{group["Sid"]}{index + 1}',
+            'Effect': group['Effect'],
+            'Action': group['Action'],
+            'Resource': resources,
+        }
+
+    def _group_of(statement):
+        for position, group in enumerate(groups):
+            suffix = statement.get('Sid', '')[len(group['Sid']) :]
+            if statement.get('Sid', '').startswith(group['Sid']) and suffix.isdigit():
+                return position
+        return None
+
+    # placement[i][g] are the resources of group g in chunk i
+    placement: List[Dict[int, List[str]]] = []
+    placed = set()
+    for current_chunk in current_chunks:
+        chunk = {}
+        for statement in current_chunk:
+            position = _group_of(statement)
+            if position is None:
+                continue
+            for resource in _to_list(statement.get('Resource')):
+                if resource in groups[position]['Resource'] and (position, resource) not in placed:
+                    chunk.setdefault(position, []).append(resource)
+                    placed.add((position, resource))
+        if chunk:
+            placement.append(chunk)
+
+    def _chunk_size(index):
+        chunk = placement[index]
+        statements = [_statement(groups[position], index, chunk[position]) for position in sorted(chunk)]
+        return policy_size({'Version': POLICY_VERSION, 'Statement': statements})
+
+    sizes = [_chunk_size(index) for index in range(len(placement))]
+    remaining = {
+        position: [r for r in group['Resource'] if (position, r) not in placed] for position, group in enumerate(groups)
+    }
+    for position in sorted(remaining, key=lambda p: -sum(policy_size(r) for r in remaining[p])):
+        group = groups[position]
+        for resource in remaining[position]:
+            for index in range(len(placement) + 1):
+                if index == len(placement):
+                    placement.append({})
+                    sizes.append(policy_size({'Version': POLICY_VERSION, 'Statement': []}))
+                chunk = placement[index]
+                if position in chunk:
+                    added = policy_size(resource) + 1
+                else:
+                    added = policy_size(_statement(group, index, [resource])) + (1 if chunk else 0)
+                if sizes[index] + added <= POLICY_LIMIT:
+                    chunk.setdefault(position, []).append(resource)
+                    sizes[index] += added
+                    break
+                if not chunk:
+                    raise Exception(f'Policy statement for resource {resource} exceeds maximum policy size')
+
+    return [
+        [_statement(groups[position], index, chunk[position]) for position in sorted(chunk)]
+        for index, chunk in enumerate(placement)
+    ]
+
+
+def _to_list(item) -> List:
+    if item is None:
+        return []
+    if isinstance(item, str):
+        return [item]
+    return list(item)
+
+
 def split_policy_with_resources_in_statements(base_sid: str, effect: str, actions: List[str], resources: List[str]):
     """
     The variable part of the policy is in the resources parameter of the PolicyStatement
@@ -1,6 +1,9 @@
 import json
 import logging
 import os
+import threading
+import time
+from typing import List, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
@@ -8,13 +11,70 @@ from botocore.exceptions import ClientError
 log = logging.getLogger(__name__)
 
 
+class ParameterCache:
+    """
+    Process wide TTL cache of SSM parameter values.
+    Missing parameters are cached as None (negative caching) for a shorter time.
+    The TTL can be configured per parameter name prefix, the longest matching prefix wins.
+    """
+
+    DEFAULT_TTL = int(os.getenv('PARAMETER_CACHE_TTL_SECONDS', 300))
+    NOT_FOUND_TTL = int(os.getenv('PARAMETER_CACHE_NOT_FOUND_TTL_SECONDS', 60))
+
+    def __init__(self):
+        self._values = {}  # (region, name) -> (value, expiry)
+        self._ttls = {}  # name prefix -> ttl in seconds
+        self._lock = threading.Lock()
+
+    def set_ttl(self, name_prefix: str, ttl: int) -> None:
+        with self._lock:
+            self._ttls[name_prefix] = ttl
+
+    def get(self, region: str, name: str) -> Tuple[bool, Optional[str]]:
+        """Returns (True, value) if the parameter is cached, value is None for parameters known to be missing"""
+        with self._lock:
+            cached = self._values.get((region, name))
+            if cached is None:
+                return False, None
+            value, expiry = cached
+            if expiry <= time.monotonic():
+                del self._values[(region, name)]
+                return False, None
+            return True, value
+
+    def put(self, region: str, name: str, value: Optional[str]) -> None:
+        ttl = self._ttl(name) if value is not None else min(self._ttl(name), self.NOT_FOUND_TTL)
+        with self._lock:
+            self._values[(region, name)] = (value, time.monotonic() + ttl)
+
+    def invalidate(self, name_prefix: str = None) -> None:
+        """Drops the cached parameters starting with name_prefix, or all of them"""
+        with self._lock:
+            for key in [key for key in self._values if name_prefix is None or key[1].startswith(name_prefix)]:
+                del self._values[key]
+
+    def _ttl(self, name: str) -> int:
+        with self._lock:
+            prefixes = [prefix for prefix in self._ttls if name.startswith(prefix)]
+            return self._ttls[max(prefixes, key=len)] if prefixes else self.DEFAULT_TTL
+
+
+parameter_cache = ParameterCache()
+
+
 class Parameter:
     prefix = 'dataall'
+    _client = None
+
+    @classmethod
+    def region(cls):
+        return os.getenv('AWS_REGION', 'eu-west-1')
 
     @classmethod
     def ssm(cls):
-        client = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-        return client
+        if cls._client is None:  # boto3 clients are thread safe and can be reused
+            cls._client = boto3.client('ssm', region_name=cls.region())
+        return cls._client
 
     @classmethod
     def get_parameter_name(cls, env, path=''):
@@ -34,22 +94,54 @@ class Parameter:
             Type='String',
             Overwrite=True,
         )
+        parameter_cache.invalidate(pname)
         return Parameter.get_parameter(env, path)
 
     @classmethod
     def get_parameter(cls, env, path=''):
         pname = cls.get_parameter_name(env, path)
+        cached, value = parameter_cache.get(cls.region(), pname)
+        if cached:
+            return value
         ssm = cls.ssm()
         try:
             param_value = ssm.get_parameter(Name=pname)
-            return param_value['Parameter']['Value']
+            value = param_value['Parameter']['Value']
         except ClientError as e:
             if e.response['Error']['Code'] == 'ParameterNotFound':
                 log.warning('Parameter `{}` not found for env `{}`, defaulting to None'.format(path, env))
-                return None
+                value = None
             else:
                 log.error('Error trying to retrieve parameter from SSM')
                 raise e
+        parameter_cache.put(cls.region(), pname, value)
+        return value
+
+    @classmethod
+    def prefetch_parameters(cls, env, paths: List[str]) -> None:
+        """Loads the parameters in the cache with batched get_parameters calls (10 names per call)"""
+        names = [cls.get_parameter_name(env, path) for path in paths]
+        ssm = cls.ssm()
+        for i in range(0, len(names), 10):
+            response = ssm.get_parameters(Names=names[i : i + 10])
+            for parameter in response['Parameters']:
+                parameter_cache.put(cls.region(), parameter['Name'], parameter['Value'])
+            for name in response.get('InvalidParameters', []):
+                parameter_cache.put(cls.region(), name, None)
+
+    @classmethod
+    def prefetch_parameters_by_path(cls, env, prefix='') -> None:
+        """Loads all the parameters under the path in the cache"""
+        pname = cls.get_parameter_name(env, prefix)
+        paginator = cls.ssm().get_paginator('get_parameters_by_path')
+        for page in paginator.paginate(Path=pname, Recursive=True):
+            for parameter in page['Parameters']:
+                parameter_cache.put(cls.region(), parameter['Name'], parameter['Value'])
+
+    @classmethod
+    def invalidate_cache(cls, env=None, path=''):
+        """Drops the cached parameters of the env under the path, or all cached parameters when env is None"""
+        parameter_cache.invalidate(cls.get_parameter_name(env, path) if env else None)
 
     @classmethod
     def clean_environment(cls, env):
@@ -57,6 +149,7 @@ class Parameter:
         for p in params[env]:
             pname = Parameter.get_parameter_name(env=env, path=p['Name'])
             cls.ssm().delete_parameter(Name=pname)
+        cls.invalidate_cache(env)
 
     @classmethod
     def get_parameters(cls, env, prefix=None):
@@ -2,6 +2,8 @@ import logging
 import os
 import sys
 import time
+from collections import Counter
+from typing import List, Tuple
 
 from dataall.base.loader import ImportMode, load_modules
 from dataall.core.environment.db.environment_models import Environment
@@ -19,6 +21,72 @@ RETRIES = 30
 SLEEP_TIME = 30
 
 
+class StackUpdateScheduler:
+    """
+    Updates stacks in waves: a wave starts once the cdkproxy tasks of the previous wave are complete.
+    Within a wave, up to MAX_CONCURRENCY tasks run at the same time, with at most MAX_PER_ACCOUNT tasks
+    per AWS account, and the completion of all the running tasks is checked with a single poll of the cluster.
+    """
+
+    MAX_CONCURRENCY = int(os.getenv('STACK_UPDATER_MAX_CONCURRENCY', 20))
+    MAX_PER_ACCOUNT = int(os.getenv('STACK_UPDATER_MAX_PER_ACCOUNT', 5))
+    POLL_INTERVAL_SECONDS = SLEEP_TIME
+    TASK_TIMEOUT_SECONDS = RETRIES * SLEEP_TIME
+
+    def __init__(self, session, envname):
+        self.session = session
+        self.envname = envname
+        self.cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+
+    def run(self, waves: List[List[Tuple[str, str]]]):
+        """Updates the stacks of the waves, given as lists of (target URI, AWS account)"""
+        for wave in waves:
+            self._run_wave(wave)
+
+    def _run_wave(self, targets: List[Tuple[str, str]]):
+        started_by = set(Ecs.list_running_tasks(self.cluster_name).values())
+        pending = list(targets)
+        in_flight = {}  # task ARN -> (target URI, AWS account, start time)
+        while pending or in_flight:
+            pending = self._launch(pending, in_flight, started_by)
+            if not in_flight:
+                break
+            time.sleep(self.POLL_INTERVAL_SECONDS)
+            running_tasks = Ecs.list_running_tasks(self.cluster_name)
+            for task_arn, (target_uri, _, start_time) in list(in_flight.items()):
+                if task_arn not in running_tasks:
+                    log.info(f'Update for {target_uri} COMPLETE')
+                    in_flight.pop(task_arn)
+                elif time.monotonic() - start_time > self.TASK_TIMEOUT_SECONDS:
+                    log.info(f'Update for {target_uri} is not complete after {self.TASK_TIMEOUT_SECONDS} seconds')
+                    in_flight.pop(task_arn)
+            log.info(f'{len(in_flight)} stack updates running, {len(pending)} waiting...')
+
+    def _launch(self, pending, in_flight, started_by) -> List[Tuple[str, str]]:
+        """Starts the updates that fit in the concurrency limits and returns the ones that have to wait"""
+        per_account = Counter(account for _, account, _ in in_flight.values())
+        waiting = []
+        for target_uri, account in pending:
+            if len(in_flight) >= self.MAX_CONCURRENCY or per_account[account] >= self.MAX_PER_ACCOUNT:
+                waiting.append((target_uri, account))
+                continue
+            try:
+                task_arn = update_stack(
+                    session=self.session,
+                    envname=self.envname,
+                    target_uri=target_uri,
+                    cluster_name=self.cluster_name,
+                    running_tasks_started_by=started_by,
+                )
+            except Exception as e:
+                log.exception(f'Failed to start the update of {target_uri} due to: {e}')
+                continue
+            if task_arn:
+                in_flight[task_arn] = (target_uri, account, time.monotonic())
+                per_account[account] += 1
+        return waiting
+
+
 def update_stacks(engine, envname):
     with engine.scoped_session() as session:
         all_environments: [Environment] = EnvironmentService.list_all_active_environments(session)
@@ -26,25 +94,45 @@ def update_stacks(engine, envname):
         for finder in StackFinder.all():
             additional_stacks.extend(finder.find_stack_uris(session))
 
-        log.info(f'Found {len(all_environments)} environments, triggering update stack tasks...')
-        environment: Environment
-        for environment in all_environments:
-            update_stack(session=session, envname=envname, target_uri=environment.environmentUri, wait=True)
+        log.info(
+            f'Found {len(all_environments)} environments and {len(additional_stacks)} other stacks, '
+            f'triggering update stack tasks...'
+        )
+        # Environment stacks are updated first, the stacks of datasets, pipelines... depend on them
+        environment_targets = [
+            (environment.environmentUri, environment.AwsAccountId) for environment in all_environments
+        ]
+        accounts = StackRepository.list_stack_accounts_by_target_uris(session, additional_stacks)
+        other_targets = []
+        for target_uri in additional_stacks:
+            if target_uri not in accounts:
+                log.warning(f'No stack found for {target_uri}, its update is skipped')
+                continue
+            other_targets.append((target_uri, accounts[target_uri]))
 
-        for stack_uri in additional_stacks:
-            update_stack(session=session, envname=envname, target_uri=stack_uri, wait=False)
+        StackUpdateScheduler(session, envname).run([environment_targets, other_targets])
 
         return len(all_environments), len(additional_stacks)
 
 
-def update_stack(session, envname, target_uri, wait=False):
+def update_stack(session, envname, target_uri, wait=False, cluster_name=None, running_tasks_started_by=None):
+    """
+    Starts the cdkproxy task that updates the stack of the target, unless an update of the stack is already running.
+    Returns the ARN of the task, or None if it was not started.
+    running_tasks_started_by is the startedBy of the running tasks of the cluster, when it is already known.
+    """
     stack = StackRepository.get_stack_by_target_uri(session, target_uri=target_uri)
-    cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
-    if not Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
+    cluster_name = cluster_name or Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+    started_by = f'awsworker-{stack.stackUri}'
+    if running_tasks_started_by is not None:
+        is_running = started_by in running_tasks_started_by
+    else:
+        is_running = Ecs.is_task_running(cluster_name=cluster_name, started_by=started_by)
+    if not is_running:
         stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
         if wait:
             retries = 1
-            while Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
+            while Ecs.is_task_running(cluster_name=cluster_name, started_by=started_by):
                 log.info(
                     f'Update for {stack.name}//{stack.stackUri} is not complete, waiting for {SLEEP_TIME} seconds...'
                 )
@@ -56,8 +144,10 @@ def update_stack(session, envname, target_uri, wait=False):
             log.info(
                 f'Update for {stack.name}//{stack.stackUri} COMPLETE or maximum number of retries exceeded ({RETRIES} retries)'
             )
+        return stack.EcsTaskArn
     else:
         log.info(f'Stack update is already running... Skipping stack {stack.name}//{stack.stackUri}')
+        return None
 
 
 if __name__ == '__main__':
@@ -40,6 +40,81 @@ class ResourcePolicyRepository:
         else:
             return policy
 
+    @staticmethod
+    def find_user_resources_permissions(session, groups: [str], resource_uris: [str]) -> List:
+        """Returns (ResourcePolicy, permission name) rows for all the permissions the groups have on the resources"""
+        return (
+            session.query(ResourcePolicy, Permission.name)
+            .join(
+                ResourcePolicyPermission,
+                ResourcePolicy.sid == ResourcePolicyPermission.sid,
+            )
+            .join(
+                Permission,
+                Permission.permissionUri == ResourcePolicyPermission.permissionUri,
+            )
+            .filter(
+                and_(
+                    ResourcePolicy.principalId.in_(groups),
+                    ResourcePolicy.principalType == 'GROUP',
+                    ResourcePolicy.resourceUri.in_(resource_uris),
+                )
+            )
+            .all()
+        )
+
+    @staticmethod
+    def find_user_authorized_resource_uris(
+        session, groups: [str], resource_uris: [str], permission_name: str
+    ) -> List[str]:
+        """Returns the subset of resource_uris on which any of the groups has the permission"""
+        rows = (
+            session.query(ResourcePolicy.resourceUri)
+            .join(
+                ResourcePolicyPermission,
+                ResourcePolicy.sid == ResourcePolicyPermission.sid,
+            )
+            .join(
+                Permission,
+                Permission.permissionUri == ResourcePolicyPermission.permissionUri,
+            )
+            .filter(
+                and_(
+                    ResourcePolicy.principalId.in_(groups),
+                    ResourcePolicy.principalType == 'GROUP',
+                    Permission.name == permission_name,
+                    ResourcePolicy.resourceUri.in_(resource_uris),
+                )
+            )
+            .distinct()
+            .all()
+        )
+        return [row.resourceUri for row in rows]
+
+    @staticmethod
+    def query_group_effective_permissions(session, group_uri: str, resource_type: str = None):
+        """Query of (resourceUri, resourceType, permission name) rows of all the permissions granted to the group"""
+        query = (
+            session.query(ResourcePolicy.resourceUri, ResourcePolicy.resourceType, Permission.name)
+            .join(
+                ResourcePolicyPermission,
+                ResourcePolicy.sid == ResourcePolicyPermission.sid,
+            )
+            .join(
+                Permission,
+                Permission.permissionUri == ResourcePolicyPermission.permissionUri,
+            )
+            .filter(
+                and_(
+                    ResourcePolicy.principalId == group_uri,
+                    ResourcePolicy.principalType == 'GROUP',
+                )
+            )
+        )
+        if resource_type is not None:
+            query = query.filter(ResourcePolicy.resourceType == resource_type)
+        return query
+
     @staticmethod
     def has_group_resource_permission(
         session, group_uri: str, resource_uri: str, permission_name: str
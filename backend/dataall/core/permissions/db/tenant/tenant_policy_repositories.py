@@ -1,4 +1,5 @@
 import logging
+from typing import Dict, Set
 
 from sqlalchemy.sql import and_
 
@@ -68,6 +69,27 @@ class TenantPolicyRepository:
         else:
             return tenant_policy
 
+    @staticmethod
+    def list_groups_tenant_permissions(session, groups: [str], tenant_name: str) -> Dict[str, Set[str]]:
+        """Returns the names of the tenant permissions of the groups that have a tenant policy"""
+        rows = (
+            session.query(TenantPolicy.principalId, Permission.name)
+            .join(Tenant, Tenant.tenantUri == TenantPolicy.tenantUri)
+            .outerjoin(TenantPolicyPermission, TenantPolicy.sid == TenantPolicyPermission.sid)
+            .outerjoin(Permission, Permission.permissionUri == TenantPolicyPermission.permissionUri)
+            .filter(
+                TenantPolicy.principalId.in_(groups),
+                Tenant.name == tenant_name,
+            )
+            .all()
+        )
+        permissions = {}
+        for group, permission_name in rows:
+            permissions.setdefault(group, set())
+            if permission_name:
+                permissions[group].add(permission_name)
+        return permissions
+
     @staticmethod
     def find_tenant_policy(session, group_uri: str, tenant_name: str):
         tenant_policy = (
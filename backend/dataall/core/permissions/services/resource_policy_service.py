@@ -3,8 +3,8 @@ from dataall.core.permissions.db.resource_policy.resource_policy_repositories im
 from dataall.base.db import exceptions
 from dataall.core.permissions.db.resource_policy.resource_policy_models import ResourcePolicy, ResourcePolicyPermission
 from dataall.core.permissions.services.permission_service import PermissionService
-from typing import Protocol, Callable, List
-from dataall.base.context import get_context
+from typing import Protocol, Callable, Dict, List, Optional, Set
+from dataall.base.context import get_context, find_context
 from functools import wraps
 
 import logging
@@ -59,17 +59,67 @@ class ResourcePolicyRequestValidationService:
             raise exceptions.RequiredParameter(param_name='resource_type')
 
 
+class ResourcePermissionCache:
+    """
+    Request scoped cache of the resource permissions granted to groups.
+    All permissions of a resource are loaded at once, so the following checks on the same resource
+    (e.g. the field resolvers of the same object) don't query the database again.
+    """
+
+    _CACHE_KEY = 'resource_permissions'
+
+    def __init__(self):
+        self._granted = {}  # (groups, resource_uri) -> {permission_name: ResourcePolicy}
+
+    @staticmethod
+    def get() -> Optional['ResourcePermissionCache']:
+        """Returns the cache of the current request or None if the code doesn't run in a request scope"""
+        context = find_context()
+        if not context:
+            return None
+        return context.cache.setdefault(ResourcePermissionCache._CACHE_KEY, ResourcePermissionCache())
+
+    def prefetch(self, session, groups: [str], resource_uris: [str]) -> None:
+        groups_key = frozenset(groups)
+        missing = list({uri for uri in resource_uris if (groups_key, uri) not in self._granted})
+        if not missing:
+            return
+        for uri in missing:
+            self._granted[(groups_key, uri)] = {}
+        for policy, permission_name in ResourcePolicyRepository.find_user_resources_permissions(
+            session, groups=list(groups_key), resource_uris=missing
+        ):
+            self._granted[(groups_key, policy.resourceUri)].setdefault(permission_name, policy)
+
+    def find_resource_policy(self, session, groups: [str], resource_uri: str, permission_name: str):
+        self.prefetch(session, groups, [resource_uri])
+        return self._granted[(frozenset(groups), resource_uri)].get(permission_name)
+
+    def filter_authorized(self, session, groups: [str], resource_uris: [str], permission_name: str) -> Set[str]:
+        self.prefetch(session, groups, resource_uris)
+        groups_key = frozenset(groups)
+        return {uri for uri in resource_uris if permission_name in self._granted[(groups_key, uri)]}
+
+    def invalidate(self, resource_uri: str) -> None:
+        for key in [key for key in self._granted if key[1] == resource_uri]:
+            del self._granted[key]
+
+
 class ResourcePolicyService:
     @staticmethod
     def check_user_resource_permission(session, username: str, groups: [str], resource_uri: str, permission_name: str):
         resource_policy = None
         if username and permission_name and resource_uri:
-            resource_policy = ResourcePolicyRepository.has_user_resource_permission(
-                session=session,
-                groups=groups,
-                permission_name=permission_name,
-                resource_uri=resource_uri,
-            )
+            cache = ResourcePermissionCache.get()
+            if cache:
+                resource_policy = cache.find_resource_policy(session, groups, resource_uri, permission_name)
+            else:
+                resource_policy = ResourcePolicyRepository.has_user_resource_permission(
+                    session=session,
+                    groups=groups,
+                    permission_name=permission_name,
+                    resource_uri=resource_uri,
+                )
 
         if not resource_policy:
             raise exceptions.ResourceUnauthorized(
@@ -80,6 +130,54 @@ class ResourcePolicyService:
         else:
             return resource_policy
 
+    @staticmethod
+    def prefetch_user_resource_permissions(session, groups: [str], resource_uris: [str]) -> None:
+        """
+        Loads in one query the permissions the groups have on a batch of resources, so the following
+        permission checks on these resources in the same request are answered from the request cache
+        """
+        cache = ResourcePermissionCache.get()
+        if cache and resource_uris:
+            cache.prefetch(session, groups, resource_uris)
+
+    @staticmethod
+    def filter_authorized(session, groups: [str], resource_uris: [str], permission_name: str) -> List[str]:
+        """
+        Returns the resource_uris (in the same order) on which any of the groups has the permission.
+        It answers for the whole batch in one query instead of checking the resources one by one.
+        """
+        resource_uris = list(resource_uris)
+        if not resource_uris or not groups or not permission_name:
+            return []
+        cache = ResourcePermissionCache.get()
+        if cache:
+            authorized = cache.filter_authorized(session, groups, resource_uris, permission_name)
+        else:
+            authorized = set(
+                ResourcePolicyRepository.find_user_authorized_resource_uris(
+                    session, groups=groups, resource_uris=resource_uris, permission_name=permission_name
+                )
+            )
+        return [uri for uri in resource_uris if uri in authorized]
+
+    @staticmethod
+    def get_group_effective_permissions(session, group_uri: str, resource_type: str = None) -> Dict[str, Set[str]]:
+        """Returns the permissions granted to the group on every resource, as {resource_uri: {permission names}}"""
+        if not group_uri:
+            raise exceptions.RequiredParameter(param_name='group_uri')
+        effective_permissions = {}
+        for resource_uri, _, permission_name in ResourcePolicyRepository.query_group_effective_permissions(
+            session, group_uri=group_uri, resource_type=resource_type
+        ):
+            effective_permissions.setdefault(resource_uri, set()).add(permission_name)
+        return effective_permissions
+
+    @staticmethod
+    def _invalidate_cached_permissions(resource_uri: str) -> None:
+        cache = ResourcePermissionCache.get()
+        if cache:
+            cache.invalidate(resource_uri)
+
     @staticmethod
     def find_resource_policies(session, group, resource_uri, resource_type, permissions: List[str] = None):
         """
@@ -114,6 +212,7 @@ class ResourcePolicyService:
         :return:
         """
         policies = ResourcePolicyService.find_resource_policies(session, group, resource_uri, resource_type)
+        ResourcePolicyService._invalidate_cached_permissions(resource_uri)
         try:
             for policy in policies:
                 for permission in policy.permissions:
@@ -156,6 +255,7 @@ class ResourcePolicyService:
             group, permissions, resource_uri, resource_type
         )
 
+        ResourcePolicyService._invalidate_cached_permissions(resource_uri)
         policy = ResourcePolicyService.save_resource_policy(session, group, resource_uri, resource_type)
 
         ResourcePolicyService.add_permission_to_resource_policy(session, group, permissions, resource_uri, policy)
@@ -202,6 +302,7 @@ class ResourcePolicyService:
             raise exceptions.RequiredParameter(param_name='policy')
         if not permission:
             raise exceptions.RequiredParameter(param_name='permission')
+        ResourcePolicyService._invalidate_cached_permissions(policy.resourceUri)
         policy_permission = ResourcePolicyPermission(
             sid=policy.sid,
             permissionUri=PermissionService.get_permission_by_name(
@@ -13,7 +13,14 @@ from dataall.base.aws.sts import SessionHelper
 from dataall.base.aws.parameter_store import ParameterStoreManager
 import logging
 import os
+import threading
+import time
 from functools import wraps
+from typing import Dict, FrozenSet, List, Tuple
+
+from sqlalchemy import insert
+
+from dataall.base.db import utils
 
 
 log = logging.getLogger('Permissions')
@@ -22,6 +29,48 @@ ENVNAME = os.getenv('envname', 'local')
 REGION = os.getenv('AWS_REGION', 'eu-west-1')
 
 
+class TenantPermissionCache:
+    """
+    Process wide TTL cache of the tenant permissions of groups, used by the tenant permission checks of the API.
+    Changes made through TenantPolicyService invalidate the groups they touch in this process,
+    other processes see them after TTL_SECONDS.
+    """
+
+    TTL_SECONDS = int(os.getenv('TENANT_PERMISSION_CACHE_TTL_SECONDS', 60))
+
+    def __init__(self):
+        self._permissions = {}  # (tenant name, group) -> (permission names, expiry)
+        self._lock = threading.Lock()
+
+    def get(self, tenant_name: str, groups: [str]) -> Tuple[Dict[str, FrozenSet[str]], List[str]]:
+        """Returns the cached permissions of the groups and the groups that are not cached"""
+        now = time.monotonic()
+        cached, missing = {}, []
+        with self._lock:
+            for group in dict.fromkeys(groups):
+                permissions, expiry = self._permissions.get((tenant_name, group), (None, 0))
+                if expiry > now:
+                    cached[group] = permissions
+                else:
+                    missing.append(group)
+        return cached, missing
+
+    def put(self, tenant_name: str, permissions: Dict[str, FrozenSet[str]]) -> None:
+        expiry = time.monotonic() + self.TTL_SECONDS
+        with self._lock:
+            for group, names in permissions.items():
+                self._permissions[(tenant_name, group)] = (names, expiry)
+
+    def invalidate(self, group: str = None) -> None:
+        """Drops the cached permissions of the group, or of all the groups"""
+        with self._lock:
+            for key in [key for key in self._permissions if group is None or key[1] == group]:
+                del self._permissions[key]
+
+
+tenant_permission_cache = TenantPermissionCache()
+
+
 class RequestValidationService:
     @staticmethod
     def validate_groups_param(groups):
@@ -175,8 +224,8 @@ class TenantPolicyService:
                 permissions=new_permissions,
                 tenant_name=TenantPolicyService.TENANT_NAME,
             )
-
-            return True
+        tenant_permission_cache.invalidate(uri)
+        return True
 
     @staticmethod
     def list_tenant_permissions():
@@ -218,13 +267,8 @@ class TenantPolicyService:
             return True
 
         with get_context().db_engine.scoped_session() as session:
-            tenant_policy = TenantPolicyRepository.has_user_tenant_permission(
-                session=session,
-                groups=groups,
-                permission_name=permission_name,
-                tenant_name=tenant_name,
-            )
-            return tenant_policy is not None
+            permissions = TenantPolicyService.get_groups_tenant_permissions(session, groups, tenant_name)
+            return any(permission_name in names for names in permissions.values())
 
     @staticmethod
     def check_user_tenant_permission(session, username: str, groups: [str], tenant_name: str, permission_name: str):
@@ -234,22 +278,67 @@ class TenantPolicyService:
         if not username or not permission_name:
             return False
 
-        tenant_policy = TenantPolicyRepository.has_user_tenant_permission(
-            session=session,
-            groups=groups,
-            permission_name=permission_name,
-            tenant_name=tenant_name,
-        )
-
-        if not tenant_policy:
+        permissions = TenantPolicyService.get_groups_tenant_permissions(session, groups, tenant_name)
+        if not any(permission_name in names for names in permissions.values()):
             raise exceptions.TenantUnauthorized(
                 username=username,
                 action=permission_name,
                 tenant_name=tenant_name,
             )
 
-        else:
-            return tenant_policy
+        return True
+
+    @staticmethod
+    def get_groups_tenant_permissions(session, groups: [str], tenant_name: str) -> Dict[str, FrozenSet[str]]:
+        """
+        Returns the names of the tenant permissions of the groups that have a tenant policy.
+        The groups that are not in the cache are read with a single query.
+        """
+        permissions, missing = tenant_permission_cache.get(tenant_name, groups)
+        if missing:
+            found = {
+                group: frozenset(names)
+                for group, names in TenantPolicyRepository.list_groups_tenant_permissions(
+                    session, missing, tenant_name
+                ).items()
+            }
+            tenant_permission_cache.put(tenant_name, found)
+            permissions.update(found)
+        return permissions
+
+    @staticmethod
+    def attach_groups_tenant_policy(session, groups: [str], permissions: [str], tenant_name: str) -> None:
+        """Creates the tenant policies of groups that have none, with a bulk insert of the policies and permissions"""
+        for group in groups:
+            RequestValidationService.validate_attach_tenant_policy(group, permissions, tenant_name)
+
+        tenant = TenantPolicyService.get_tenant_by_name(session, tenant_name)
+        permission_uris = [
+            permission.permissionUri
+            for permission in PermissionRepository.find_permissions_by_names(
+                session, permissions, PermissionType.TENANT.name
+            )
+        ]
+        policies = [
+            {
+                'sid': utils.uuid('tenant_policy')(None),
+                'tenantUri': tenant.tenantUri,
+                'principalId': group,
+                'principalType': 'GROUP',
+            }
+            for group in groups
+        ]
+        session.execute(insert(TenantPolicy), policies)
+        policy_permissions = [
+            {'sid': policy['sid'], 'permissionUri': permission_uri}
+            for policy in policies
+            for permission_uri in permission_uris
+        ]
+        if policy_permissions:
+            session.execute(insert(TenantPolicyPermission), policy_permissions)
+        session.commit()
+        for group in groups:
+            tenant_permission_cache.invalidate(group)
 
     @staticmethod
     def attach_group_tenant_policy(
@@ -284,6 +373,7 @@ class TenantPolicyService:
             )
             session.add(policy)
             session.commit()
+            tenant_permission_cache.invalidate(group)
         return policy
 
     @staticmethod
@@ -317,6 +407,7 @@ class TenantPolicyService:
         )
         session.add(policy_permission)
         session.commit()
+        tenant_permission_cache.invalidate(policy.principalId)
 
     @staticmethod
     def list_group_tenant_permissions(session, username, groups, uri, data=None, check_perm=None):
@@ -355,6 +446,7 @@ class TenantPolicyService:
                 session.delete(permission)
             session.delete(policy)
             session.commit()
+            tenant_permission_cache.invalidate(group)
 
         return True
 
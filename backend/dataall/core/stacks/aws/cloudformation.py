@@ -146,7 +146,7 @@ class CloudFormation:
                             'ResourceStatusReason': event.get('ResourceStatusReason'),
                         }
                     )
-                stack.events = {'events': filtered_events}
+                stack.events = {**(stack.events or {}), 'events': filtered_events}
                 stack.error = None
                 session.commit()
         except ClientError as e:
@@ -8,17 +8,22 @@ from dataall.base.utils import Parameter
 
 log = logging.getLogger('aws:ecs')
 
+DESCRIBE_TASKS_MAX_ARNS = 100
+
 
 class Ecs:
     def __init__(self):
         pass
 
     @staticmethod
-    def run_cdkproxy_task(stack_uri):
+    def run_cdkproxy_task(stack_uri, force=False):
+        context = [{'name': 'stackUri', 'value': stack_uri}]
+        if force:
+            context.append({'name': 'force', 'value': 'true'})
         task_arn = Ecs.run_ecs_task(
             task_definition_param='ecs/task_def_arn/cdkproxy',
             container_name_param='ecs/container/cdkproxy',
-            context=[{'name': 'stackUri', 'value': stack_uri}],
+            context=context,
             started_by=f'awsworker-{stack_uri}',
         )
         log.info(f'ECS Task {task_arn} running')
@@ -85,6 +90,28 @@ class Ecs:
             log.error(e)
             raise e
 
+    @staticmethod
+    def list_running_tasks(cluster_name) -> dict:
+        """
+        Returns the startedBy of the tasks of the cluster that are pending or running, by task ARN,
+        with one ListTasks request per page of 100 tasks and one DescribeTasks request per 100 tasks
+        """
+        try:
+            client = boto3.client('ecs')
+            task_arns = []
+            for page in client.get_paginator('list_tasks').paginate(cluster=cluster_name, desiredStatus='RUNNING'):
+                task_arns.extend(page.get('taskArns', []))
+            running_tasks = {}
+            for i in range(0, len(task_arns), DESCRIBE_TASKS_MAX_ARNS):
+                response = client.describe_tasks(cluster=cluster_name, tasks=task_arns[i : i + DESCRIBE_TASKS_MAX_ARNS])
+                for task in response.get('tasks', []):
+                    if task.get('lastStatus') != 'STOPPED':
+                        running_tasks[task['taskArn']] = task.get('startedBy')
+            return running_tasks
+        except ClientError as e:
+            log.error(e)
+            raise e
+
     @staticmethod
     def is_task_running(cluster_name, started_by=None):
         try:
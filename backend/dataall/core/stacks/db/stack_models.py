@@ -27,6 +27,7 @@ class Stack(Base):
     events = Column(postgresql.JSON)
     lastSeen = Column(DateTime, default=lambda: datetime.datetime(year=1900, month=1, day=1))
     EcsTaskArn = Column(String, nullable=True)
+    templateHash = Column(String, nullable=True)
 
 
 class KeyValueTag(Base):
@@ -29,6 +29,16 @@ class StackRepository:
             query = query.filter(models.Stack.status.in_(statuses))
         return query.first()
 
+    @staticmethod
+    def list_stack_accounts_by_target_uris(session, target_uris) -> dict:
+        """Returns the AWS account of the stack of each target that has a stack"""
+        if not target_uris:
+            return {}
+        query = session.query(models.Stack.targetUri, models.Stack.accountid).filter(
+            models.Stack.targetUri.in_(target_uris)
+        )
+        return {target_uri: accountid for target_uri, accountid in query}
+
     @staticmethod
     def get_stack_by_uri(session, stack_uri):
         stack = StackRepository.find_stack_by_uri(session, stack_uri)
@@ -55,4 +55,6 @@ class StackHandlers:
                 )
                 time.sleep(30)
 
-            stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=task.targetUri)
+            stack.EcsTaskArn = Ecs.run_cdkproxy_task(
+                stack_uri=task.targetUri, force=(task.payload or {}).get('force', False)
+            )
@@ -143,21 +143,22 @@ class StackService:
             )
 
     @staticmethod
-    def deploy_stack(targetUri):
+    def deploy_stack(targetUri, force=False):
+        """Deploys the stack of the target, force deploys it even if its templates did not change"""
         context = get_context()
         with context.db_engine.scoped_session() as session:
             stack: Stack = StackRepository.get_stack_by_target_uri(session, target_uri=targetUri)
             envname = os.getenv('envname', 'local')
 
             if envname in ['local', 'pytest', 'dkrcompose']:
-                requests.post(f'{config.get_property("cdk_proxy_url")}/stack/{stack.stackUri}')
+                requests.post(f'{config.get_property("cdk_proxy_url")}/stack/{stack.stackUri}', params={'force': force})
 
             else:
                 cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
                 if not Ecs.is_task_running(cluster_name, f'awsworker-{stack.stackUri}'):
-                    stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack.stackUri)
+                    stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack.stackUri, force=force)
                 else:
-                    task: Task = Task(action='ecs.cdkproxy.deploy', targetUri=stack.stackUri)
+                    task: Task = Task(action='ecs.cdkproxy.deploy', targetUri=stack.stackUri, payload={'force': force})
                     session.add(task)
                     session.commit()
                     Worker.queue(engine=context.db_engine, task_ids=[task.taskUri])
@@ -224,7 +225,7 @@ class StackService:
                 permission_name=TargetType.get_resource_update_permission_name(target_type),
             )
             stack = StackRepository.get_stack_by_target_uri(session, target_uri=target_uri)
-            StackService.deploy_stack(stack.targetUri)
+            StackService.deploy_stack(stack.targetUri, force=True)
             return stack
 
     @staticmethod
@@ -1,7 +1,11 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from typing import Dict, List, Optional
+
+from sqlalchemy import update
 
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils.json_utils import to_json
@@ -12,6 +16,7 @@ ENVNAME = os.getenv('envname', 'local')
 
 class WorkerHandler:
     _instance = None
+    MAX_CONCURRENCY = int(os.getenv('WORKER_MAX_CONCURRENCY', 10))
 
     @staticmethod
     def get_instance():
@@ -34,46 +39,95 @@ class WorkerHandler:
         return decorator
 
     def process(self, engine, task_ids: [str], save_response=True):
-        tasks_responses = []
-        if self.enabled:
-            for taskid in task_ids:
-                try:
-                    log.info(f'Processing Task: {taskid}')
-                    handler, task = self.get_task_handler(engine, taskid)
-
-                    error, response, status = self.handle_task(engine, task, handler)
-                    if save_response:
-                        WorkerHandler.update_task(engine, taskid, error, to_json(response), status)
-
-                    else:
-                        WorkerHandler.update_task(engine, taskid, error, {}, status)
-                    tasks_responses.append(
-                        {
-                            'taskUri': taskid,
-                            'response': response,
-                            'error': error,
-                            'status': status,
-                        }
-                    )
-                    return tasks_responses
-                except Exception as e:
-                    log.exception('Error in process')
-                    log.error(f'Task processing failed {e} : {taskid}')
-        else:
+        """Processes the tasks in order, in the calling thread"""
+        if not self.enabled:
             log.info(f'Worker disabled, tasks {task_ids} wont be processed')
+            return None
+        return self.process_batch(engine, [task_ids], save_response=save_response)[0]
+
+    def process_batch(self, engine, batches: List[List[str]], save_response=True) -> List[Optional[List[dict]]]:
+        """
+        Processes lists of task ids, e.g. the messages of a batch of SQS records.
+        The tasks of all the lists are claimed with a single query and their results are saved in bulk.
+        The tasks of a list run in order, while the lists run concurrently on up to MAX_CONCURRENCY threads.
+        Returns the task responses of each list, or None for the lists that could not be processed.
+        """
+        if not self.enabled:
+            log.info(f'Worker disabled, tasks {batches} wont be processed')
+            return [None] * len(batches)
+        try:
+            tasks = self.claim_tasks(engine, [taskid for task_ids in batches for taskid in task_ids])
+        except Exception:
+            log.exception(f'Failed to claim tasks {batches}')
+            return [None] * len(batches)
 
-    def get_task_handler(self, engine, taskid):
+        if len(batches) == 1:
+            results = [self._process_tasks(engine, batches[0], tasks)]
+        else:
+            max_workers = min(self.MAX_CONCURRENCY, len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='worker') as executor:
+                futures = [executor.submit(self._process_tasks, engine.fork(), task_ids, tasks) for task_ids in batches]
+                results = [self._result(future) for future in futures]
+
+        updates = [
+            {
+                'taskUri': response['taskUri'],
+                'status': response['status'],
+                'error': response['error'],
+                'response': to_json(response['response']) if save_response else {},
+            }
+            for responses in results
+            if responses
+            for response in responses
+        ]
+        try:
+            WorkerHandler.update_tasks(engine, updates)
+        except Exception:
+            log.exception(f'Failed to save the results of tasks {[update["taskUri"] for update in updates]}')
+        return results
+
+    def claim_tasks(self, engine, task_ids: List[str]) -> Dict[str, Task]:
+        """Marks the pending tasks that have a handler as started, in a single UPDATE ... RETURNING query"""
         with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            handler = self.handlers.get(task.action)
-            log.info(f' found handler {handler} for task action {task.action}|{task.taskUri}')
-            if task.status != 'pending':
-                raise Exception(f'Could not start task {task.taskUri} as its status is {task.status}')
-            if not handler:
-                raise Exception(f'No handler defined for {task.action}')
-            task.status = 'started'
-            session.commit()
-        return handler, task
+            tasks = session.scalars(
+                update(Task)
+                .where(Task.taskUri.in_(task_ids), Task.status == 'pending', Task.action.in_(list(self.handlers)))
+                .values(status='started')
+                .returning(Task),
+                execution_options={'synchronize_session': False},
+            ).all()
+        claimed = {task.taskUri: task for task in tasks}
+        not_claimed = [taskid for taskid in task_ids if taskid not in claimed]
+        if not_claimed:
+            log.error(f'Could not start tasks {not_claimed} as they are not pending or have no handler')
+        return claimed
+
+    def _process_tasks(self, engine, task_ids: List[str], tasks: Dict[str, Task]) -> List[dict]:
+        tasks_responses = []
+        for taskid in task_ids:
+            task = tasks.get(taskid)
+            if not task:
+                continue
+            handler = self.handlers[task.action]
+            log.info(f'Processing Task: {taskid} with handler {handler} for task action {task.action}')
+            error, response, status = self.handle_task(engine, task, handler)
+            tasks_responses.append(
+                {
+                    'taskUri': taskid,
+                    'response': response,
+                    'error': error,
+                    'status': status,
+                }
+            )
+        return tasks_responses
+
+    @staticmethod
+    def _result(future):
+        try:
+            return future.result()
+        except Exception:
+            log.exception('Error in process')
+            return None
 
     @staticmethod
     def handle_task(engine, task: Task, handler):
@@ -89,14 +143,12 @@ class WorkerHandler:
         return error, response, status
 
     @staticmethod
-    def update_task(engine, taskid, error, response, status):
+    def update_tasks(engine, updates: List[dict]):
+        """Saves the status, error and response of the tasks, updates are dictionaries with the taskUri"""
+        if not updates:
+            return
         with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            task.status = status
-            task.error = error
-            task.response = response
-            session.commit()
-            return task
+            session.execute(update(Task), updates)
 
     @classmethod
     def retry(cls, exception, tries=4, delay=3, backoff=2, logger=None):
@@ -0,0 +1,102 @@
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, List
+
+from sqlalchemy import update
+
+from dataall.core.tasks.db.task_models import Task
+
+log = logging.getLogger(__name__)
+
+
+class TaskOutbox:
+    """
+    Collects the tasks queued in a collect() block, e.g. during a GraphQL request, and sends them together
+    when the block exits, instead of sending a message per queued task.
+    send(engine, task_ids) sends the tasks queued outside of a block,
+    send_batch(task_ids) sends the tasks of a block and returns the ids of the tasks that could not be sent.
+    """
+
+    def __init__(self, send: Callable, send_batch: Callable[[List[str]], List[str]]):
+        self._send = send
+        self._send_batch = send_batch
+        self._storage = threading.local()
+
+    def queue(self, engine, task_ids: [str]):
+        """Adds the tasks to the outbox of the current block, or sends them if there is none"""
+        outbox = getattr(self._storage, 'outbox', None)
+        if outbox is None:
+            return self._send(engine, task_ids)
+        outbox['engine'] = engine
+        outbox['task_ids'].extend(task_ids)
+        return None
+
+    @contextmanager
+    def collect(self):
+        """
+        Sends the tasks queued in the block when it exits. The tasks that could not be sent are marked as failed,
+        so that they are not left pending, and are listed in the 'unsent' task ids of the yielded outbox
+        """
+        outbox = {'engine': None, 'task_ids': [], 'unsent': []}
+        self._storage.outbox = outbox
+        try:
+            yield outbox
+        finally:
+            self._storage.outbox = None
+            if outbox['task_ids']:
+                outbox['unsent'] = self._flush(outbox['engine'], outbox['task_ids'])
+
+    def _flush(self, engine, task_ids: List[str]) -> List[str]:
+        try:
+            task_ids = self._deduplicate(engine, task_ids)
+        except Exception:
+            log.exception(f'Failed to deduplicate tasks {task_ids}, they are all sent')
+        try:
+            unsent = self._send_batch(task_ids)
+        except Exception:
+            log.exception(f'Failed to send tasks {task_ids}')
+            unsent = task_ids
+        if unsent:
+            log.error(f'Failed to send tasks {unsent}, they are marked as failed')
+            try:
+                self._fail(engine, unsent)
+            except Exception:
+                log.exception(f'Failed to mark tasks {unsent} as failed')
+        return unsent
+
+    @staticmethod
+    def _deduplicate(engine, task_ids: List[str]) -> List[str]:
+        """
+        Returns the task ids without the tasks that have the same action, target and payload as a previous task.
+        The duplicated tasks are marked as skipped, so that they are not left pending.
+        """
+        if len(task_ids) < 2:
+            return task_ids
+        with engine.scoped_session() as session:
+            tasks = {task.taskUri: task for task in session.query(Task).filter(Task.taskUri.in_(task_ids))}
+            unique, seen, duplicates = [], set(), []
+            for taskid in dict.fromkeys(task_ids):
+                task = tasks.get(taskid)
+                key = (task.action, task.targetUri, json.dumps(task.payload, sort_keys=True)) if task else taskid
+                if key in seen:
+                    duplicates.append(task)
+                    continue
+                seen.add(key)
+                unique.append(taskid)
+            for task in duplicates:
+                task.status = 'skipped'
+        if duplicates:
+            log.info(f'Skipped duplicated tasks {[task.taskUri for task in duplicates]}')
+        return unique
+
+    @staticmethod
+    def _fail(engine, task_ids: List[str]):
+        with engine.scoped_session() as session:
+            session.execute(
+                update(Task)
+                .where(Task.taskUri.in_(task_ids), Task.status == 'pending')
+                .values(status='failed', error={'message': 'The task could not be queued'}),
+                execution_options={'synchronize_session': False},
+            )
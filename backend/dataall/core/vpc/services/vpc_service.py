@@ -2,7 +2,6 @@ import logging
 
 from dataall.base.context import get_context
 from dataall.base.db import exceptions
-from dataall.base.db.exceptions import ResourceUnauthorized
 from dataall.core.permissions.services.group_policy_service import GroupPolicyService
 from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.core.activity.db.activity_models import Activity
@@ -95,19 +94,13 @@ class VpcService:
     @staticmethod
     def get_environment_networks(environment_uri):
         with _session() as session:
-            nets = []
             all_nets = VpcRepository.get_environment_networks(session=session, environment_uri=environment_uri)
-            for net in all_nets:
-                try:
-                    ResourcePolicyService.check_user_resource_permission(
-                        session=session,
-                        username=get_context().username,
-                        groups=get_context().groups,
-                        resource_uri=net.vpcUri,
-                        permission_name=GET_NETWORK,
-                    )
-                except ResourceUnauthorized as exc:
-                    log.info(exc)
-                else:
-                    nets += net
-            return nets
+            authorized = set(
+                ResourcePolicyService.filter_authorized(
+                    session=session,
+                    groups=get_context().groups,
+                    resource_uris=[net.vpcUri for net in all_nets],
+                    permission_name=GET_NETWORK,
+                )
+            )
+            return [net for net in all_nets if net.vpcUri in authorized]
@@ -15,13 +15,18 @@ class EcsCatalogIndexHandler:
     def run_ecs_reindex_catalog_task(engine, task: Task):
         envname = os.environ.get('envname', 'local')
         if envname in ['local', 'dkrcompose']:
-            CatalogIndexerTask.index_objects(engine, str(task.payload.get('with_deletes', False)))
+            CatalogIndexerTask.index_objects(
+                engine, str(task.payload.get('with_deletes', False)), rebuild=str(task.payload.get('rebuild', False))
+            )
         else:
             ecs_task_arn = Ecs.run_ecs_task(
                 task_definition_param='ecs/task_def_arn/catalog_indexer',
                 container_name_param='ecs/container/catalog_indexer',
                 context=[
                     {'name': 'with_deletes', 'value': str(task.payload.get('with_deletes', False))},
+                    {'name': 'rebuild', 'value': str(task.payload.get('rebuild', False))},
+                    # the scheduled runs of the task definition are incremental, a reindex requested reindexes all
+                    {'name': 'incremental', 'value': 'False'},
                 ],
             )
             return {'task_arn': ecs_task_arn}
@@ -1,13 +1,27 @@
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from operator import and_
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy.orm import with_expression
+from sqlalchemy import or_
 
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.organizations.db.organization_models import Organization
 from dataall.modules.catalog.db.glossary_models import GlossaryNode, TermLink
-from dataall.base.searchproxy import connect
+from dataall.modules.catalog.indexers.bulk_indexer import BulkIndexer
+from dataall.base.searchproxy import (
+    INDEX_ALIAS,
+    INDEX_VERSION,
+    connect,
+    index_metadata,
+    index_version,
+    supports_aliases,
+    update_index_metadata,
+)
 
 log = logging.getLogger(__name__)
 
@@ -15,9 +29,11 @@ log = logging.getLogger(__name__)
 class BaseIndexer(ABC):
     """API to work with OpenSearch"""
 
-    _INDEX = 'dataall-index'
+    _INDEX = INDEX_ALIAS
     _es = None
     _QUERY_SIZE = 1000
+    _BATCH_SIZE = 500
+    _bulk: BulkIndexer = None
 
     @classmethod
     def es(cls):
@@ -30,6 +46,25 @@ class BaseIndexer(ABC):
 
         return cls._es
 
+    @classmethod
+    @contextmanager
+    def bulk(cls, index: str = None, **kwargs):
+        """
+        Within the context documents indexed or deleted by any indexer are buffered and sent with the _bulk API.
+        Yields the BulkIndexReport, which is filled in when all the batches are sent on exit.
+        index overrides the index written to, e.g. for rebuilds
+        """
+        if BaseIndexer._bulk is not None:
+            yield BaseIndexer._bulk.report
+            return
+        BaseIndexer._bulk = BulkIndexer(es_factory=cls.es, index=index or cls._INDEX, **kwargs)
+        try:
+            yield BaseIndexer._bulk.report
+        finally:
+            bulk, BaseIndexer._bulk = BaseIndexer._bulk, None
+            report = bulk.close()
+            log.info(f'Bulk indexing finished: {report.summary()}')
+
     @staticmethod
     @abstractmethod
     def upsert(session, target_id):
@@ -37,22 +72,58 @@ class BaseIndexer(ABC):
 
     @classmethod
     def delete_doc(cls, doc_id):
+        if BaseIndexer._bulk is not None:
+            BaseIndexer._bulk.delete(doc_id)
+            return True
         es = cls.es()
         es.delete(index=cls._INDEX, id=doc_id, ignore=[400, 404])
         return True
 
     @classmethod
     def _index(cls, doc_id, doc):
-        es = cls.es()
         doc['_indexed'] = datetime.now()
+        if BaseIndexer._bulk is not None:
+            BaseIndexer._bulk.index(doc_id, doc)
+            return True
+        es = cls.es()
         if es:
             res = es.index(index=cls._INDEX, id=doc_id, body=doc)
-            log.info(f'doc {doc} for id {doc_id} indexed with response {res}')
+            log.info(f'doc for id {doc_id} indexed with response {res}')
             return True
         else:
             log.error(f'ES config is missing doc {doc} for id {doc_id} was not indexed')
             return False
 
+    @classmethod
+    def index_outdated(cls) -> bool:
+        """Returns True when the index was created with other mappings than the current ones and must be rebuilt"""
+        if not supports_aliases(os.getenv('envname', 'local')):
+            return False
+        return index_version(cls.es(), cls._INDEX) != INDEX_VERSION
+
+    @classmethod
+    def last_run(cls) -> Optional[datetime]:
+        """Returns the start time of the last finished catalog indexer run, the high-water mark of the incremental runs"""
+        return cls._run_time('lastRun')
+
+    @classmethod
+    def last_reconcile(cls) -> Optional[datetime]:
+        """Returns the start time of the last finished run that reindexed all objects and deleted the other documents"""
+        return cls._run_time('lastReconcile')
+
+    @classmethod
+    def save_run(cls, run: datetime, reconcile: bool = False) -> None:
+        """Stores the start time of a finished catalog indexer run in the metadata of the index"""
+        values = {'lastRun': run.isoformat()}
+        if reconcile:
+            values['lastReconcile'] = run.isoformat()
+        update_index_metadata(cls.es(), cls._INDEX, **values)
+
+    @classmethod
+    def _run_time(cls, name) -> Optional[datetime]:
+        value = index_metadata(cls.es(), cls._INDEX).get(name)
+        return datetime.fromisoformat(value) if value else None
+
     @classmethod
     def search_all(cls, query, sort):
         all_results = []
@@ -86,19 +157,49 @@ class BaseIndexer(ABC):
 
     @staticmethod
     def _get_target_glossary_terms(session, target_uri):
+        return BaseIndexer._get_targets_glossary_terms(session, [target_uri]).get(target_uri, [])
+
+    @staticmethod
+    def _get_targets_glossary_terms(session, target_uris) -> Dict[str, List[str]]:
+        """Returns the paths of the approved glossary terms linked to each of the targets in one query"""
         q = (
-            session.query(TermLink)
-            .options(
-                with_expression(TermLink.path, GlossaryNode.path),
-                with_expression(TermLink.label, GlossaryNode.label),
-                with_expression(TermLink.readme, GlossaryNode.readme),
-            )
+            session.query(TermLink.targetUri, GlossaryNode.path)
             .join(GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri)
             .filter(
                 and_(
-                    TermLink.targetUri == target_uri,
+                    TermLink.targetUri.in_(target_uris),
                     TermLink.approvedBySteward.is_(True),
                 )
             )
         )
-        return [t.path for t in q]
+        terms = defaultdict(list)
+        for target_uri, path in q:
+            terms[target_uri].append(path)
+        return terms
+
+    @staticmethod
+    def _get_targets_with_glossary_changes(session, since: datetime) -> Set[str]:
+        """Returns the targets whose glossary term links, or the terms linked to them, changed since the given time"""
+        q = (
+            session.query(TermLink.targetUri)
+            .join(GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri)
+            .filter(or_(TermLink.created > since, TermLink.updated > since, GlossaryNode.updated > since))
+            .distinct()
+        )
+        return {target_uri for (target_uri,) in q}
+
+    @staticmethod
+    def _get_environments(session, environment_uris) -> Dict[str, Tuple[Environment, Organization]]:
+        """Returns the environments and their organizations in one query"""
+        q = (
+            session.query(Environment, Organization)
+            .join(Organization, Organization.organizationUri == Environment.organizationUri)
+            .filter(Environment.environmentUri.in_(set(environment_uris)))
+        )
+        return {env.environmentUri: (env, org) for env, org in q}
+
+    @classmethod
+    def _batches(cls, items: List) -> Iterator[List]:
+        """Splits the objects to index, so that the documents are built from a few queries per batch"""
+        for start in range(0, len(items), cls._BATCH_SIZE):
+            yield items[start : start + cls._BATCH_SIZE]
@@ -0,0 +1,184 @@
+"""Buffers catalog documents and writes them to OpenSearch with the _bulk API"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.serializer import JSONSerializer
+
+log = logging.getLogger(__name__)
+
+# statuses of a whole request or of a single bulk item that are worth sending again
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+@dataclass
+class BulkIndexReport:
+    """Summary of a bulk indexing run"""
+
+    indexed: int = 0
+    deleted: int = 0
+    failed: int = 0
+    retried: int = 0
+    batches: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    MAX_ERRORS = 20
+
+    def add_error(self, doc_id, error):
+        self.failed += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(f'{doc_id}: {error}')
+
+    def summary(self) -> str:
+        return (
+            f'indexed={self.indexed} deleted={self.deleted} failed={self.failed} retried={self.retried} '
+            f'batches={self.batches} bytes={self.bytes} elapsed={self.elapsed:.1f}s'
+        )
+
+
+class BulkIndexer:
+    """
+    Collects index/delete actions and sends them in batches bounded by number of actions and payload size.
+    Batches are flushed by a bounded pool of threads, so at most max_workers requests are in flight and
+    at most 2 * max_workers batches are held in memory. Items rejected with a retryable status (e.g. 429 when
+    the cluster is overloaded) are sent again with exponential backoff, other failures are added to the report.
+    """
+
+    BATCH_SIZE = int(os.getenv('CATALOG_BULK_BATCH_SIZE', 500))
+    BATCH_BYTES = int(os.getenv('CATALOG_BULK_BATCH_BYTES', 5 * 1024 * 1024))
+    MAX_WORKERS = int(os.getenv('CATALOG_BULK_MAX_WORKERS', 4))
+    MAX_RETRIES = int(os.getenv('CATALOG_BULK_MAX_RETRIES', 5))
+    BACKOFF_SECONDS = 1.0
+    MAX_BACKOFF_SECONDS = 30.0
+
+    def __init__(
+        self,
+        es_factory: Callable,
+        index: str,
+        batch_size: int = None,
+        batch_bytes: int = None,
+        max_workers: int = None,
+        max_retries: int = None,
+    ):
+        self._es_factory = es_factory
+        self._index = index
+        self._batch_size = batch_size or self.BATCH_SIZE
+        self._batch_bytes = batch_bytes or self.BATCH_BYTES
+        self._max_workers = max_workers or self.MAX_WORKERS
+        self._max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self._serializer = JSONSerializer()
+
+        self._actions: List[Tuple[str, str, str]] = []  # (operation, doc_id, ndjson lines)
+        self._buffered_bytes = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(2 * self._max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures = []
+        self._started = time.monotonic()
+        self.report = BulkIndexReport()
+
+    def index(self, doc_id: str, doc: dict) -> None:
+        action = self._serializer.dumps({'index': {'_index': self._index, '_id': doc_id}})
+        self._add(('index', doc_id, f'{action}\n{self._serializer.dumps(doc)}\n'))
+
+    def delete(self, doc_id: str) -> None:
+        action = self._serializer.dumps({'delete': {'_index': self._index, '_id': doc_id}})
+        self._add(('delete', doc_id, f'{action}\n'))
+
+    def flush(self) -> None:
+        """Sends the buffered actions without waiting for the response"""
+        with self._lock:
+            batch, self._actions, self._buffered_bytes = self._actions, [], 0
+        if not batch:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='bulk-indexer')
+        self._slots.acquire()
+        future = self._executor.submit(self._send, batch)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def close(self) -> BulkIndexReport:
+        """Flushes the remaining actions, waits for all batches and returns the report"""
+        self.flush()
+        for future in self._futures:
+            future.result()
+        self._futures = []
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.report.elapsed = time.monotonic() - self._started
+        return self.report
+
+    def _add(self, action):
+        size = len(action[2].encode())
+        with self._lock:
+            self._actions.append(action)
+            self._buffered_bytes += size
+            full = len(self._actions) >= self._batch_size or self._buffered_bytes >= self._batch_bytes
+        if full:
+            self.flush()
+
+    def _send(self, batch):
+        attempt = 0
+        while batch:
+            body = ''.join(lines for _, _, lines in batch)
+            try:
+                response = self._es_factory().bulk(body=body)
+            except (ConnectionError, TransportError) as e:
+                if not self._retryable(e.status_code) or attempt >= self._max_retries:
+                    for _, doc_id, _ in batch:
+                        self._record_failure(doc_id, e)
+                    return
+                retry = batch
+            else:
+                self._count_batch(len(body.encode()))
+                retry = self._process_response(batch, response, last_attempt=attempt >= self._max_retries)
+
+            if retry:
+                with self._lock:
+                    self.report.retried += len(retry)
+                time.sleep(min(self.BACKOFF_SECONDS * 2**attempt, self.MAX_BACKOFF_SECONDS))
+            batch = retry
+            attempt += 1
+
+    def _process_response(self, batch, response, last_attempt):
+        """Updates the report and returns the actions to retry"""
+        retry = []
+        for action, item in zip(batch, response.get('items', [])):
+            operation, doc_id, _ = action
+            result = item.get(operation, {})
+            status = result.get('status', 500)
+            if status < 300 or (operation == 'delete' and status == 404):
+                with self._lock:
+                    if operation == 'index':
+                        self.report.indexed += 1
+                    else:
+                        self.report.deleted += 1
+            elif self._retryable(status) and not last_attempt:
+                retry.append(action)
+            else:
+                self._record_failure(doc_id, result.get('error', status))
+        return retry
+
+    def _count_batch(self, size):
+        with self._lock:
+            self.report.batches += 1
+            self.report.bytes += size
+
+    def _record_failure(self, doc_id, error):
+        log.error(f'Failed to write document {doc_id} to {self._index}: {error}')
+        with self._lock:
+            self.report.add_error(doc_id, error)
+
+    @staticmethod
+    def _retryable(status) -> bool:
+        return status in RETRYABLE_STATUSES or status == 'N/A'  # N/A is the status of connection errors
@@ -19,8 +19,11 @@ class CatalogService:
             raise Exception('Only data.all admin group members can start re-index catalog task')
 
         with context.db_engine.scoped_session() as session:
+            # removing the deleted objects is done by rebuilding the index, which doesn't affect the search meanwhile
             reindex_catalog_task: Task = Task(
-                action='ecs.reindex.catalog', targetUri='ALL', payload={'with_deletes': with_deletes}
+                action='ecs.reindex.catalog',
+                targetUri='ALL',
+                payload={'with_deletes': with_deletes, 'rebuild': with_deletes},
             )
             session.add(reindex_catalog_task)
 
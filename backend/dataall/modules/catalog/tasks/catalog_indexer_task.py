@@ -1,11 +1,14 @@
 import logging
 import os
 import sys
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.bulk_indexer import BulkIndexReport
 from dataall.base.db import get_engine
+from dataall.base.searchproxy import create_versioned_index, supports_aliases, swap_alias
 from dataall.base.loader import load_modules, ImportMode
 from dataall.base.utils.alarm_service import AlarmService
 
@@ -15,39 +18,120 @@ log = logging.getLogger(__name__)
 class CatalogIndexerTask:
     """
     This class is responsible for indexing objects in the catalog.
+    A full run reindexes all objects, an incremental run only the objects changed since the last run.
+    Objects deleted from the database without a tombstone are only found by a full run with deletes, so an
+    incremental run reconciles the catalog this way when the last reconcile is older than RECONCILE_INTERVAL.
+    A rebuild loads all objects in a new index and then swaps the alias queried by search to it, which happens
+    automatically when the index mappings changed.
     """
 
+    # margin for clock skew and for transactions that committed after the previous run read the database
+    OVERLAP = timedelta(seconds=int(os.getenv('CATALOG_INDEXER_OVERLAP_SECONDS', 300)))
+    RECONCILE_INTERVAL = timedelta(hours=int(os.getenv('CATALOG_INDEXER_RECONCILE_HOURS', 6)))
+
     @classmethod
-    def index_objects(cls, engine, with_deletes='False'):
+    def index_objects(cls, engine, with_deletes='False', incremental='False', rebuild='False'):
         try:
+            if rebuild == 'True' or BaseIndexer.index_outdated():
+                if supports_aliases(os.getenv('envname', 'local')):
+                    return CatalogIndexerTask._rebuild(engine)
+                log.info('Index aliases are not supported, reindexing in place')
+                with_deletes, incremental = 'True', 'False'
+
             indexed_object_uris = []
+            run = datetime.now()
+            since = CatalogIndexerTask._changes_since() if incremental == 'True' else None
+            if since and CatalogIndexerTask._reconcile_due(run):
+                log.info('Reconciling the catalog, reindexing all objects and deleting the other documents')
+                since, with_deletes = None, 'True'
             with engine.scoped_session() as session:
-                for indexer in CatalogIndexer.all():
-                    indexed_object_uris += indexer.index(session)
+                with BaseIndexer.bulk() as report:
+                    for indexer in CatalogIndexer.all():
+                        if since:
+                            indexed_object_uris += indexer.index_changes(session, since)
+                        else:
+                            indexed_object_uris += indexer.index(session)
+                CatalogIndexerTask._check_report(report)
 
                 log.info(f'Successfully indexed {len(indexed_object_uris)} objects')
 
-                if with_deletes == 'True':
+                reconcile = with_deletes == 'True' and not since
+                if reconcile:
                     CatalogIndexerTask._delete_old_objects(indexed_object_uris)
-                return len(indexed_object_uris)
+            BaseIndexer.save_run(run, reconcile=reconcile)
+            return len(indexed_object_uris)
         except Exception as e:
             AlarmService().trigger_catalog_indexing_failure_alarm(error=str(e))
             raise e
 
+    @classmethod
+    def _rebuild(cls, engine) -> int:
+        """Loads all objects in a new index and swaps the alias to it once loaded, search is not affected meanwhile"""
+        es = BaseIndexer.es()
+        run = datetime.now()
+        index = create_versioned_index(es, bulk_load=True)
+        log.info(f'Rebuilding the catalog in {index}')
+        try:
+            indexed_object_uris = []
+            with engine.scoped_session() as session:
+                with BaseIndexer.bulk(index=index) as report:
+                    for indexer in CatalogIndexer.all():
+                        indexed_object_uris += indexer.index(session)
+            CatalogIndexerTask._check_report(report)
+            swap_alias(es, index)
+        except Exception:
+            es.indices.delete(index=index, ignore=[404])
+            raise
+
+        # objects changed during the load were indexed in the previous index by the API
+        with engine.scoped_session() as session:
+            with BaseIndexer.bulk() as report:
+                for indexer in CatalogIndexer.all():
+                    indexer.index_changes(session, run - cls.OVERLAP)
+        CatalogIndexerTask._check_report(report)
+        BaseIndexer.save_run(run, reconcile=True)
+
+        log.info(f'Successfully rebuilt the catalog with {len(indexed_object_uris)} objects')
+        return len(indexed_object_uris)
+
+    @classmethod
+    def _changes_since(cls) -> Optional[datetime]:
+        last_run = BaseIndexer.last_run()
+        if last_run is None:
+            log.info('No previous catalog indexer run found, reindexing all objects')
+            return None
+        log.info(f'Indexing objects changed since the run of {last_run}')
+        return last_run - cls.OVERLAP
+
+    @classmethod
+    def _reconcile_due(cls, run: datetime) -> bool:
+        last_reconcile = BaseIndexer.last_reconcile()
+        return last_reconcile is None or run - last_reconcile >= cls.RECONCILE_INTERVAL
+
     @classmethod
     def _delete_old_objects(cls, indexed_object_uris: List[str]) -> None:
-        # Search for documents in opensearch without an ID in the indexed_object_uris list
-        query = {'query': {'bool': {'must_not': {'terms': {'_id': indexed_object_uris}}}}}
-        # Delete All "Outdated" Objects from Index
-        docs = BaseIndexer.search_all(query, sort='_id')
-        for doc in docs:
-            BaseIndexer.delete_doc(doc_id=doc['_id'])
+        # Delete the documents in opensearch whose ID is not one of the indexed_object_uris, comparing the IDs here
+        # rather than sending all of them in a terms query
+        indexed_object_uris = set(indexed_object_uris)
+        query = {'query': {'match_all': {}}, '_source': False}
+        docs = [doc for doc in BaseIndexer.search_all(query, sort='_id') if doc['_id'] not in indexed_object_uris]
+        with BaseIndexer.bulk() as report:
+            for doc in docs:
+                BaseIndexer.delete_doc(doc_id=doc['_id'])
+        CatalogIndexerTask._check_report(report)
         log.info(f'Deleted {len(docs)} records')
 
+    @staticmethod
+    def _check_report(report: BulkIndexReport) -> None:
+        if report.failed:
+            raise Exception(f'Failed to write {report.failed} documents to the catalog: {report.errors}')
+
 
 if __name__ == '__main__':
     load_modules({ImportMode.CATALOG_INDEXER_TASK})
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
     with_deletes = os.environ.get('with_deletes', 'False')
-    CatalogIndexerTask.index_objects(engine=ENGINE, with_deletes=with_deletes)
+    incremental = os.environ.get('incremental', 'False')
+    rebuild = os.environ.get('rebuild', 'False')
+    CatalogIndexerTask.index_objects(engine=ENGINE, with_deletes=with_deletes, incremental=incremental, rebuild=rebuild)
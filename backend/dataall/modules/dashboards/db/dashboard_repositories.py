@@ -42,6 +42,21 @@ class DashboardRepository(EnvironmentResource):
         session.commit()
         return dashboard
 
+    @staticmethod
+    def list_dashboards_changed_since(session, since, dashboard_uris=None):
+        """Returns the dashboards created or updated since the given time and the dashboards in dashboard_uris"""
+        return (
+            session.query(Dashboard)
+            .filter(
+                or_(
+                    Dashboard.created > since,
+                    Dashboard.updated > since,
+                    Dashboard.dashboardUri.in_(dashboard_uris or []),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def get_dashboard_by_uri(session, uri) -> Dashboard:
         dashboard: Dashboard = session.query(Dashboard).get(uri)
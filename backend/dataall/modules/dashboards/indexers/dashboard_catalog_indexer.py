@@ -1,9 +1,13 @@
 import logging
 
+from datetime import datetime
 from typing import List
 
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.modules.dashboards.db.dashboard_models import Dashboard
+from dataall.modules.dashboards.db.dashboard_repositories import DashboardRepository
+from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.dashboards.indexers.dashboard_indexer import DashboardIndexer
 
 log = logging.getLogger(__name__)
@@ -12,12 +16,22 @@ log = logging.getLogger(__name__)
 class DashboardCatalogIndexer(CatalogIndexer):
     def index(self, session) -> List[str]:
         all_dashboards: List[Dashboard] = session.query(Dashboard).all()
-        all_dashboard_uris = []
-
         log.info(f'Found {len(all_dashboards)} dashboards')
-        dashboard: Dashboard
-        for dashboard in all_dashboards:
-            all_dashboard_uris.append(dashboard.dashboardUri)
-            DashboardIndexer.upsert(session=session, dashboard_uri=dashboard.dashboardUri)
+        return self._index_dashboards(session, all_dashboards)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        # dashboard documents hold the glossary terms and the upvotes
+        glossary_targets = BaseIndexer._get_targets_with_glossary_changes(session, since)
+        voted = VoteRepository.list_targets_voted_since(session, since, target_type='dashboard')
+        dashboards = DashboardRepository.list_dashboards_changed_since(session, since, glossary_targets | voted)
+        log.info(f'Found {len(dashboards)} dashboards changed since {since}')
+        return self._index_dashboards(session, dashboards)
+
+    @staticmethod
+    def _index_dashboards(session, all_dashboards: List[Dashboard]) -> List[str]:
+        all_dashboard_uris = []
+        for dashboards in BaseIndexer._batches(all_dashboards):
+            DashboardIndexer.upsert_many(session, dashboards)
+            all_dashboard_uris += [dashboard.dashboardUri for dashboard in dashboards]
 
         return all_dashboard_uris
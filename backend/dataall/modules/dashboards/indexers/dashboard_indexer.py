@@ -1,4 +1,5 @@
 import logging
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
@@ -22,26 +23,45 @@ class DashboardIndexer(BaseIndexer):
             glossary = BaseIndexer._get_target_glossary_terms(session, dashboard_uri)
             count_upvotes = VoteRepository.count_upvotes(session, dashboard_uri, target_type='dashboard')
             BaseIndexer._index(
-                doc_id=dashboard_uri,
-                doc={
-                    'name': dashboard.name,
-                    'admins': dashboard.SamlGroupName,
-                    'owner': dashboard.owner,
-                    'label': dashboard.label,
-                    'resourceKind': 'dashboard',
-                    'description': dashboard.description,
-                    'tags': [f.replace('-', '') for f in dashboard.tags or []],
-                    'topics': [],
-                    'region': dashboard.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dashboard.created,
-                    'updated': dashboard.updated,
-                    'deleted': dashboard.deleted,
-                    'glossary': glossary,
-                    'upvotes': count_upvotes,
-                },
+                doc_id=dashboard_uri, doc=cls._build_document(dashboard, env, org, glossary, count_upvotes)
             )
         return dashboard
+
+    @classmethod
+    def upsert_many(cls, session, dashboards: List[Dashboard]) -> List[Dashboard]:
+        dashboard_uris = [dashboard.dashboardUri for dashboard in dashboards]
+        environments = BaseIndexer._get_environments(session, [dashboard.environmentUri for dashboard in dashboards])
+        upvotes = VoteRepository.count_upvotes_by_target(session, dashboard_uris, target_type='dashboard')
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, dashboard_uris)
+
+        for dashboard in dashboards:
+            uri = dashboard.dashboardUri
+            env, org = environments[dashboard.environmentUri]
+            BaseIndexer._index(
+                doc_id=uri,
+                doc=cls._build_document(dashboard, env, org, glossaries.get(uri, []), upvotes.get(uri, 0)),
+            )
+        return dashboards
+
+    @staticmethod
+    def _build_document(dashboard, env, org, glossary, count_upvotes) -> dict:
+        return {
+            'name': dashboard.name,
+            'admins': dashboard.SamlGroupName,
+            'owner': dashboard.owner,
+            'label': dashboard.label,
+            'resourceKind': 'dashboard',
+            'description': dashboard.description,
+            'tags': [f.replace('-', '') for f in dashboard.tags or []],
+            'topics': [],
+            'region': dashboard.region.replace('-', ''),
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': dashboard.created,
+            'updated': dashboard.updated,
+            'deleted': dashboard.deleted,
+            'glossary': glossary,
+            'upvotes': count_upvotes,
+        }
@@ -23,5 +23,8 @@ DatasetFilter = gql.InputType(
         gql.Argument('sort', gql.ArrayType(DatasetSortCriteria)),
         gql.Argument('page', gql.Integer),
         gql.Argument('pageSize', gql.Integer),
+        gql.Argument('withTotal', gql.Boolean),
+        gql.Argument('cursor', gql.String),
+        gql.Argument('withCursor', gql.Boolean),
     ],
 )
@@ -47,6 +47,9 @@ class DatasetListRepository:
             query=DatasetListRepository._query_all_user_datasets(session, username, groups, all_subqueries, data),
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
+            with_total=data.get('withTotal', True),
+            cursor=data.get('cursor'),
+            with_cursor=data.get('withCursor', False),
         ).to_dict()
 
     @staticmethod
@@ -84,6 +87,9 @@ class DatasetListRepository:
             query=DatasetListRepository._query_user_datasets(session, username, groups, data),
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
+            with_total=data.get('withTotal', True),
+            cursor=data.get('cursor'),
+            with_cursor=data.get('withCursor', False),
         ).to_dict()
 
     @staticmethod
@@ -118,6 +124,9 @@ class DatasetListRepository:
             query=DatasetListRepository.query_datasets(session, data, environmentUri=uri),
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
+            with_total=data.get('withTotal', True),
+            cursor=data.get('cursor'),
+            with_cursor=data.get('withCursor', False),
         ).to_dict()
 
     @staticmethod
@@ -8,5 +8,8 @@ FeedMessageFilter = gql.InputType(
         gql.Argument(name='term', type=gql.String),
         gql.Argument(name='page', type=gql.Integer),
         gql.Argument(name='pageSize', type=gql.Integer),
+        gql.Argument(name='withTotal', type=gql.Boolean),
+        gql.Argument(name='cursor', type=gql.String),
+        gql.Argument(name='withCursor', type=gql.Boolean),
     ],
 )
@@ -44,5 +44,6 @@ FeedMessages = gql.ObjectType(
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
         gql.Field(name='nodes', type=gql.ArrayType(gql.Ref('FeedMessage'))),
+        gql.Field(name='nextCursor', type=gql.String),
     ],
 )
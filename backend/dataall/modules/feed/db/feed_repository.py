@@ -25,4 +25,11 @@ class FeedRepository:
             )
         q = q.order_by(FeedMessage.created.desc())
 
-        return paginate(q, page=filter.get('page', 1), page_size=filter.get('pageSize', 10)).to_dict()
+        return paginate(
+            q,
+            page=filter.get('page', 1),
+            page_size=filter.get('pageSize', 10),
+            with_total=filter.get('withTotal', True),
+            cursor=filter.get('cursor'),
+            with_cursor=filter.get('withCursor', False),
+        ).to_dict()
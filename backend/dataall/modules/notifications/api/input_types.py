@@ -10,5 +10,8 @@ NotificationFilter = gql.InputType(
         gql.Argument(name='type', type=gql.String),
         gql.Argument(name='page', type=gql.Integer),
         gql.Argument(name='pageSize', type=gql.Integer),
+        gql.Argument(name='withTotal', type=gql.Boolean),
+        gql.Argument(name='cursor', type=gql.String),
+        gql.Argument(name='withCursor', type=gql.Boolean),
     ],
 )
@@ -25,5 +25,6 @@ NotificationSearchResult = gql.ObjectType(
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
         gql.Field(name='nodes', type=gql.ArrayType(Notification)),
+        gql.Field(name='nextCursor', type=gql.String),
     ],
 )
@@ -52,6 +52,9 @@ class NotificationRepository:
             q.order_by(models.Notification.created.desc()),
             page=filter.get('page', 1),
             page_size=filter.get('pageSize', 20),
+            with_total=filter.get('withTotal', True),
+            cursor=filter.get('cursor'),
+            with_cursor=filter.get('withCursor', False),
         ).to_dict()
 
     @staticmethod
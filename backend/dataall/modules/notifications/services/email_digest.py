@@ -0,0 +1,82 @@
+"""
+Digest delivery of the email notifications of a task: the notifications are collected while the task runs,
+then every recipient receives one email with all of its notifications, sent in bulk through SES.
+With EMAIL_DIGEST_DRY_RUN_DIR set, the digests are written to html files in that directory instead of being sent.
+"""
+
+import logging
+import os
+import re
+import uuid
+from typing import Dict, List, Tuple
+
+from dataall.base.aws.ses import Ses
+from dataall.base.services.service_provider_factory import ServiceProviderFactory
+
+log = logging.getLogger(__name__)
+
+
+class EmailDigest:
+    DRY_RUN_DIR = os.getenv('EMAIL_DIGEST_DRY_RUN_DIR')
+
+    def __init__(self):
+        self._notifications = []  # (subject, message, recipient groups, recipient emails)
+
+    def add(self, subject: str, message: str, recipient_groups_list: List[str] = None, recipient_email_list=None):
+        self._notifications.append((subject, message, recipient_groups_list or [], recipient_email_list or []))
+
+    def render(self) -> Dict[str, Tuple[str, str]]:
+        """Returns the subject and html message of the digest of each recipient email id"""
+        groups = {group for _, _, recipient_groups, _ in self._notifications for group in recipient_groups if group}
+        group_emails = (
+            ServiceProviderFactory.get_service_provider_instance().get_emails_for_groups(list(groups)) if groups else {}
+        )
+
+        notifications_by_email = {}
+        for subject, message, recipient_groups, recipient_emails in self._notifications:
+            emails = {email for group in recipient_groups if group for email in group_emails.get(group, [])}
+            emails.update(recipient_emails)
+            for email in emails:
+                notifications = notifications_by_email.setdefault(email, [])
+                if (subject, message) not in notifications:
+                    notifications.append((subject, message))
+
+        return {email: self._render_digest(notifications) for email, notifications in notifications_by_email.items()}
+
+    @staticmethod
+    def _render_digest(notifications: List[Tuple[str, str]]) -> Tuple[str, str]:
+        if len(notifications) == 1:
+            return notifications[0]
+        sections = [f'<h3>{subject}</h3>{message}' for subject, message in notifications]
+        return f'Data.all | {len(notifications)} notifications require your attention', '<hr>'.join(sections)
+
+    def send(self) -> List[dict]:
+        """
+        Sends the digests and returns the result of each email: {'to', 'messageId', 'status', 'error'}.
+        The message ids of SES can be used to track the delivery of each email.
+        """
+        digests = self.render()
+        self._notifications = []
+        if not digests:
+            return []
+        emails = [{'to': to, 'subject': subject, 'message': message} for to, (subject, message) in digests.items()]
+        if self.DRY_RUN_DIR:
+            return self._write_digests(emails)
+
+        results = Ses.get_ses_client().send_bulk_email(emails)
+        for result in results:
+            log.info(f'Digest email to {result["to"]}: {result["status"]}, message id {result["messageId"]}')
+        return results
+
+    def _write_digests(self, emails: List[dict]) -> List[dict]:
+        os.makedirs(self.DRY_RUN_DIR, exist_ok=True)
+        results = []
+        for email in emails:
+            message_id = f'dry-run-{uuid.uuid4()}'
+            file_name = re.sub(r'[^\w.@-]', '_', email['to'])
+            path = os.path.join(self.DRY_RUN_DIR, f'{file_name}.html')
+            with open(path, 'w') as f:
+                f.write(f'<!-- message id: {message_id} -->\n<h2>{email["subject"]}</h2>\n{email["message"]}\n')
+            log.info(f'Digest email to {email["to"]} written to {path}')
+            results.append({'to': email['to'], 'messageId': message_id, 'status': 'DRY_RUN', 'error': None})
+        return results
@@ -23,8 +23,8 @@ class SESEmailNotificationService(BaseEmailNotificationService):
     @staticmethod
     def get_email_ids_from_groupList(group_list, identity_provider):
         email_list = set()
-        for group in group_list:
-            email_list.update(identity_provider.get_user_emailids_from_group(group))
+        for group_emails in identity_provider.get_emails_for_groups(group_list).values():
+            email_list.update(group_emails)
         return email_list
 
     @staticmethod
@@ -58,5 +58,12 @@ class SESEmailNotificationService(BaseEmailNotificationService):
     def send_email_to_users(email_list, email_provider, message, subject):
         # Send individual emails to all the email ids. Sending individual emails helps in tracking individual emails via message-ids
         # https://aws.amazon.com/blogs/messaging-and-targeting/how-to-send-messages-to-multiple-recipients-with-amazon-simple-email-service-ses/
-        for emailId in email_list:
-            email_provider.send_email([emailId], message, subject)
+        # The emails are sent in bulk, SES returns the message-id of each email
+        if not email_list:
+            return []
+        results = email_provider.email_client.send_bulk_email(
+            [{'to': emailId, 'subject': subject, 'message': message} for emailId in email_list]
+        )
+        for result in results:
+            log.info(f'Email to {result["to"]}: {result["status"]}, message id {result["messageId"]}')
+        return results
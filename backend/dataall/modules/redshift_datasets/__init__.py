@@ -104,3 +104,22 @@ class RedshiftDatasetCdkModuleInterface(ModuleInterface):
         import dataall.modules.redshift_datasets.cdk
 
         log.info('Redshift Dataset CDK has been imported')
+
+
+class RedshiftDatasetCatalogIndexerModuleInterface(ModuleInterface):
+    @staticmethod
+    def is_supported(modes: Set[ImportMode]) -> bool:
+        return ImportMode.CATALOG_INDEXER_TASK in modes
+
+    @staticmethod
+    def depends_on() -> List[Type['ModuleInterface']]:
+        from dataall.modules.catalog import CatalogIndexerModuleInterface
+        from dataall.modules.datasets_base import DatasetBaseModuleInterface
+
+        return [CatalogIndexerModuleInterface, DatasetBaseModuleInterface]
+
+    def __init__(self):
+        from dataall.modules.redshift_datasets.indexers.dataset_catalog_indexer import RedshiftDatasetCatalogIndexer
+
+        RedshiftDatasetCatalogIndexer()
+        log.info('Redshift Dataset catalog indexer task has been loaded')
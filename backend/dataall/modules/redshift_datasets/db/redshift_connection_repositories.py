@@ -41,6 +41,10 @@ class RedshiftConnectionRepository:
             raise exceptions.ObjectNotFound('RedshiftConnection', uri)
         return connection
 
+    @staticmethod
+    def list_redshift_connections_by_uris(session, uris) -> list[RedshiftConnection]:
+        return session.query(RedshiftConnection).filter(RedshiftConnection.connectionUri.in_(uris)).all()
+
     @staticmethod
     def _query_user_redshift_connections(session, username, groups, filter) -> Query:
         query = (
@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, func
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
@@ -127,6 +127,57 @@ class RedshiftDatasetRepository:
     def count_dataset_tables(session, dataset_uri) -> int:
         return RedshiftDatasetRepository._query_redshift_dataset_tables(session, dataset_uri).count()
 
+    @staticmethod
+    def count_tables_by_dataset(session, dataset_uris) -> dict:
+        return dict(
+            session.query(RedshiftTable.datasetUri, func.count(RedshiftTable.rsTableUri))
+            .filter(RedshiftTable.datasetUri.in_(dataset_uris))
+            .group_by(RedshiftTable.datasetUri)
+            .all()
+        )
+
+    @staticmethod
+    def list_datasets_tables(session, dataset_uris):
+        return session.query(RedshiftTable).filter(RedshiftTable.datasetUri.in_(dataset_uris)).all()
+
+    @staticmethod
+    def list_all_active_datasets(session) -> [RedshiftDataset]:
+        return session.query(RedshiftDataset).filter(RedshiftDataset.deleted.is_(None)).all()
+
+    @staticmethod
+    def list_active_datasets_by_uris(session, dataset_uris) -> [RedshiftDataset]:
+        return (
+            session.query(RedshiftDataset)
+            .filter(and_(RedshiftDataset.datasetUri.in_(dataset_uris), RedshiftDataset.deleted.is_(None)))
+            .all()
+        )
+
+    @staticmethod
+    def list_datasets_changed_since(session, since) -> [RedshiftDataset]:
+        """Returns the datasets created, updated or deleted since the given time"""
+        return (
+            session.query(RedshiftDataset)
+            .filter(
+                or_(RedshiftDataset.created > since, RedshiftDataset.updated > since, RedshiftDataset.deleted > since)
+            )
+            .all()
+        )
+
+    @staticmethod
+    def list_tables_changed_since(session, since, table_uris=None):
+        """Returns the tables created or updated since the given time and the tables in table_uris"""
+        return (
+            session.query(RedshiftTable)
+            .filter(
+                or_(
+                    RedshiftTable.created > since,
+                    RedshiftTable.updated > since,
+                    RedshiftTable.rsTableUri.in_(table_uris or []),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def count_environment_group_datasets(session, environment, group_uri) -> int:
         return (
@@ -0,0 +1,83 @@
+"""Contains Redshift dataset related indexers for OpenSearch"""
+
+import logging
+
+from datetime import datetime
+from typing import List
+from dataall.modules.redshift_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
+from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
+from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset
+from dataall.modules.redshift_datasets.services.redshift_constants import VOTE_REDSHIFT_DATASET_NAME
+from dataall.modules.vote.db.vote_repositories import VoteRepository
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+
+log = logging.getLogger(__name__)
+
+
+class RedshiftDatasetCatalogIndexer(CatalogIndexer):
+    """
+    Redshift dataset indexer for the catalog. Indexes all Redshift datasets and their tables
+    Register automatically itself when CatalogIndexer instance is created
+    """
+
+    def index(self, session) -> List[str]:
+        all_datasets: List[RedshiftDataset] = RedshiftDatasetRepository.list_all_active_datasets(session)
+        log.info(f'Found {len(all_datasets)} Redshift datasets')
+        return self._index_datasets(session, all_datasets)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        glossary_targets = BaseIndexer._get_targets_with_glossary_changes(session, since)
+        changed_datasets = RedshiftDatasetRepository.list_datasets_changed_since(session, since)
+        changed_tables = RedshiftDatasetRepository.list_tables_changed_since(session, since, glossary_targets)
+
+        deleted_uris = [dataset.datasetUri for dataset in changed_datasets if dataset.deleted]
+        for uri in deleted_uris:
+            BaseIndexer.delete_doc(doc_id=uri)
+
+        # dataset attributes are copied to the documents of all its tables
+        reindexed = {dataset.datasetUri for dataset in changed_datasets if not dataset.deleted}
+        tables = RedshiftDatasetRepository.list_datasets_tables(session, reindexed) + [
+            table for table in changed_tables if table.datasetUri not in reindexed
+        ]
+
+        # dataset documents hold the glossary terms, the upvotes and the number of tables
+        dataset_uris = (
+            reindexed
+            | glossary_targets
+            | VoteRepository.list_targets_voted_since(session, since, target_type=VOTE_REDSHIFT_DATASET_NAME)
+            | {table.datasetUri for table in changed_tables}
+        )
+        datasets = RedshiftDatasetRepository.list_active_datasets_by_uris(session, dataset_uris)
+        log.info(
+            f'Found {len(datasets)} Redshift datasets and {len(tables)} tables changed, '
+            f'{len(deleted_uris)} deleted since {since}'
+        )
+        return self._index_datasets(session, datasets, tables=tables)
+
+    @staticmethod
+    def _index_datasets(session, all_datasets, tables=None) -> List[str]:
+        """Indexes the datasets and the given tables of them, by default all of them"""
+        all_dataset_uris = []
+        for datasets in BaseIndexer._batches(all_datasets):
+            environments = BaseIndexer._get_environments(session, [dataset.environmentUri for dataset in datasets])
+            connections = {
+                connection.connectionUri: connection
+                for connection in RedshiftConnectionRepository.list_redshift_connections_by_uris(
+                    session, {dataset.connectionUri for dataset in datasets}
+                )
+            }
+            batch = {dataset.datasetUri for dataset in datasets}
+
+            tables_batch = None if tables is None else [table for table in tables if table.datasetUri in batch]
+            tables_batch = DatasetTableIndexer.upsert_many(
+                session, datasets, environments, connections, tables=tables_batch
+            )
+            all_dataset_uris += [table.rsTableUri for table in tables_batch]
+
+            DatasetIndexer.upsert_many(session, datasets, environments, connections)
+            all_dataset_uris += [dataset.datasetUri for dataset in datasets]
+
+        return all_dataset_uris
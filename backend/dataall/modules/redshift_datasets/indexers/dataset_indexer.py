@@ -1,12 +1,14 @@
 """Indexes Datasets in OpenSearch"""
 
 import re
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
 from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset
 from dataall.modules.redshift_datasets.services.redshift_enums import RedshiftType
 from dataall.modules.redshift_datasets.services.redshift_constants import (
     VOTE_REDSHIFT_DATASET_NAME,
@@ -31,32 +33,64 @@ class DatasetIndexer(BaseIndexer):
             glossary = BaseIndexer._get_target_glossary_terms(session, dataset_uri)
             BaseIndexer._index(
                 doc_id=dataset_uri,
-                doc={
-                    'name': dataset.name,
-                    'owner': dataset.owner,
-                    'label': dataset.label,
-                    'admins': dataset.SamlAdminGroupName,
-                    'database': connection.database,
-                    'schema': dataset.schema,
-                    'source': connection.clusterId
-                    if connection.redshiftType == RedshiftType.Cluster.value
-                    else connection.nameSpaceId,
-                    'resourceKind': INDEXER_REDSHIFT_DATASET_NAME,
-                    'description': dataset.description,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [t.replace('-', '') for t in dataset.tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dataset.created,
-                    'updated': dataset.updated,
-                    'deleted': dataset.deleted,
-                    'glossary': glossary,
-                    'tables': count_tables,
-                    'upvotes': count_upvotes,
-                },
+                doc=cls._build_document(dataset, connection, env, org, glossary, count_tables, count_upvotes),
             )
         return dataset
+
+    @classmethod
+    def upsert_many(cls, session, datasets: List[RedshiftDataset], environments, connections) -> List[RedshiftDataset]:
+        """
+        Indexes the datasets, environments maps environmentUri to the (environment, organization)
+        and connections maps connectionUri to the connection of the datasets
+        """
+        dataset_uris = [dataset.datasetUri for dataset in datasets]
+        tables = RedshiftDatasetRepository.count_tables_by_dataset(session, dataset_uris)
+        upvotes = VoteRepository.count_upvotes_by_target(session, dataset_uris, target_type=VOTE_REDSHIFT_DATASET_NAME)
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, dataset_uris)
+
+        for dataset in datasets:
+            uri = dataset.datasetUri
+            env, org = environments[dataset.environmentUri]
+            BaseIndexer._index(
+                doc_id=uri,
+                doc=cls._build_document(
+                    dataset,
+                    connections[dataset.connectionUri],
+                    env,
+                    org,
+                    glossaries.get(uri, []),
+                    tables.get(uri, 0),
+                    upvotes.get(uri, 0),
+                ),
+            )
+        return datasets
+
+    @staticmethod
+    def _build_document(dataset, connection, env, org, glossary, count_tables, count_upvotes) -> dict:
+        return {
+            'name': dataset.name,
+            'owner': dataset.owner,
+            'label': dataset.label,
+            'admins': dataset.SamlAdminGroupName,
+            'database': connection.database,
+            'schema': dataset.schema,
+            'source': connection.clusterId
+            if connection.redshiftType == RedshiftType.Cluster.value
+            else connection.nameSpaceId,
+            'resourceKind': INDEXER_REDSHIFT_DATASET_NAME,
+            'description': dataset.description,
+            'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+            'tags': [t.replace('-', '') for t in dataset.tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': dataset.created,
+            'updated': dataset.updated,
+            'deleted': dataset.deleted,
+            'glossary': glossary,
+            'tables': count_tables,
+            'upvotes': count_upvotes,
+        }
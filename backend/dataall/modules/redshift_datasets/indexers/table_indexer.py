@@ -1,11 +1,13 @@
 """Indexes DatasetTable in OpenSearch"""
 
 import re
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
 from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset, RedshiftTable
 from dataall.modules.redshift_datasets.services.redshift_enums import RedshiftType
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
@@ -25,35 +27,60 @@ class DatasetTableIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
-
-            tags = table.tags if table.tags else []
             BaseIndexer._index(
-                doc_id=table_uri,
-                doc={
-                    'name': table.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': table.owner,
-                    'label': table.label,
-                    'resourceKind': 'redshifttable',
-                    'description': table.description,
-                    'database': connection.database,
-                    'schema': dataset.schema,
-                    'source': connection.clusterId
-                    if connection.redshiftType == RedshiftType.Cluster.value
-                    else connection.nameSpaceId,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [t.replace('-', '') for t in tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'datasetUri': table.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': table.created,
-                    'updated': table.updated,
-                    'deleted': table.deleted,
-                    'glossary': glossary,
-                },
+                doc_id=table_uri, doc=cls._build_document(table, dataset, connection, env, org, glossary)
             )
         return table
+
+    @classmethod
+    def upsert_many(
+        cls, session, datasets: List[RedshiftDataset], environments, connections, tables=None
+    ) -> List[RedshiftTable]:
+        """
+        Indexes the given tables of the datasets, by default all their tables.
+        environments maps environmentUri to the (environment, organization)
+        and connections maps connectionUri to the connection of the datasets
+        """
+        datasets = {dataset.datasetUri: dataset for dataset in datasets}
+        if tables is None:
+            tables = RedshiftDatasetRepository.list_datasets_tables(session, list(datasets))
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, [table.rsTableUri for table in tables])
+        for table in tables:
+            dataset = datasets[table.datasetUri]
+            env, org = environments[dataset.environmentUri]
+            BaseIndexer._index(
+                doc_id=table.rsTableUri,
+                doc=cls._build_document(
+                    table, dataset, connections[dataset.connectionUri], env, org, glossaries.get(table.rsTableUri, [])
+                ),
+            )
+        return tables
+
+    @staticmethod
+    def _build_document(table, dataset, connection, env, org, glossary) -> dict:
+        return {
+            'name': table.name,
+            'admins': dataset.SamlAdminGroupName,
+            'owner': table.owner,
+            'label': table.label,
+            'resourceKind': 'redshifttable',
+            'description': table.description,
+            'database': connection.database,
+            'schema': dataset.schema,
+            'source': connection.clusterId
+            if connection.redshiftType == RedshiftType.Cluster.value
+            else connection.nameSpaceId,
+            'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+            'tags': [t.replace('-', '') for t in table.tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'datasetUri': table.datasetUri,
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': table.created,
+            'updated': table.updated,
+            'deleted': table.deleted,
+            'glossary': glossary,
+        }
@@ -9,8 +9,7 @@ log = logging.getLogger(__name__)
 
 class RedshiftShareDataClient:
     def __init__(self, account_id: str, region: str, connection: RedshiftConnection) -> None:
-        session = SessionHelper.remote_session(accountid=account_id, region=region)
-        self.client = session.client(service_name='redshift-data', region_name=region)
+        self.client = SessionHelper.remote_client(accountid=account_id, region=region, service_name='redshift-data')
         self.database = connection.database
         self.execute_connection_params = {
             'Database': connection.database,
@@ -9,8 +9,9 @@ log = logging.getLogger(__name__)
 
 class DatasetCrawler:
     def __init__(self, dataset: S3Dataset):
-        session = SessionHelper.remote_session(accountid=dataset.AwsAccountId, region=dataset.region)
-        self._client = session.client('glue', region_name=dataset.region)
+        self._client = SessionHelper.remote_client(
+            accountid=dataset.AwsAccountId, region=dataset.region, service_name='glue'
+        )
         self._dataset = dataset
 
     def get_crawler(self, crawler_name=None):
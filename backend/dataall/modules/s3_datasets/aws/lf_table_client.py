@@ -1,6 +1,7 @@
 import logging
 from botocore.exceptions import ClientError
 
+from dataall.base.aws.lakeformation import LakeFormationBatch
 from dataall.base.aws.sts import SessionHelper
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
 
@@ -11,9 +12,10 @@ class LakeFormationTableClient:
     """Requests to AWS LakeFormation"""
 
     def __init__(self, table: DatasetTable, aws_session=None):
-        if not aws_session:
-            aws_session = SessionHelper.remote_session(table.AWSAccountId, table.region)
-        self._client = aws_session.client('lakeformation', region_name=table.region)
+        if aws_session:
+            self._client = aws_session.client('lakeformation', region_name=table.region)
+        else:
+            self._client = SessionHelper.remote_client(table.AWSAccountId, table.region, 'lakeformation')
         self._table = table
 
     def grant_pivot_role_all_table_permissions(self):
@@ -39,17 +41,46 @@ class LakeFormationTableClient:
             except ClientError:
                 pass  # ignore the error to continue with other requests
 
+    @staticmethod
+    def grant_principals_all_tables_permissions(tables: [DatasetTable], principals: [str]):
+        """
+        Same as grant_principals_all_table_permissions for many tables of the same account and region,
+        sent with BatchGrantPermissions instead of one request per table and principal
+        :param tables:
+        :param principals:
+        :return: number of grants that failed
+        """
+        if not tables:
+            return 0
+        client = SessionHelper.remote_client(tables[0].AWSAccountId, tables[0].region, 'lakeformation')
+        batch = LakeFormationBatch(client)
+        for table in tables:
+            for principal in principals:
+                batch.grant(principal, LakeFormationTableClient._table_resource(table), ['ALL'])
+        failures = batch.flush()
+        for failure in failures:
+            log.error(
+                f'Failed to grant principal {failure.principal} all table '
+                f'{failure.entry["Resource"]["Table"]["DatabaseName"]}/{failure.entry["Resource"]["Table"]["Name"]} '
+                f'access: {failure.code} {failure.message}'
+            )  # ignore the failures as grant_principals_all_table_permissions does
+        return len(failures)
+
+    @staticmethod
+    def _table_resource(table: DatasetTable):
+        return {
+            'Table': {
+                'DatabaseName': table.GlueDatabaseName,
+                'Name': table.name,
+            }
+        }
+
     def _grant_permissions_to_table(self, principal, permissions):
         table = self._table
         try:
             grant_dict = dict(
                 Principal={'DataLakePrincipalIdentifier': principal},
-                Resource={
-                    'Table': {
-                        'DatabaseName': table.GlueDatabaseName,
-                        'Name': table.name,
-                    }
-                },
+                Resource=self._table_resource(table),
                 Permissions=permissions,
             )
             response = self._client.grant_permissions(**grant_dict)
@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 
 from dataall.base.db import paginate, exceptions
 from dataall.modules.s3_datasets.db.dataset_models import DatasetStorageLocation, S3Dataset
@@ -89,6 +89,15 @@ class DatasetLocationRepository:
     def count_dataset_locations(session, dataset_uri):
         return session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == dataset_uri).count()
 
+    @staticmethod
+    def count_locations_by_dataset(session, dataset_uris) -> dict:
+        return dict(
+            session.query(DatasetStorageLocation.datasetUri, func.count(DatasetStorageLocation.locationUri))
+            .filter(DatasetStorageLocation.datasetUri.in_(dataset_uris))
+            .group_by(DatasetStorageLocation.datasetUri)
+            .all()
+        )
+
     @staticmethod
     def delete_dataset_locations(session, dataset_uri) -> bool:
         locations = session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == dataset_uri).all()
@@ -104,6 +113,26 @@ class DatasetLocationRepository:
             query = query.limit(limit)
         return query.all()
 
+    @staticmethod
+    def list_datasets_folders(session, dataset_uris):
+        """return the folders of all the datasets"""
+        return session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri.in_(dataset_uris)).all()
+
+    @staticmethod
+    def list_folders_changed_since(session, since, folder_uris=None):
+        """Returns the folders created or updated since the given time and the folders in folder_uris"""
+        return (
+            session.query(DatasetStorageLocation)
+            .filter(
+                or_(
+                    DatasetStorageLocation.created > since,
+                    DatasetStorageLocation.updated > since,
+                    DatasetStorageLocation.locationUri.in_(folder_uris or []),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def paginated_dataset_locations(session, uri, data=None) -> dict:
         query = session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == uri)
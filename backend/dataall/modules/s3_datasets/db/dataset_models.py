@@ -83,6 +83,7 @@ class DatasetTable(Resource, Base):
     GlueTableName = Column(String, nullable=False)
     GlueTableConfig = Column(Text)
     GlueTableProperties = Column(JSON, default={})
+    GlueTableVersion = Column(String, nullable=True)
     LastGlueTableStatus = Column(String, default='InSync')
     region = Column(String, default='eu-west-1')
     # LastGeneratedPreviewDate= Column(DateTime, default=None)
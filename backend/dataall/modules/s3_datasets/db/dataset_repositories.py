@@ -206,6 +206,23 @@ class DatasetRepository(EnvironmentResource):
     def list_all_active_datasets(session) -> [S3Dataset]:
         return session.query(S3Dataset).filter(S3Dataset.deleted.is_(None)).all()
 
+    @staticmethod
+    def list_active_datasets_by_uris(session, dataset_uris) -> [S3Dataset]:
+        return (
+            session.query(S3Dataset)
+            .filter(and_(S3Dataset.datasetUri.in_(dataset_uris), S3Dataset.deleted.is_(None)))
+            .all()
+        )
+
+    @staticmethod
+    def list_datasets_changed_since(session, since) -> [S3Dataset]:
+        """Returns the datasets created, updated or deleted since the given time"""
+        return (
+            session.query(S3Dataset)
+            .filter(or_(S3Dataset.created > since, S3Dataset.updated > since, S3Dataset.deleted > since))
+            .all()
+        )
+
     @staticmethod
     def list_all_active_datasets_with_glue_db(session, glue_db_name: str) -> [S3Dataset]:
         # List all the S3 datasets which have the same glue db name ( irrespective of the environment )
@@ -226,6 +243,15 @@ class DatasetRepository(EnvironmentResource):
     def count_dataset_tables(session, dataset_uri):
         return session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset_uri).count()
 
+    @staticmethod
+    def count_tables_by_dataset(session, dataset_uris) -> dict:
+        return dict(
+            session.query(DatasetTable.datasetUri, sqlalchemy.func.count(DatasetTable.tableUri))
+            .filter(DatasetTable.datasetUri.in_(dataset_uris))
+            .group_by(DatasetTable.datasetUri)
+            .all()
+        )
+
     @staticmethod
     def query_environment_group_datasets(session, env_uri, group_uri, filter) -> Query:
         query = session.query(S3Dataset).filter(
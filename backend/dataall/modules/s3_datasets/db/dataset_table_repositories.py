@@ -2,7 +2,8 @@ import logging
 from datetime import datetime
 from typing import List
 
-from sqlalchemy.sql import and_
+from sqlalchemy import delete, insert, update
+from sqlalchemy.sql import and_, or_
 
 from dataall.base.db import exceptions
 from dataall.core.activity.db.activity_models import Activity
@@ -40,6 +41,7 @@ class DatasetTableRepository:
             GlueTableName=table['Name'],
             LastGlueTableStatus='InSync',
             GlueTableProperties=json_utils.to_json(table.get('Parameters', {})),
+            GlueTableVersion=DatasetTableRepository.glue_table_version(table),
         )
         session.add(updated_table)
         session.commit()
@@ -67,8 +69,9 @@ class DatasetTableRepository:
 
     @staticmethod
     def update_existing_tables_status(existing_tables, glue_tables, session):
+        glue_table_names = {t['Name'] for t in glue_tables}
         for existing_table in existing_tables:
-            if existing_table.GlueTableName not in [t['Name'] for t in glue_tables]:
+            if existing_table.GlueTableName not in glue_table_names:
                 existing_table.LastGlueTableStatus = 'Deleted'
                 logger.info(f'Existing Table {existing_table.GlueTableName} status set to Deleted from Glue')
                 # Once the table item is deleted from glue and no longer part of the dataset
@@ -93,10 +96,7 @@ class DatasetTableRepository:
                     )
                     session.add(activity)
                     session.delete(share_object_item)
-            elif (
-                existing_table.GlueTableName in [t['Name'] for t in glue_tables]
-                and existing_table.LastGlueTableStatus == 'Deleted'
-            ):
+            elif existing_table.LastGlueTableStatus == 'Deleted':
                 existing_table.LastGlueTableStatus = 'InSync'
                 logger.info(
                     f'Updating Existing Table {existing_table.GlueTableName} status set to InSync from Deleted after found in Glue'
@@ -115,6 +115,35 @@ class DatasetTableRepository:
             .all()
         )
 
+    @staticmethod
+    def find_all_active_tables_of_datasets(session, dataset_uris):
+        return (
+            session.query(DatasetTable)
+            .filter(
+                and_(
+                    DatasetTable.datasetUri.in_(dataset_uris),
+                    DatasetTable.LastGlueTableStatus != 'Deleted',
+                )
+            )
+            .all()
+        )
+
+    @staticmethod
+    def find_tables_changed_since(session, since, table_uris=None):
+        """Returns the tables created, updated or deleted since the given time and the tables in table_uris"""
+        return (
+            session.query(DatasetTable)
+            .filter(
+                or_(
+                    DatasetTable.created > since,
+                    DatasetTable.updated > since,
+                    DatasetTable.deleted > since,
+                    DatasetTable.tableUri.in_(table_uris or []),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def find_all_deleted_tables(session, dataset_uri):
         return (
@@ -129,9 +158,19 @@ class DatasetTableRepository:
         )
 
     @staticmethod
-    def sync_table_columns(session, dataset_table, glue_table):
-        DatasetTableRepository.delete_all_table_columns(session, dataset_table)
+    def glue_table_version(glue_table: dict):
+        """Fingerprint of the Glue table definition, it changes whenever the table is updated in Glue"""
+        if not glue_table.get('VersionId') and not glue_table.get('UpdateTime'):
+            return None
+        update_time = glue_table.get('UpdateTime')
+        return f'{glue_table.get("VersionId")}/{update_time.isoformat() if update_time else None}'
 
+    @staticmethod
+    def sync_table_columns(session, dataset_table, glue_table):
+        """
+        Updates the columns of the table to match the Glue table, computing the columns to insert, update and
+        delete by name instead of deleting and re-creating all of them. Columns keep their uri when they still exist
+        """
         columns = [
             {**item, **{'columnType': 'column'}} for item in glue_table.get('StorageDescriptor', {}).get('Columns', [])
         ]
@@ -143,32 +182,56 @@ class DatasetTableRepository:
         logger.debug(f'Found columns {columns} for table {dataset_table}')
         logger.debug(f'Found partitions {partitions} for table {dataset_table}')
 
+        existing = {}
+        deleted = []
+        for column in session.query(DatasetTableColumn).filter(DatasetTableColumn.tableUri == dataset_table.tableUri):
+            if column.name in existing:
+                deleted.append(column.columnUri)
+            else:
+                existing[column.name] = column
+
+        inserted = []
+        updated = []
         for col in columns + partitions:
-            table_col = DatasetTableColumn(
-                name=col['Name'],
+            values = dict(
                 description=col.get('Comment', 'No description provided'),
-                label=col['Name'],
-                owner=dataset_table.owner,
-                datasetUri=dataset_table.datasetUri,
-                tableUri=dataset_table.tableUri,
-                AWSAccountId=dataset_table.AWSAccountId,
-                GlueDatabaseName=dataset_table.GlueDatabaseName,
-                GlueTableName=dataset_table.GlueTableName,
-                region=dataset_table.region,
                 typeName=col['Type'],
                 columnType=col['columnType'],
             )
-            session.add(table_col)
+            column = existing.pop(col['Name'], None)
+            if column is None:
+                inserted.append(
+                    dict(
+                        values,
+                        name=col['Name'],
+                        label=col['Name'],
+                        owner=dataset_table.owner,
+                        datasetUri=dataset_table.datasetUri,
+                        tableUri=dataset_table.tableUri,
+                        AWSAccountId=dataset_table.AWSAccountId,
+                        GlueDatabaseName=dataset_table.GlueDatabaseName,
+                        GlueTableName=dataset_table.GlueTableName,
+                        region=dataset_table.region,
+                    )
+                )
+            elif any(getattr(column, key) != value for key, value in values.items()):
+                updated.append(dict(values, columnUri=column.columnUri))
+        deleted.extend(column.columnUri for column in existing.values())
 
-    @staticmethod
-    def delete_all_table_columns(session, dataset_table):
-        session.query(DatasetTableColumn).filter(
-            and_(
-                DatasetTableColumn.GlueDatabaseName == dataset_table.GlueDatabaseName,
-                DatasetTableColumn.GlueTableName == dataset_table.GlueTableName,
+        logger.info(
+            f'Syncing columns of table {dataset_table.tableUri}: '
+            f'{len(inserted)} new, {len(updated)} updated, {len(deleted)} deleted'
+        )
+        if deleted:
+            session.execute(
+                delete(DatasetTableColumn)
+                .where(DatasetTableColumn.columnUri.in_(deleted))
+                .execution_options(synchronize_session=False)
             )
-        ).delete()
-        session.commit()
+        if updated:
+            session.execute(update(DatasetTableColumn), updated)
+        if inserted:
+            session.execute(insert(DatasetTableColumn), inserted)
 
     @staticmethod
     def get_table_by_s3_prefix(session, s3_prefix, accountid, region):
@@ -1,11 +1,16 @@
 import logging
 
+from datetime import datetime
 from typing import List
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
 from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
+from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.s3_datasets.db.dataset_models import S3Dataset
+from dataall.modules.vote.db.vote_repositories import VoteRepository
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 
 log = logging.getLogger(__name__)
@@ -19,16 +24,63 @@ class DatasetCatalogIndexer(CatalogIndexer):
 
     def index(self, session) -> List[str]:
         all_datasets: List[S3Dataset] = DatasetRepository.list_all_active_datasets(session)
-        all_dataset_uris = []
         log.info(f'Found {len(all_datasets)} datasets')
-        for dataset in all_datasets:
-            tables = DatasetTableIndexer.upsert_all(session, dataset.datasetUri)
-            all_dataset_uris += [table.tableUri for table in tables]
+        return self._index_datasets(session, all_datasets)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        glossary_targets = BaseIndexer._get_targets_with_glossary_changes(session, since)
+        changed_datasets = DatasetRepository.list_datasets_changed_since(session, since)
+        changed_tables = DatasetTableRepository.find_tables_changed_since(session, since, glossary_targets)
+        changed_folders = DatasetLocationRepository.list_folders_changed_since(session, since, glossary_targets)
+
+        deleted_uris = [dataset.datasetUri for dataset in changed_datasets if dataset.deleted]
+        deleted_uris += [table.tableUri for table in changed_tables if table.LastGlueTableStatus == 'Deleted']
+        for uri in deleted_uris:
+            BaseIndexer.delete_doc(doc_id=uri)
+
+        # dataset attributes are copied to the documents of all its tables and folders
+        reindexed = {dataset.datasetUri for dataset in changed_datasets if not dataset.deleted}
+        tables = DatasetTableRepository.find_all_active_tables_of_datasets(session, reindexed) + [
+            table
+            for table in changed_tables
+            if table.LastGlueTableStatus != 'Deleted' and table.datasetUri not in reindexed
+        ]
+        folders = DatasetLocationRepository.list_datasets_folders(session, reindexed) + [
+            folder for folder in changed_folders if folder.datasetUri not in reindexed
+        ]
+
+        # dataset documents hold the glossary terms, the upvotes and the number of tables and folders
+        dataset_uris = (
+            reindexed
+            | glossary_targets
+            | VoteRepository.list_targets_voted_since(session, since, target_type='dataset')
+            | {table.datasetUri for table in changed_tables}
+            | {folder.datasetUri for folder in changed_folders}
+        )
+        datasets = DatasetRepository.list_active_datasets_by_uris(session, dataset_uris)
+        log.info(
+            f'Found {len(datasets)} datasets, {len(tables)} tables and {len(folders)} folders changed, '
+            f'{len(deleted_uris)} deleted since {since}'
+        )
+        return self._index_datasets(session, datasets, tables=tables, folders=folders)
+
+    @staticmethod
+    def _index_datasets(session, all_datasets, tables=None, folders=None) -> List[str]:
+        """Indexes the datasets and the given tables and folders of them, by default all of them"""
+        all_dataset_uris = []
+        for datasets in BaseIndexer._batches(all_datasets):
+            environments = BaseIndexer._get_environments(session, [dataset.environmentUri for dataset in datasets])
+            batch = {dataset.datasetUri for dataset in datasets}
+
+            tables_batch = None if tables is None else [table for table in tables if table.datasetUri in batch]
+            tables_batch = DatasetTableIndexer.upsert_many(session, datasets, environments, tables=tables_batch)
+            all_dataset_uris += [table.tableUri for table in tables_batch]
 
-            folders = DatasetLocationIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-            all_dataset_uris += [folder.locationUri for folder in folders]
+            folders_batch = None if folders is None else [folder for folder in folders if folder.datasetUri in batch]
+            folders_batch = DatasetLocationIndexer.upsert_many(session, datasets, environments, folders=folders_batch)
+            all_dataset_uris += [folder.locationUri for folder in folders_batch]
 
-            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
-            all_dataset_uris.append(dataset.datasetUri)
+            DatasetIndexer.upsert_many(session, datasets, environments)
+            all_dataset_uris += [dataset.datasetUri for dataset in datasets]
 
         return all_dataset_uris
@@ -1,12 +1,14 @@
 """Indexes Datasets in OpenSearch"""
 
 import re
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.s3_datasets.db.dataset_models import S3Dataset
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
@@ -26,30 +28,60 @@ class DatasetIndexer(BaseIndexer):
             glossary = BaseIndexer._get_target_glossary_terms(session, dataset_uri)
             BaseIndexer._index(
                 doc_id=dataset_uri,
-                doc={
-                    'name': dataset.name,
-                    'owner': dataset.owner,
-                    'label': dataset.label,
-                    'admins': dataset.SamlAdminGroupName,
-                    'database': dataset.GlueDatabaseName,
-                    'source': dataset.S3BucketName,
-                    'resourceKind': 'dataset',
-                    'description': dataset.description,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [t.replace('-', '') for t in dataset.tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dataset.created,
-                    'updated': dataset.updated,
-                    'deleted': dataset.deleted,
-                    'glossary': glossary,
-                    'tables': count_tables,
-                    'folders': count_folders,
-                    'upvotes': count_upvotes,
-                },
+                doc=cls._build_document(dataset, env, org, glossary, count_tables, count_folders, count_upvotes),
             )
         return dataset
+
+    @classmethod
+    def upsert_many(cls, session, datasets: List[S3Dataset], environments) -> List[S3Dataset]:
+        """Indexes the datasets, environments maps environmentUri to the (environment, organization) pair"""
+        dataset_uris = [dataset.datasetUri for dataset in datasets]
+        tables = DatasetRepository.count_tables_by_dataset(session, dataset_uris)
+        folders = DatasetLocationRepository.count_locations_by_dataset(session, dataset_uris)
+        upvotes = VoteRepository.count_upvotes_by_target(session, dataset_uris, target_type='dataset')
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, dataset_uris)
+
+        for dataset in datasets:
+            uri = dataset.datasetUri
+            env, org = environments[dataset.environmentUri]
+            BaseIndexer._index(
+                doc_id=uri,
+                doc=cls._build_document(
+                    dataset,
+                    env,
+                    org,
+                    glossaries.get(uri, []),
+                    tables.get(uri, 0),
+                    folders.get(uri, 0),
+                    upvotes.get(uri, 0),
+                ),
+            )
+        return datasets
+
+    @staticmethod
+    def _build_document(dataset, env, org, glossary, count_tables, count_folders, count_upvotes) -> dict:
+        return {
+            'name': dataset.name,
+            'owner': dataset.owner,
+            'label': dataset.label,
+            'admins': dataset.SamlAdminGroupName,
+            'database': dataset.GlueDatabaseName,
+            'source': dataset.S3BucketName,
+            'resourceKind': 'dataset',
+            'description': dataset.description,
+            'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+            'tags': [t.replace('-', '') for t in dataset.tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': dataset.created,
+            'updated': dataset.updated,
+            'deleted': dataset.deleted,
+            'glossary': glossary,
+            'tables': count_tables,
+            'folders': count_folders,
+            'upvotes': count_upvotes,
+        }
@@ -1,10 +1,12 @@
 """Indexes DatasetStorageLocation in OpenSearch"""
 
 import re
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.s3_datasets.db.dataset_models import DatasetStorageLocation, S3Dataset
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
@@ -19,32 +21,7 @@ class DatasetLocationIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, folder_uri)
-
-            BaseIndexer._index(
-                doc_id=folder_uri,
-                doc={
-                    'name': folder.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': folder.owner,
-                    'label': folder.label,
-                    'resourceKind': 'folder',
-                    'description': folder.description,
-                    'source': dataset.S3BucketName,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [f.replace('-', '') for f in folder.tags or []],
-                    'topics': dataset.topics,
-                    'region': folder.region.replace('-', ''),
-                    'datasetUri': folder.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': folder.created,
-                    'updated': folder.updated,
-                    'deleted': folder.deleted,
-                    'glossary': glossary,
-                },
-            )
+            BaseIndexer._index(doc_id=folder_uri, doc=cls._build_document(folder, dataset, env, org, glossary))
         return folder
 
     @classmethod
@@ -53,8 +30,56 @@ class DatasetLocationIndexer(BaseIndexer):
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, [folder.locationUri for folder in folders])
         for folder in folders:
-            DatasetLocationIndexer.upsert(
-                session=session, folder_uri=folder.locationUri, dataset=dataset, env=env, org=org
+            BaseIndexer._index(
+                doc_id=folder.locationUri,
+                doc=cls._build_document(folder, dataset, env, org, glossaries.get(folder.locationUri, [])),
             )
         return folders
+
+    @classmethod
+    def upsert_many(
+        cls, session, datasets: List[S3Dataset], environments, folders=None
+    ) -> List[DatasetStorageLocation]:
+        """
+        Indexes the given folders of the datasets, by default all their folders.
+        environments maps environmentUri to the (environment, organization) of the datasets
+        """
+        datasets = {dataset.datasetUri: dataset for dataset in datasets}
+        if folders is None:
+            folders = DatasetLocationRepository.list_datasets_folders(session, list(datasets))
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, [folder.locationUri for folder in folders])
+        for folder in folders:
+            dataset = datasets[folder.datasetUri]
+            env, org = environments[dataset.environmentUri]
+            BaseIndexer._index(
+                doc_id=folder.locationUri,
+                doc=cls._build_document(folder, dataset, env, org, glossaries.get(folder.locationUri, [])),
+            )
+        return folders
+
+    @staticmethod
+    def _build_document(folder, dataset, env, org, glossary) -> dict:
+        return {
+            'name': folder.name,
+            'admins': dataset.SamlAdminGroupName,
+            'owner': folder.owner,
+            'label': folder.label,
+            'resourceKind': 'folder',
+            'description': folder.description,
+            'source': dataset.S3BucketName,
+            'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+            'tags': [f.replace('-', '') for f in folder.tags or []],
+            'topics': dataset.topics,
+            'region': folder.region.replace('-', ''),
+            'datasetUri': folder.datasetUri,
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': folder.created,
+            'updated': folder.updated,
+            'deleted': folder.deleted,
+            'glossary': glossary,
+        }
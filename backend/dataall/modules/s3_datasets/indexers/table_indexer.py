@@ -1,10 +1,12 @@
 """Indexes DatasetTable in OpenSearch"""
 
 import re
+from typing import List
 
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
@@ -20,34 +22,7 @@ class DatasetTableIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
-
-            tags = table.tags if table.tags else []
-            BaseIndexer._index(
-                doc_id=table_uri,
-                doc={
-                    'name': table.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': table.owner,
-                    'label': table.label,
-                    'resourceKind': 'table',
-                    'description': table.description,
-                    'database': table.GlueDatabaseName,
-                    'source': table.S3BucketName,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [t.replace('-', '') for t in tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'datasetUri': table.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': table.created,
-                    'updated': table.updated,
-                    'deleted': table.deleted,
-                    'glossary': glossary,
-                },
-            )
+            BaseIndexer._index(doc_id=table_uri, doc=cls._build_document(table, dataset, env, org, glossary))
         return table
 
     @classmethod
@@ -56,8 +31,31 @@ class DatasetTableIndexer(BaseIndexer):
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, [table.tableUri for table in tables])
+        for table in tables:
+            BaseIndexer._index(
+                doc_id=table.tableUri,
+                doc=cls._build_document(table, dataset, env, org, glossaries.get(table.tableUri, [])),
+            )
+        return tables
+
+    @classmethod
+    def upsert_many(cls, session, datasets: List[S3Dataset], environments, tables=None) -> List[DatasetTable]:
+        """
+        Indexes the given tables of the datasets, by default all their active tables.
+        environments maps environmentUri to the (environment, organization) of the datasets
+        """
+        datasets = {dataset.datasetUri: dataset for dataset in datasets}
+        if tables is None:
+            tables = DatasetTableRepository.find_all_active_tables_of_datasets(session, list(datasets))
+        glossaries = BaseIndexer._get_targets_glossary_terms(session, [table.tableUri for table in tables])
         for table in tables:
-            DatasetTableIndexer.upsert(session=session, table_uri=table.tableUri, dataset=dataset, env=env, org=org)
+            dataset = datasets[table.datasetUri]
+            env, org = environments[dataset.environmentUri]
+            BaseIndexer._index(
+                doc_id=table.tableUri,
+                doc=cls._build_document(table, dataset, env, org, glossaries.get(table.tableUri, [])),
+            )
         return tables
 
     @classmethod
@@ -66,3 +64,29 @@ class DatasetTableIndexer(BaseIndexer):
         for table in tables:
             cls.delete_doc(doc_id=table.tableUri)
         return tables
+
+    @staticmethod
+    def _build_document(table, dataset, env, org, glossary) -> dict:
+        return {
+            'name': table.name,
+            'admins': dataset.SamlAdminGroupName,
+            'owner': table.owner,
+            'label': table.label,
+            'resourceKind': 'table',
+            'description': table.description,
+            'database': table.GlueDatabaseName,
+            'source': table.S3BucketName,
+            'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+            'tags': [t.replace('-', '') for t in table.tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'datasetUri': table.datasetUri,
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': table.created,
+            'updated': table.updated,
+            'deleted': table.deleted,
+            'glossary': glossary,
+        }
@@ -155,19 +155,24 @@ class DatasetTableService:
         dataset: S3Dataset = DatasetRepository.get_dataset_by_uri(session, uri)
         if dataset:
             existing_tables = DatasetTableRepository.find_dataset_tables(session, uri)
-            existing_table_names = [e.GlueTableName for e in existing_tables]
+            existing_table_names = {e.GlueTableName for e in existing_tables}
             existing_dataset_tables_map = {t.GlueTableName: t for t in existing_tables}
             DatasetTableRepository.update_existing_tables_status(existing_tables, glue_tables, session)
-            log.info(f'existing_tables={glue_tables}')
+            log.debug(f'existing_tables={glue_tables}')
             for table in glue_tables:
                 if table['Name'] not in existing_table_names:
                     log.info(f'Storing new table: {table} for dataset db {dataset.GlueDatabaseName}')
                     updated_table = DatasetTableRepository.create_synced_table(session, dataset, table)
                     DatasetTableService._attach_dataset_table_permission(session, dataset, updated_table.tableUri)
                 else:
-                    log.info(f'Updating table: {table} for dataset db {dataset.GlueDatabaseName}')
                     updated_table: DatasetTable = existing_dataset_tables_map.get(table['Name'])
+                    version = DatasetTableRepository.glue_table_version(table)
+                    if version and version == updated_table.GlueTableVersion:
+                        log.debug(f'Table {table["Name"]} not changed since version {version}, skipping...')
+                        continue
+                    log.info(f'Updating table: {table} for dataset db {dataset.GlueDatabaseName}')
                     updated_table.GlueTableProperties = json_utils.to_json(table.get('Parameters', {}))
+                    updated_table.GlueTableVersion = version
 
                 DatasetTableRepository.sync_table_columns(session, updated_table, table)
 
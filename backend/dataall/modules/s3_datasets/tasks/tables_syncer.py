@@ -1,6 +1,11 @@
 import logging
 import os
 import sys
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from operator import and_
 
 from dataall.base.aws.sts import SessionHelper
@@ -19,59 +24,130 @@ from dataall.modules.s3_datasets.services.dataset_alarm_service import DatasetAl
 log = logging.getLogger(__name__)
 
 
-def sync_tables(engine):
+@dataclass
+class AccountSyncSummary:
+    account: str
+    datasets: int = 0
+    tables: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+
+def sync_tables(engine, max_workers: int = None, shard_index: int = None, shard_count: int = None):
+    """
+    Synchronizes the tables of all active datasets. Datasets are grouped by AWS account and the accounts are
+    processed by a pool of threads, the datasets of an account one after the other to stay within the API limits
+    of the account. Each worker uses its own DB session.
+    The accounts can be split between several ECS tasks with TABLES_SYNCER_SHARD_INDEX/TABLES_SYNCER_SHARD_COUNT
+    """
+    max_workers = max_workers or int(os.getenv('TABLES_SYNCER_MAX_WORKERS', 4))
+    shard_index = int(os.getenv('TABLES_SYNCER_SHARD_INDEX', 0)) if shard_index is None else shard_index
+    shard_count = int(os.getenv('TABLES_SYNCER_SHARD_COUNT', 1)) if shard_count is None else shard_count
+
+    accounts = defaultdict(list)
     with engine.scoped_session() as session:
-        processed_tables = []
         all_datasets: [S3Dataset] = DatasetRepository.list_all_active_datasets(session)
         log.info(f'Found {len(all_datasets)} datasets for tables sync')
-        dataset: S3Dataset
         for dataset in all_datasets:
-            log.info(f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables')
-            env: Environment = (
-                session.query(Environment)
-                .filter(
-                    and_(
-                        Environment.environmentUri == dataset.environmentUri,
-                        Environment.deleted.is_(None),
-                    )
-                )
-                .first()
-            )
-            env_group: EnvironmentGroup = EnvironmentService.get_environment_group(
-                session, dataset.SamlAdminGroupName, env.environmentUri
+            if account_shard(dataset.AwsAccountId, shard_count) == shard_index:
+                accounts[dataset.AwsAccountId].append(dataset.datasetUri)
+    log.info(
+        f'Shard {shard_index}/{shard_count} synchronizes {sum(len(uris) for uris in accounts.values())} datasets '
+        f'of {len(accounts)} accounts with {max_workers} workers'
+    )
+
+    processed_tables = []
+    summaries = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tables-syncer') as executor:
+        futures = [
+            executor.submit(sync_account_tables, engine, account, dataset_uris)
+            for account, dataset_uris in accounts.items()
+        ]
+        for future in as_completed(futures):
+            tables, summary = future.result()
+            processed_tables.extend(tables)
+            summaries.append(summary)
+
+    log_summary(summaries)
+    return processed_tables
+
+
+def account_shard(account_id: str, shard_count: int) -> int:
+    return zlib.crc32(account_id.encode()) % shard_count if shard_count > 1 else 0
+
+
+def sync_account_tables(engine, account: str, dataset_uris: [str]):
+    started = time.monotonic()
+    summary = AccountSyncSummary(account=account, datasets=len(dataset_uris))
+    processed_tables = []
+    with engine.thread_session() as session:
+        for dataset_uri in dataset_uris:
+            dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+            tables = sync_dataset_tables(session, dataset)
+            if tables is None:
+                summary.failed += 1
+            else:
+                processed_tables.extend(tables)
+    summary.tables = len(processed_tables)
+    summary.elapsed = time.monotonic() - started
+    return processed_tables, summary
+
+
+def sync_dataset_tables(session, dataset: S3Dataset):
+    """Returns the tables of the dataset, or None if the dataset could not be synchronized"""
+    log.info(f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables')
+    env: Environment = (
+        session.query(Environment)
+        .filter(
+            and_(
+                Environment.environmentUri == dataset.environmentUri,
+                Environment.deleted.is_(None),
             )
-            try:
-                if not env or not is_assumable_pivot_role(env):
-                    log.info(f'Dataset {dataset.GlueDatabaseName} has an invalid environment')
-                else:
-                    tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
-
-                    log.info(f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}')
-
-                    DatasetTableService.sync_existing_tables(session, uri=dataset.datasetUri, glue_tables=tables)
-
-                    tables = session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset.datasetUri).all()
-
-                    log.info('Updating tables permissions on Lake Formation...')
-
-                    for table in tables:
-                        LakeFormationTableClient(table).grant_principals_all_table_permissions(
-                            principals=[
-                                SessionHelper.get_delegation_role_arn(env.AwsAccountId, env.region),
-                                env_group.environmentIAMRoleArn,
-                            ],
-                        )
-
-                    processed_tables.extend(tables)
-
-                    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-                    DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
-            except Exception as e:
-                log.error(
-                    f'Failed to sync tables for dataset {dataset.AwsAccountId}/{dataset.GlueDatabaseName} due to: {e}'
-                )
-                DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
-        return processed_tables
+        )
+        .first()
+    )
+    try:
+        if not env or not is_assumable_pivot_role(env):
+            log.info(f'Dataset {dataset.GlueDatabaseName} has an invalid environment')
+            return None
+
+        env_group: EnvironmentGroup = EnvironmentService.get_environment_group(
+            session, dataset.SamlAdminGroupName, env.environmentUri
+        )
+        tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
+
+        log.info(f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}')
+
+        DatasetTableService.sync_existing_tables(session, uri=dataset.datasetUri, glue_tables=tables)
+
+        tables = session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset.datasetUri).all()
+
+        log.info('Updating tables permissions on Lake Formation...')
+
+        LakeFormationTableClient.grant_principals_all_tables_permissions(
+            tables=tables,
+            principals=[
+                SessionHelper.get_delegation_role_arn(env.AwsAccountId, env.region),
+                env_group.environmentIAMRoleArn,
+            ],
+        )
+
+        DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
+        DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+        return tables
+    except Exception as e:
+        log.error(f'Failed to sync tables for dataset {dataset.AwsAccountId}/{dataset.GlueDatabaseName} due to: {e}')
+        DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
+        return None
+
+
+def log_summary(summaries: [AccountSyncSummary]):
+    log.info('Tables sync summary per account (slowest first):')
+    for summary in sorted(summaries, key=lambda s: s.elapsed, reverse=True):
+        log.info(
+            f'account={summary.account} datasets={summary.datasets} failed={summary.failed} '
+            f'tables={summary.tables} elapsed={summary.elapsed:.1f}s'
+        )
 
 
 def is_assumable_pivot_role(env: Environment):
@@ -54,7 +54,11 @@ class S3DatasetsSharesApiModuleInterface(ModuleInterface):
 
         ShareProcessorManager.register_processor(
             ShareProcessorDefinition(
-                ShareableType.Table, ProcessLakeFormationShare, DatasetTable, DatasetTable.tableUri
+                ShareableType.Table,
+                ProcessLakeFormationShare,
+                DatasetTable,
+                DatasetTable.tableUri,
+                concurrent=True,
             )
         )
         ShareProcessorManager.register_processor(
@@ -146,7 +150,11 @@ class S3DatasetsSharesECSShareModuleInterface(ModuleInterface):
 
         ShareProcessorManager.register_processor(
             ShareProcessorDefinition(
-                ShareableType.Table, ProcessLakeFormationShare, DatasetTable, DatasetTable.tableUri
+                ShareableType.Table,
+                ProcessLakeFormationShare,
+                DatasetTable,
+                DatasetTable.tableUri,
+                concurrent=True,
             )
         )
         ShareProcessorManager.register_processor(
@@ -3,8 +3,8 @@ from typing import List
 import time
 
 from botocore.exceptions import ClientError
-from retrying import Retrying
 
+from dataall.base.aws.lakeformation import LakeFormationBatch
 from dataall.base.aws.sts import SessionHelper
 
 log = logging.getLogger('aws:lakeformation')
@@ -12,8 +12,7 @@ log = logging.getLogger('aws:lakeformation')
 
 class LakeFormationClient:
     def __init__(self, account_id, region):
-        self._session = SessionHelper.remote_session(accountid=account_id, region=region)
-        self._client = self._session.client('lakeformation', region_name=region)
+        self._client = SessionHelper.remote_client(accountid=account_id, region=region, service_name='lakeformation')
 
     def upgrade_lakeformation_data_catalog_settings(self, version_num=3):
         """
@@ -141,53 +140,48 @@ class LakeFormationClient:
         permissions_with_grant_options: List = None,
         check_resource: dict = None,
     ) -> True:
+        existing = self._list_permissions_by_principal(check_resource if check_resource else resource)
+        batch = LakeFormationBatch(self._client)
+        granted = []
         for principal in principals:
-            try:
-                if not self._check_permissions_to_resource(
-                    principal=principal,
-                    resource=resource,
-                    permissions=permissions,
-                    permissions_with_grant_options=permissions_with_grant_options,
-                    check_resource=check_resource,
-                ):
-                    log.info(f'Granting principal {principal} permissions {permissions} to {str(resource)}...')
-                    # We define the grant with "permissions" instead of "missing_permissions" because we want to avoid
-                    # duplicates done by data.all, but we want to avoid dependencies with external grants
-                    grant_dict = dict(
-                        Principal={'DataLakePrincipalIdentifier': principal},
-                        Resource=resource,
-                        Permissions=permissions,
-                    )
-                    if permissions_with_grant_options:
-                        grant_dict['PermissionsWithGrantOption'] = permissions_with_grant_options
-
-                    response = Retrying(
-                        retry_on_exception=lambda ex: isinstance(
-                            ex, self._client.exceptions.ConcurrentModificationException
-                        ),
-                        stop_max_attempt_number=5,
-                        wait_random_min=1000,
-                        wait_random_max=3000,
-                    ).call(self._client.grant_permissions, **grant_dict)
-
-                    log.info(
-                        f'Successfully granted principal {principal} '
-                        f'permissions {permissions} '
-                        f'and permissions with grant options {permissions_with_grant_options} '
-                        f'to {str(resource)}  '
-                        f'response: {response}'
-                    )
-                    time.sleep(2)
-
-            except ClientError as e:
-                log.error(
-                    f'Could not grant principal {principal} '
+            if self._has_permissions(existing, principal, permissions, permissions_with_grant_options):
+                log.info(
+                    f'Already granted principal {principal} '
                     f'permissions {permissions} '
                     f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)}  '
-                    f'due to: {e}'
+                    f'to {str(resource)}'
                 )
-                raise e
+                continue
+            log.info(f'Granting principal {principal} permissions {permissions} to {str(resource)}...')
+            # We define the grant with "permissions" instead of "missing_permissions" because we want to avoid
+            # duplicates done by data.all, but we want to avoid dependencies with external grants
+            batch.grant(principal, resource, permissions, permissions_with_grant_options)
+            granted.append(principal)
+
+        if not granted:
+            return True
+        try:
+            failures = batch.flush()
+        except ClientError as e:
+            log.error(f'Could not grant principals {granted} permissions {permissions} to {str(resource)} due to: {e}')
+            raise e
+        for failure in failures:
+            log.error(
+                f'Could not grant principal {failure.principal} '
+                f'permissions {permissions} '
+                f'and permissions with grant options {permissions_with_grant_options} '
+                f'to {str(resource)}  '
+                f'due to: {failure.code} {failure.message}'
+            )
+        if failures:
+            raise failures[0].to_client_error()
+        log.info(
+            f'Successfully granted principals {granted} '
+            f'permissions {permissions} '
+            f'and permissions with grant options {permissions_with_grant_options} '
+            f'to {str(resource)}'
+        )
+        time.sleep(2)
         return True
 
     def revoke_permissions_to_database(
@@ -261,58 +255,59 @@ class LakeFormationClient:
     def _revoke_permissions_from_resource(
         self, principals, resource, permissions, permissions_with_grant_options=None
     ) -> True:
+        batch = LakeFormationBatch(self._client)
         for principal in principals:
-            try:
-                log.info(
-                    f'Revoking principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)}... '
-                )
-                revoke_dict = dict(
-                    Principal={'DataLakePrincipalIdentifier': principal},
-                    Resource=resource,
-                    Permissions=permissions,
-                )
-                if permissions_with_grant_options:
-                    revoke_dict['PermissionsWithGrantOption'] = permissions_with_grant_options
+            log.info(
+                f'Revoking principal {principal} '
+                f'permissions {permissions} '
+                f'and permissions with grant options {permissions_with_grant_options} '
+                f'to {str(resource)}... '
+            )
+            batch.revoke(principal, resource, permissions, permissions_with_grant_options)
+        try:
+            failures = batch.flush()
+        except ClientError as e:
+            log.error(
+                f'Failed revoking principals {principals} permissions {permissions} to {str(resource)} due to: {e}'
+            )
+            raise e
 
-                response = self._client.revoke_permissions(**revoke_dict)
-                log.info(
-                    f'Successfully revoked principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)} '
-                    f'response: {response}'
-                )
-                time.sleep(2)
-            except ClientError as error:
-                response = error.response
-                if not (
-                    response['Error']['Code'] == 'InvalidInputException'
-                    and (
-                        'Grantee has no permissions' in response['Error']['Message']
-                        or 'No permissions revoked' in response['Error']['Message']
-                        or 'not found' in response['Error']['Message']
-                    )
-                ):
-                    log.error(
-                        f'Failed revoking principal {principal} '
-                        f'permissions {permissions} '
-                        f'and permissions with grant options {permissions_with_grant_options} '
-                        f'to {str(resource)} '
-                        f'due to: {error}'
-                    )
-                    raise error
+        errors = []
+        for failure in failures:
+            if self._is_already_revoked(failure.code, failure.message):
                 log.warning(
-                    f'Principal {principal} already has revoked'
+                    f'Principal {failure.principal} already has revoked'
                     f'permissions {permissions} '
                     f'and permissions with grant options {permissions_with_grant_options} '
                     f'to {str(resource)} '
-                    f'response error: {error}'
+                    f'response error: {failure.message}'
                 )
+                continue
+            log.error(
+                f'Failed revoking principal {failure.principal} '
+                f'permissions {permissions} '
+                f'and permissions with grant options {permissions_with_grant_options} '
+                f'to {str(resource)} '
+                f'due to: {failure.code} {failure.message}'
+            )
+            errors.append(failure.to_client_error())
+        if errors:
+            raise errors[0]
+        log.info(
+            f'Successfully revoked principals {principals} '
+            f'permissions {permissions} '
+            f'and permissions with grant options {permissions_with_grant_options} '
+            f'to {str(resource)}'
+        )
+        time.sleep(2)
         return True
 
+    @staticmethod
+    def _is_already_revoked(code, message) -> bool:
+        return code == 'InvalidInputException' and (
+            'Grantee has no permissions' in message or 'No permissions revoked' in message or 'not found' in message
+        )
+
     def check_permissions_to_database(
         self,
         principals,
@@ -322,12 +317,7 @@ class LakeFormationClient:
         resource = {
             'Database': {'Name': database_name},
         }
-        check = []
-        for principal in principals:
-            check.append(
-                self._check_permissions_to_resource(principal=principal, resource=resource, permissions=permissions)
-            )
-        return all(check)
+        return self._check_permissions_to_resource(principals=principals, resource=resource, permissions=permissions)
 
     def check_permissions_to_table(
         self,
@@ -345,17 +335,12 @@ class LakeFormationClient:
                 'CatalogId': catalog_id,
             }
         }
-        check = []
-        for principal in principals:
-            check.append(
-                self._check_permissions_to_resource(
-                    principal=principal,
-                    resource=resource,
-                    permissions=permissions,
-                    permissions_with_grant_options=permissions_with_grant_options,
-                )
-            )
-        return all(check)
+        return self._check_permissions_to_resource(
+            principals=principals,
+            resource=resource,
+            permissions=permissions,
+            permissions_with_grant_options=permissions_with_grant_options,
+        )
 
     def check_permissions_to_table_with_columns(
         self,
@@ -381,87 +366,67 @@ class LakeFormationClient:
                 'CatalogId': catalog_id,
             }
         }
-        check = []
-        for principal in principals:
-            check.append(
-                self._check_permissions_to_resource(
-                    principal=principal,
-                    resource=resource,
-                    permissions=permissions,
-                    permissions_with_grant_options=permissions_with_grant_options,
-                    check_resource=check_resource,
-                )
-            )
-        return all(check)
+        return self._check_permissions_to_resource(
+            principals=principals,
+            resource=resource,
+            permissions=permissions,
+            permissions_with_grant_options=permissions_with_grant_options,
+            check_resource=check_resource,
+        )
 
     def check_permissions_to_table_with_filters(
         self, principals, database_name, table_name, catalog_id, permissions, data_filters=[]
     ) -> True:
         check = []
-        for principal in principals:
-            for f_name in data_filters:
-                data_filter_resource = {
-                    'DataCellsFilter': {
-                        'TableCatalogId': catalog_id,
-                        'DatabaseName': database_name,
-                        'TableName': table_name,
-                        'Name': f_name,
-                    },
-                }
-                check.append(
-                    self._check_permissions_to_resource(
-                        principal=principal,
-                        resource=data_filter_resource,
-                        permissions=permissions,
-                        permissions_with_grant_options=None,
-                        check_resource=data_filter_resource,
-                    )
+        for f_name in data_filters:
+            data_filter_resource = {
+                'DataCellsFilter': {
+                    'TableCatalogId': catalog_id,
+                    'DatabaseName': database_name,
+                    'TableName': table_name,
+                    'Name': f_name,
+                },
+            }
+            check.append(
+                self._check_permissions_to_resource(
+                    principals=principals,
+                    resource=data_filter_resource,
+                    permissions=permissions,
+                    permissions_with_grant_options=None,
+                    check_resource=data_filter_resource,
                 )
+            )
         return all(check)
 
     def _check_permissions_to_resource(
         self,
-        principal: str,
+        principals: List,
         resource: dict,
         permissions: List,
         permissions_with_grant_options: List = None,
         check_resource: dict = None,
     ) -> bool:
-        try:
-            log.info(f'Checking principal {principal} permissions {permissions} to {str(resource)}...')
-            check_dict = dict(
-                Principal={'DataLakePrincipalIdentifier': principal},
-                Resource=check_resource if check_resource else resource,
-            )
-
-            # Cannot Specify Filter by Principal for Data Filter List Permissions
-            if 'DataCellsFilter' in check_dict['Resource']:
-                del check_dict['Principal']
-
-            existing = self._client.list_permissions(**check_dict)
-            current = []
-            current_grant = []
-            for permission in existing['PrincipalResourcePermissions']:
-                if permission['Principal']['DataLakePrincipalIdentifier'] == principal:
-                    current.extend(permission['Permissions'])
-                    current_grant.extend(permission['PermissionsWithGrantOption'])
-
-            missing_permissions = list(set(permissions) - set(current))
-            missing_grant_permissions = (
-                list(set(permissions_with_grant_options) - set(current_grant)) if permissions_with_grant_options else []
-            )
+        """Checks the permissions of all the principals with a single ListPermissions on the resource"""
+        log.info(f'Checking principals {principals} permissions {permissions} to {str(resource)}...')
+        existing = self._list_permissions_by_principal(check_resource if check_resource else resource)
+        check = [
+            self._has_permissions(existing, principal, permissions, permissions_with_grant_options)
+            for principal in principals
+        ]
+        return all(check)
 
-            if missing_permissions or missing_grant_permissions:
-                return False
-            else:
-                log.info(
-                    f'Already granted principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)}  '
-                    f'response: {existing}'
-                )
-                return True
+    def _list_permissions_by_principal(self, resource: dict):
+        try:
+            return LakeFormationBatch.list_permissions_by_principal(self._client, resource)
         except ClientError as e:
-            log.error(f'Could not list principal {principal} permissions {permissions} to {str(resource)}  due to: {e}')
+            log.error(f'Could not list permissions to {str(resource)} due to: {e}')
             raise e
+
+    @staticmethod
+    def _has_permissions(existing, principal, permissions, permissions_with_grant_options=None) -> bool:
+        current, current_grant = existing.get(principal, (set(), set()))
+        missing_permissions = set(permissions) - current
+        missing_grant_permissions = (
+            set(permissions_with_grant_options) - current_grant if permissions_with_grant_options else set()
+        )
+        return not (missing_permissions or missing_grant_permissions)
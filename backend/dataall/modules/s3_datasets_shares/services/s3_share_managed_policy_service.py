@@ -6,6 +6,7 @@ from dataall.base.aws.service_quota import ServiceQuota
 from dataall.base.db.exceptions import AWSServiceQuotaExceeded
 from dataall.base.utils.consumption_principal_utils import EnvironmentIAMPrincipalType
 from dataall.base.utils.iam_policy_utils import (
+    pack_resource_statements_in_chunks,
     split_policy_statements_in_chunks,
     split_policy_with_resources_in_statements,
 )
@@ -50,6 +51,7 @@ class S3SharePolicyService(ManagedPolicy):
         self.environmentUri = environmentUri
         self.resource_prefix = resource_prefix
         self.policy_version_map = {}  # Policy version map helps while updating policies
+        self.policy_document_map = {}  # Current policy documents, only the policies whose document changes are updated
         self.total_s3_stmts: List[Any] = []
         self.total_s3_kms_stmts: List[Any] = []
         self.total_s3_access_point_stmts: List[Any] = []
@@ -64,6 +66,7 @@ class S3SharePolicyService(ManagedPolicy):
                 account_id=self.account, region=self.region, policy_name=share_managed_policy
             )
             self.policy_version_map[share_managed_policy] = version_id
+            self.policy_document_map[share_managed_policy] = policy_document
             s3_statements, s3_kms_statements, s3_access_point_statements, s3_kms_access_point_statements = (
                 S3SharePolicyService._get_segregated_policy_statements_from_policy(policy_document)
             )
@@ -260,10 +263,10 @@ class S3SharePolicyService(ManagedPolicy):
         Creates new policies (if needed) and then updates existing policies with statement chunks.
         Based on target_sid:
         1. This method merges all the S3 statments
-        2. Splits the policy into policy chunks, where each chunk is <= size of the policy ( this is approximately true )
+        2. Packs the resources into policy chunks, where each chunk is <= size of the policy. Resources stay in the policy they are already in whenever possible
         3. Check if there are any missing policies and create them
         4. Check if extra policies are required and also checks if those policies can be attached to the role (At the time of writing, IAM role has limit of 10 managed policies and can be increased to 20 )
-        5. Once policies are created, fill/update the policies with the policy chunks
+        5. Once policies are created, fill/update the policies with the policy chunks, skipping the policies whose document did not change
         6. Delete ( if any ) extra policies which are remaining
         """
         share_managed_policies_name_list = self.get_managed_policies()
@@ -284,20 +287,35 @@ class S3SharePolicyService(ManagedPolicy):
             total_s3_iam_policy_kms_stmts.extend(self.total_s3_kms_stmts)
 
         aggregated_iam_policy_statements = (
-            total_s3_iam_policy_stmts
-            + total_s3_iam_policy_kms_stmts
-            + total_s3_iam_policy_access_point_stmts
-            + total_s3_iam_policy_access_point_kms_stmts
+            S3SharePolicyService._merge_statements(total_s3_iam_policy_stmts, f'{IAM_S3_BUCKETS_STATEMENT_SID}S3')
+            + S3SharePolicyService._merge_statements(
+                total_s3_iam_policy_kms_stmts, f'{IAM_S3_BUCKETS_STATEMENT_SID}KMS'
+            )
+            + S3SharePolicyService._merge_statements(
+                total_s3_iam_policy_access_point_stmts, f'{IAM_S3_ACCESS_POINTS_STATEMENT_SID}S3'
+            )
+            + S3SharePolicyService._merge_statements(
+                total_s3_iam_policy_access_point_kms_stmts, f'{IAM_S3_ACCESS_POINTS_STATEMENT_SID}KMS'
+            )
         )
         log.info(f'Total number of policy statements after merging: {len(aggregated_iam_policy_statements)}')
 
-        if len(aggregated_iam_policy_statements) == 0:
+        current_policy_documents = {
+            int(policy_name.rsplit('-', 1)[-1]): policy_document
+            for policy_name, policy_document in self.policy_document_map.items()
+        }
+        current_policy_chunks = [
+            current_policy_documents.get(index, {}).get('Statement', [])
+            for index in range(max(current_policy_documents, default=-1) + 1)
+        ]
+        policy_document_chunks = pack_resource_statements_in_chunks(
+            aggregated_iam_policy_statements, current_policy_chunks
+        )
+        if len(policy_document_chunks) == 0:
             log.info('Attaching empty policy statement')
             empty_policy = self.generate_empty_policy()
             log.info(empty_policy['Statement'])
-            aggregated_iam_policy_statements = empty_policy['Statement']
-
-        policy_document_chunks = split_policy_statements_in_chunks(aggregated_iam_policy_statements)
+            policy_document_chunks = [empty_policy['Statement']]
         log.info(f'Number of policy chunks created: {len(policy_document_chunks)}')
         log.debug(policy_document_chunks)
 
@@ -334,13 +352,10 @@ class S3SharePolicyService(ManagedPolicy):
 
         for index, statement_chunk in enumerate(policy_document_chunks):
             policy_document = self._generate_policy_document_from_statements(statement_chunk)
-            # If statement length is greater than 1 then check if has empty statements sid and remove it
-            if len(policy_document.get('Statement')) > 1:
-                log.info('Removing empty policy statements')
-                policy_document = S3SharePolicyService.remove_empty_statement(
-                    policy_doc=policy_document, statement_sid=EMPTY_STATEMENT_SID
-                )
             policy_name = self.generate_indexed_policy_name(index=index)
+            if current_policy_documents.get(index) == policy_document:
+                log.info(f'Policy {policy_name} is unchanged, skipping the update')
+                continue
             log.debug(f'Policy document for policy {policy_name}: {policy_document}')
             IAM.update_managed_policy_default_version(
                 self.account,
@@ -561,6 +576,21 @@ class S3SharePolicyService(ManagedPolicy):
         )
         return statement_chunks
 
+    @staticmethod
+    def _merge_statements(statements: List[Dict], sid: str) -> List[Dict]:
+        """
+        Merges the resources of the statements of one type (e.g. S3 statements of bucket shares) in a single statement
+        that is packed in policy chunks by pack_resource_statements_in_chunks
+        """
+        if not statements:
+            return []
+        resources = [
+            resource
+            for statement in statements
+            for resource in S3SharePolicyService._convert_to_array(str, statement.get('Resource'))
+        ]
+        return [{'Sid': sid, 'Effect': 'Allow', 'Action': statements[0].get('Action'), 'Resource': resources}]
+
     # If item is of item type i.e. single instance if present, then wrap in an array.
     # This is helpful at places where array is required even if one element is present
     @staticmethod
@@ -5,6 +5,7 @@ import sys
 from botocore.exceptions import ClientError
 
 from dataall.core.tasks.service_handlers import Worker
+from dataall.core.tasks.task_outbox import TaskOutbox
 from dataall.base.aws.sqs import SqsQueue
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.environment.services.environment_service import EnvironmentService
@@ -151,10 +152,12 @@ class DatasetSubscriptionService:
 if __name__ == '__main__':
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
-    Worker.queue = SqsQueue.send
+    outbox = TaskOutbox(SqsQueue.send, SqsQueue.send_batch)
+    Worker.queue = outbox.queue
     log.info('Polling datasets updates...')
     service = DatasetSubscriptionService(ENGINE)
     queues = service.get_queues(service.get_environments(ENGINE))
     messages = poll_queues(queues)
-    service.notify_consumers(ENGINE, messages)
+    with outbox.collect():
+        service.notify_consumers(ENGINE, messages)
     log.info('Datasets updates shared successfully')
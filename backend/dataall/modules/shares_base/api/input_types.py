@@ -55,6 +55,9 @@ ShareObjectFilter = gql.InputType(
         gql.Argument('datasets_uris', gql.ArrayType(gql.String)),
         gql.Argument('share_requesters', gql.ArrayType(gql.String)),
         gql.Argument('share_iam_principals', gql.ArrayType(gql.String)),
+        gql.Argument('withTotal', gql.Boolean),
+        gql.Argument('cursor', gql.String),
+        gql.Argument('withCursor', gql.Boolean),
     ],
 )
 
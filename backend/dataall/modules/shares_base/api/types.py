@@ -193,6 +193,7 @@ ShareSearchResult = gql.ObjectType(
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
         gql.Field(name='nodes', type=gql.ArrayType(gql.Ref('ShareObject'))),
+        gql.Field(name='nextCursor', type=gql.String),
     ],
 )
 
@@ -253,7 +253,14 @@ class ShareObjectRepository:
         if data and data.get('share_iam_principals'):
             if len(data.get('share_iam_principals')) > 0:
                 query = query.filter(ShareObject.principalName.in_(data.get('share_iam_principals')))
-        return paginate(query.order_by(ShareObject.shareUri), data.get('page', 1), data.get('pageSize', 10)).to_dict()
+        return paginate(
+            query.order_by(ShareObject.shareUri),
+            data.get('page', 1),
+            data.get('pageSize', 10),
+            with_total=data.get('withTotal', True),
+            cursor=data.get('cursor'),
+            with_cursor=data.get('withCursor', False),
+        ).to_dict()
 
     @staticmethod
     def list_user_sent_share_requests(session, username, groups, data=None):
@@ -292,7 +299,14 @@ class ShareObjectRepository:
         if data and data.get('share_iam_principals'):
             if len(data.get('share_iam_principals')) > 0:
                 query = query.filter(ShareObject.principalName.in_(data.get('share_iam_principals')))
-        return paginate(query.order_by(ShareObject.shareUri), data.get('page', 1), data.get('pageSize', 10)).to_dict()
+        return paginate(
+            query.order_by(ShareObject.shareUri),
+            data.get('page', 1),
+            data.get('pageSize', 10),
+            with_total=data.get('withTotal', True),
+            cursor=data.get('cursor'),
+            with_cursor=data.get('withCursor', False),
+        ).to_dict()
 
     @staticmethod
     def paginate_shared_datasets(session, env_uri, data, share_item_shared_states):
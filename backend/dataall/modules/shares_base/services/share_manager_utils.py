@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from typing import Callable, Type
 
 logger = logging.getLogger(__name__)
@@ -37,3 +39,35 @@ def execute_and_suppress_exception(func: Callable, exc: Type[Exception] = Except
         func(*args, **kwargs)
     except exc:
         logger.exception('')
+
+
+class AccountRateLimiter:
+    """
+    Token bucket per AWS account shared by the threads processing a share, taken before each AWS API call
+    (see SessionHelper.limit_remote_calls), so that concurrent workers don't exceed the Lake Formation/Glue/IAM
+    API limits of the accounts involved in the share.
+    acquire blocks until every given account has a token available.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        self._rate = rate
+        self._burst = burst or max(1, int(rate))
+        self._buckets = {}  # account_id -> (tokens, last refill)
+        self._lock = threading.Lock()
+
+    def acquire(self, *account_ids: str) -> None:
+        for account_id in sorted(set(account_ids)):
+            while (wait := self._take(account_id)) > 0:
+                time.sleep(wait)
+
+    def _take(self, account_id) -> float:
+        """Takes a token and returns 0, or returns the seconds to wait for the next token"""
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(account_id, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - last) * self._rate)
+            if tokens >= 1:
+                self._buckets[account_id] = (tokens - 1, now)
+                return 0
+            self._buckets[account_id] = (tokens, now)
+            return (1 - tokens) / self._rate
@@ -7,8 +7,10 @@ from dataall.core.tasks.db.task_models import Task
 from dataall.core.tasks.service_handlers import Worker
 from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.base.context import get_context
+from dataall.base.services.service_provider_factory import ServiceProviderFactory
 from dataall.modules.shares_base.services.shares_enums import ShareObjectStatus
 from dataall.modules.notifications.db.notification_repositories import NotificationRepository
+from dataall.modules.notifications.services.email_digest import EmailDigest
 from dataall.modules.notifications.services.ses_email_notification_service import SESEmailNotificationService
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
 
@@ -39,10 +41,12 @@ class ShareNotificationService:
         - share.owner (person that opened the request) OR share.groupUri (if group_notifications=true)
     """
 
-    def __init__(self, session, dataset: DatasetBase, share: ShareObject):
+    def __init__(self, session, dataset: DatasetBase, share: ShareObject, email_digest: EmailDigest = None):
         self.dataset = dataset
         self.share = share
         self.session = session
+        # emails sent directly by ECS tasks are collected in the digest of the task when there is one
+        self.email_digest = email_digest
         self.notification_target_users = self._get_share_object_targeted_users()
 
     def notify_share_object_submission(self, email_id: str):
@@ -292,6 +296,21 @@ class ShareNotificationService:
         )
         return notifications
 
+    @staticmethod
+    def warm_email_recipients(groups: [str]):
+        """
+        Resolves the email ids of the groups once, before a task sends emails to them for many shares
+        """
+        share_notification_config = config.get_property(
+            'modules.datasets_base.features.share_notifications', default=None
+        )
+        if not share_notification_config or not share_notification_config.get('email', {}).get('active', False):
+            return
+        try:
+            ServiceProviderFactory.get_service_provider_instance().get_emails_for_groups([g for g in groups if g])
+        except Exception as e:
+            log.warning(f'Failed to resolve the email ids of groups {groups} due to {e}')
+
     def _get_share_object_targeted_users(self):
         targeted_users = list()
         targeted_users.append(self.dataset.SamlAdminGroupName)
@@ -386,9 +405,12 @@ class ShareNotificationService:
                 n_config = share_notification_config[share_notification_config_type]
                 if n_config.get('active', False) == True:
                     if share_notification_config_type == 'email':
-                        SESEmailNotificationService.send_email_task(
-                            subject, msg, recipient_groups_list, recipient_email_ids
-                        )
+                        if self.email_digest is not None:
+                            self.email_digest.add(subject, msg, recipient_groups_list, recipient_email_ids)
+                        else:
+                            SESEmailNotificationService.send_email_task(
+                                subject, msg, recipient_groups_list, recipient_email_ids
+                            )
                 else:
                     log.info(f'Notification type : {share_notification_config_type} is not active')
         else:
@@ -35,6 +35,8 @@ class ShareProcessorDefinition:
     Processor: Any
     shareable_type: Any
     shareable_uri: Any
+    # True when process_approved_shares and verify_shares can run concurrently on disjoint subsets of the items
+    concurrent: bool = False
 
 
 class ShareProcessorManager:
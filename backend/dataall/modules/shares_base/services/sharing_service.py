@@ -1,9 +1,12 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from typing import Any
 from dataall.core.resource_lock.db.resource_lock_repositories import ResourceLockRepository
 from dataall.base.db import Engine
+from dataall.base.aws.sts import SessionHelper
 from dataall.core.environment.db.environment_models import ConsumptionPrincipal, Environment, EnvironmentGroup
 from dataall.modules.shares_base.db.share_object_state_machines import (
     ShareObjectSM,
@@ -19,7 +22,11 @@ from dataall.modules.shares_base.services.shares_enums import (
 from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
-from dataall.modules.shares_base.services.share_processor_manager import ShareProcessorManager
+from dataall.modules.shares_base.services.share_processor_manager import (
+    ShareProcessorManager,
+    ShareProcessorDefinition,
+)
+from dataall.modules.shares_base.services.share_manager_utils import AccountRateLimiter
 from dataall.base.db.exceptions import ResourceLockTimeout
 
 log = logging.getLogger(__name__)
@@ -36,6 +43,13 @@ class ShareData:
 
 
 class SharingService:
+    # Items of processors registered as concurrent are processed by a pool of MAX_WORKERS threads,
+    # in tasks of ITEMS_PER_TASK items. The workers make at most ACCOUNT_RATE AWS API calls/second per AWS account.
+    MAX_WORKERS = int(os.getenv('SHARE_PROCESSING_MAX_WORKERS', 4))
+    ITEMS_PER_TASK = int(os.getenv('SHARE_PROCESSING_ITEMS_PER_TASK', 10))
+    ACCOUNT_RATE = float(os.getenv('SHARE_PROCESSING_ACCOUNT_RATE', 10))
+    _rate_limiter = AccountRateLimiter(ACCOUNT_RATE)
+
     @classmethod
     def approve_share(cls, engine: Engine, share_uri: str) -> bool:
         """
@@ -97,9 +111,15 @@ class SharingService:
                                 status=ShareItemStatus.Share_Approved.value,
                             )
                             if shareable_items:
-                                success = processor.Processor(
-                                    session, share_data, shareable_items
-                                ).process_approved_shares()
+                                success = cls._process_items(
+                                    engine,
+                                    session,
+                                    share_data,
+                                    processor,
+                                    shareable_items,
+                                    'process_approved_shares',
+                                    status=ShareItemStatus.Share_Approved.value,
+                                )
                                 log.info(f'Sharing {type.value} succeeded = {success}')
                                 if not success:
                                     share_successful = False
@@ -269,7 +289,16 @@ class SharingService:
                         healthStatus=healthStatus,
                     )
                     if shareable_items:
-                        processor.Processor(session, share_data, shareable_items).verify_shares()
+                        cls._process_items(
+                            engine,
+                            session,
+                            share_data,
+                            processor,
+                            shareable_items,
+                            'verify_shares',
+                            status=status,
+                            healthStatus=healthStatus,
+                        )
                     else:
                         log.info(f'There are no items to verify of type {type.value}')
                 except Exception as e:
@@ -329,9 +358,15 @@ class SharingService:
                                 ShareItemHealthStatus.PendingReApply.value,
                             )
                             if shareable_items:
-                                success = processor.Processor(
-                                    session, share_data, shareable_items
-                                ).process_approved_shares()
+                                success = cls._process_items(
+                                    engine,
+                                    session,
+                                    share_data,
+                                    processor,
+                                    shareable_items,
+                                    'process_approved_shares',
+                                    healthStatus=ShareItemHealthStatus.PendingReApply.value,
+                                )
                                 log.info(f'Reapplying {type.value} succeeded = {success}')
                                 if not success:
                                     reapply_successful = False
@@ -390,10 +425,88 @@ class SharingService:
 
         return True
 
+    @classmethod
+    def _process_items(
+        cls,
+        engine: Engine,
+        session,
+        share_data: ShareData,
+        processor: ShareProcessorDefinition,
+        shareable_items: list,
+        action: str,
+        status: str = None,
+        healthStatus: str = None,
+    ):
+        """
+        Runs the processor action (e.g. process_approved_shares) on the items and returns its result.
+        Items of concurrent processors are split in tasks processed by a pool of threads, each one with its own
+        DB session, so that the latency of the share depends on the slowest task instead of the sum of all items.
+        The first item is processed alone beforehand, so that the resources common to all the items
+        (e.g. the shared Glue database) are created once. Revokes are always sequential, as they clean up
+        those common resources when the last item is revoked.
+        """
+        if cls.MAX_WORKERS <= 1 or not processor.concurrent or len(shareable_items) <= 1:
+            return getattr(processor.Processor(session, share_data, shareable_items), action)()
+
+        success = getattr(processor.Processor(session, share_data, shareable_items[:1]), action)()
+
+        uri_key = processor.shareable_uri.key
+        uris = [getattr(item, uri_key) for item in shareable_items[1:]]
+        tasks = [uris[i : i + cls.ITEMS_PER_TASK] for i in range(0, len(uris), cls.ITEMS_PER_TASK)]
+        log.info(f'Processing {len(uris)} items of type {processor.type.value} in {len(tasks)} concurrent tasks')
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix='share-processor') as executor:
+            futures = [
+                executor.submit(
+                    cls._process_items_task,
+                    engine,
+                    share_data.share.shareUri,
+                    processor,
+                    set(task),
+                    action,
+                    status,
+                    healthStatus,
+                )
+                for task in tasks
+            ]
+            for future in futures:
+                try:
+                    success = future.result() and success
+                except Exception as e:
+                    errors.append(e)
+
+        # the items were updated by the sessions of the workers
+        session.expire_all()
+        if errors:
+            raise errors[0]
+        return success
+
+    @classmethod
+    def _process_items_task(cls, engine, share_uri, processor, item_uris, action, status, healthStatus):
+        # the AWS API calls of the worker wait for a token of the account they are made to
+        with SessionHelper.limit_remote_calls(cls._rate_limiter.acquire), engine.thread_session() as session:
+            share_data = cls._get_share_data(session, share_uri)
+            shareable_items = [
+                item
+                for item in ShareObjectRepository.get_share_data_items_by_type(
+                    session,
+                    share_data.share,
+                    processor.shareable_type,
+                    processor.shareable_uri,
+                    status=status,
+                    healthStatus=healthStatus,
+                )
+                if getattr(item, processor.shareable_uri.key) in item_uris
+            ]
+            if not shareable_items:
+                return True
+            return getattr(processor.Processor(session, share_data, shareable_items), action)()
+
     @staticmethod
-    def _get_share_data_and_items(session, share_uri, status=None, healthStatus=None):
+    def _get_share_data(session, share_uri) -> ShareData:
         data = ShareObjectRepository.get_share_data(session, share_uri)
-        share_data = ShareData(
+        return ShareData(
             share=data[0],
             dataset=data[1],
             source_environment=data[2],
@@ -401,6 +514,10 @@ class SharingService:
             source_env_group=data[4],
             env_group=data[5],
         )
+
+    @staticmethod
+    def _get_share_data_and_items(session, share_uri, status=None, healthStatus=None):
+        share_data = SharingService._get_share_data(session, share_uri)
         status_list = [status] if status is not None else []
         healthStatus_list = [healthStatus] if healthStatus is not None else []
 
@@ -5,6 +5,7 @@ from dataall.base.loader import load_modules, ImportMode
 from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.base.db import get_engine
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
+from dataall.modules.notifications.services.email_digest import EmailDigest
 from dataall.modules.shares_base.services.share_notification_service import ShareNotificationService
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
 
@@ -22,14 +23,22 @@ def persistent_email_reminders(engine):
         pending_shares = ShareObjectRepository.fetch_submitted_shares_with_notifications(session=session)
         log.info(f'Found {len(pending_shares)} pending shares')
         pending_share: ShareObject
+        shares = []
         for pending_share in pending_shares:
-            log.info(f'Sending Email Reminder for Share: {pending_share.shareUri}')
             share = ShareObjectRepository.get_share_by_uri(session, pending_share.shareUri)
-            dataset = DatasetBaseRepository.get_dataset_by_uri(session, share.datasetUri)
-            ShareNotificationService(session=session, dataset=dataset, share=share).notify_persistent_email_reminder(
-                email_id=share.owner
-            )
-            log.info(f'Email reminder sent for share {share.shareUri}')
+            shares.append((share, DatasetBaseRepository.get_dataset_by_uri(session, share.datasetUri)))
+        ShareNotificationService.warm_email_recipients(
+            list({group for _, dataset in shares for group in (dataset.SamlAdminGroupName, dataset.stewards)})
+        )
+        # the reminders are sent in one digest email per recipient
+        email_digest = EmailDigest()
+        for share, dataset in shares:
+            log.info(f'Adding Email Reminder for Share: {share.shareUri}')
+            ShareNotificationService(
+                session=session, dataset=dataset, share=share, email_digest=email_digest
+            ).notify_persistent_email_reminder(email_id=share.owner)
+        results = email_digest.send()
+        log.info(f'Email reminders sent in {len(results)} digest emails')
         log.info('Completed Persistent Email Reminders Task')
 
 
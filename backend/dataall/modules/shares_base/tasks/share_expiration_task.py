@@ -7,6 +7,7 @@ from dataall.base.db import get_engine
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.db.share_object_state_machines import ShareObjectSM, ShareItemSM
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
+from dataall.modules.notifications.services.email_digest import EmailDigest
 from dataall.modules.shares_base.services.share_notification_service import ShareNotificationService
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
 from dataall.modules.shares_base.services.shares_enums import ShareObjectActions, ShareItemStatus
@@ -23,6 +24,19 @@ def share_expiration_checker(engine):
         log.info('Starting share expiration task')
         shares = ShareObjectRepository.get_all_active_shares_with_expiration(session)
         log.info(f'Fetched {len(shares)} active shares with expiration')
+        # the groups notified about the shares that are not expired yet
+        groups = set()
+        for share in shares:
+            if share.expiryDate.date() < datetime.today().date():
+                continue
+            if share.submittedForExtension:
+                dataset = DatasetBaseRepository.get_dataset_by_uri(session, share.datasetUri)
+                groups.update([dataset.SamlAdminGroupName, dataset.stewards])
+            else:
+                groups.add(share.groupUri)
+        ShareNotificationService.warm_email_recipients(list(groups))
+        # the notifications are sent in one digest email per recipient once all the shares are processed
+        email_digest = EmailDigest()
         for share in shares:
             try:
                 if share.expiryDate.date() < datetime.today().date():
@@ -55,19 +69,24 @@ def share_expiration_checker(engine):
                             f'Sending notifications to the owners: {dataset.SamlAdminGroupName}, {dataset.stewards} as share extension requested for share with uri: {share.shareUri}'
                         )
                         ShareNotificationService(
-                            session=session, dataset=dataset, share=share
+                            session=session, dataset=dataset, share=share, email_digest=email_digest
                         ).notify_share_expiration_to_owners()
                     else:
                         log.info(
                             f'Sending notifications to the requesters with group: {share.groupUri} as share extension is not requested for share with uri: {share.shareUri}'
                         )
                         ShareNotificationService(
-                            session=session, dataset=dataset, share=share
+                            session=session, dataset=dataset, share=share, email_digest=email_digest
                         ).notify_share_expiration_to_requesters()
             except Exception as e:
                 log.error(
                     f'Error occured while processing share expiration processing for share with URI: {share.shareUri} due to: {e}'
                 )
+        try:
+            results = email_digest.send()
+            log.info(f'Share expiration notifications sent in {len(results)} digest emails')
+        except Exception as e:
+            log.error(f'Error occured while sending the share expiration notifications due to: {e}')
 
 
 if __name__ == '__main__':
@@ -1,6 +1,8 @@
 import logging
 from datetime import datetime
 
+from sqlalchemy import func, or_
+
 from dataall.modules.vote.db import vote_models as models
 from dataall.base.context import get_context
 
@@ -59,6 +61,33 @@ class VoteRepository:
             .count()
         )
 
+    @staticmethod
+    def count_upvotes_by_target(session, target_uris, target_type) -> dict:
+        """Returns the number of upvotes of each of the targets, targets without upvotes are not in the result"""
+        return dict(
+            session.query(models.Vote.targetUri, func.count(models.Vote.voteUri))
+            .filter(
+                models.Vote.targetUri.in_(target_uris),
+                models.Vote.targetType == target_type,
+                models.Vote.upvote == True,
+            )
+            .group_by(models.Vote.targetUri)
+            .all()
+        )
+
+    @staticmethod
+    def list_targets_voted_since(session, since, target_type) -> set:
+        """Returns the targets with votes cast or changed since the given time"""
+        q = (
+            session.query(models.Vote.targetUri)
+            .filter(
+                models.Vote.targetType == target_type,
+                or_(models.Vote.created > since, models.Vote.updated > since),
+            )
+            .distinct()
+        )
+        return {target_uri for (target_uri,) in q}
+
     @staticmethod
     def delete_votes(session, target_uri, target_type) -> [models.Vote]:
         return (
@@ -1,5 +1,12 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import create_worksheet, delete_worksheet, update_worksheet
+from dataall.modules.worksheets.api.resolvers import (
+    create_worksheet,
+    delete_worksheet,
+    get_sql_query_results,
+    poll_sql_query,
+    start_sql_query,
+    update_worksheet,
+)
 
 
 createWorksheet = gql.MutationField(
@@ -27,3 +34,39 @@ deleteWorksheet = gql.MutationField(
     ],
     type=gql.Boolean,
 )
+
+startAthenaSqlQuery = gql.MutationField(
+    name='startAthenaSqlQuery',
+    type=gql.Ref('AthenaQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+    ],
+    resolver=start_sql_query,
+)
+
+pollAthenaSqlQuery = gql.MutationField(
+    name='pollAthenaSqlQuery',
+    type=gql.Ref('AthenaQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+    ],
+    resolver=poll_sql_query,
+)
+
+fetchAthenaSqlQueryResults = gql.MutationField(
+    name='fetchAthenaSqlQueryResults',
+    type=gql.Ref('AthenaQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='nextToken', type=gql.String),
+        gql.Argument(name='maxRows', type=gql.Integer),
+        gql.Argument(name='columnar', type=gql.Boolean),
+    ],
+    resolver=get_sql_query_results,
+)
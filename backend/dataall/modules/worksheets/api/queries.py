@@ -25,6 +25,11 @@ runAthenaSqlQuery = gql.QueryField(
         gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.String),
+        gql.Argument(name='nextToken', type=gql.String),
+        gql.Argument(name='maxRows', type=gql.Integer),
+        gql.Argument(name='columnar', type=gql.Boolean),
+        gql.Argument(name='downloadResult', type=gql.Boolean),
     ],
     resolver=run_sql_query,
 )
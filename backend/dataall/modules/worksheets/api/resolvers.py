@@ -39,8 +39,60 @@ def list_worksheets(context, source, filter: dict = None):
     return WorksheetService.list_user_worksheets(filter)
 
 
-def run_sql_query(context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None):
-    return WorksheetService.run_sql_query(uri=environmentUri, worksheetUri=worksheetUri, sqlQuery=sqlQuery)
+def run_sql_query(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    sqlQuery: str = None,
+    athenaQueryId: str = None,
+    nextToken: str = None,
+    maxRows: int = None,
+    columnar: bool = False,
+    downloadResult: bool = False,
+):
+    return WorksheetService.run_sql_query(
+        uri=environmentUri,
+        worksheetUri=worksheetUri,
+        sqlQuery=sqlQuery,
+        athenaQueryId=athenaQueryId,
+        nextToken=nextToken,
+        maxRows=maxRows,
+        columnar=columnar,
+        downloadResult=downloadResult,
+    )
+
+
+def start_sql_query(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None
+):
+    return WorksheetService.start_sql_query(uri=environmentUri, worksheetUri=worksheetUri, sqlQuery=sqlQuery)
+
+
+def poll_sql_query(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, athenaQueryId: str = None
+):
+    return WorksheetService.poll_sql_query(uri=environmentUri, worksheetUri=worksheetUri, athenaQueryId=athenaQueryId)
+
+
+def get_sql_query_results(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    athenaQueryId: str = None,
+    nextToken: str = None,
+    maxRows: int = None,
+    columnar: bool = False,
+):
+    return WorksheetService.get_sql_query_results(
+        uri=environmentUri,
+        worksheetUri=worksheetUri,
+        athenaQueryId=athenaQueryId,
+        nextToken=nextToken,
+        maxRows=maxRows,
+        columnar=columnar,
+    )
 
 
 def delete_worksheet(context, source, worksheetUri: str = None):
@@ -6,6 +6,7 @@ AthenaResultColumnDescriptor = gql.ObjectType(
     fields=[
         gql.Field(name='columnName', type=gql.NonNullableType(gql.String)),
         gql.Field(name='typeName', type=gql.NonNullableType(gql.String)),
+        gql.Field(name='values', type=gql.ArrayType(gql.String)),
     ],
 )
 
@@ -38,6 +39,10 @@ AthenaQueryResult = gql.ObjectType(
         gql.Field(name='Status', type=gql.String),
         gql.Field(name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))),
         gql.Field(name='rows', type=gql.ArrayType(gql.Ref('AthenaResultRecord'))),
+        gql.Field(name='truncated', type=gql.Boolean),
+        gql.Field(name='nextToken', type=gql.String),
+        gql.Field(name='resultDownloadUrl', type=gql.String),
+        gql.Field(name='cached', type=gql.Boolean),
     ],
 )
 
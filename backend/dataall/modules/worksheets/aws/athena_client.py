@@ -1,3 +1,6 @@
+import json
+import os
+
 from pyathena import connect
 from dataall.base.aws.sts import SessionHelper
 
@@ -5,10 +8,19 @@ from dataall.base.aws.sts import SessionHelper
 class AthenaClient:
     """Makes requests to AWS Athena"""
 
+    MAX_ROWS = int(os.getenv('WORKSHEET_RESULT_MAX_ROWS', 10000))
+    MAX_BYTES = int(os.getenv('WORKSHEET_RESULT_MAX_BYTES', 4 * 1024 * 1024))
+    PAGE_SIZE = 1000  # Maximum number of rows returned by one GetQueryResults request
+    DOWNLOAD_URL_EXPIRATION_SECONDS = 900
+
     @staticmethod
-    def run_athena_query(aws_account_id, env_group, s3_staging_dir, region, sql=None):
+    def _get_group_session(aws_account_id, env_group, region):
         base_session = SessionHelper.remote_session(accountid=aws_account_id, region=region)
-        boto3_session = SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+        return SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+
+    @staticmethod
+    def run_athena_query(aws_account_id, env_group, s3_staging_dir, region, sql=None):
+        boto3_session = AthenaClient._get_group_session(aws_account_id, env_group, region)
         creds = boto3_session.get_credentials()
         connection = connect(
             aws_access_key_id=creds.access_key,
@@ -24,25 +36,117 @@ class AthenaClient:
         return cursor
 
     @staticmethod
-    def convert_query_output(cursor):
-        columns = []
-        for f in cursor.description:
-            columns.append({'columnName': f[0], 'typeName': 'String'})
+    def start_query_execution(aws_account_id, env_group, s3_staging_dir, region, sql) -> str:
+        """Starts the query without waiting for it to finish and returns its QueryExecutionId"""
+        client = AthenaClient._get_group_session(aws_account_id, env_group, region).client('athena', region_name=region)
+        response = client.start_query_execution(
+            QueryString=sql,
+            WorkGroup=env_group.environmentAthenaWorkGroup,
+            ResultConfiguration={'OutputLocation': s3_staging_dir},
+        )
+        return response['QueryExecutionId']
 
-        rows = []
-        for row in cursor:
-            record = {'cells': []}
-            for col_position, column in enumerate(columns):
-                cell = {}
-                cell['columnName'] = column['columnName']
-                cell['typeName'] = column['typeName']
-                cell['value'] = str(row[col_position])
-                record['cells'].append(cell)
-            rows.append(record)
+    @staticmethod
+    def get_query_execution(aws_account_id, env_group, region, query_id) -> dict:
+        client = AthenaClient._get_group_session(aws_account_id, env_group, region).client('athena', region_name=region)
+        execution = client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+        statistics = execution.get('Statistics', {})
         return {
-            'error': None,
-            'AthenaQueryId': cursor.query_id,
-            'ElapsedTime': cursor.total_execution_time_in_millis,
-            'rows': rows,
-            'columns': columns,
+            'Status': execution['Status']['State'],
+            'Error': execution['Status'].get('StateChangeReason'),
+            'OutputLocation': execution.get('ResultConfiguration', {}).get('OutputLocation'),
+            'ElapsedTimeInMs': statistics.get('EngineExecutionTimeInMillis'),
+            'DataScannedInBytes': statistics.get('DataScannedInBytes'),
+            'WorkGroup': execution.get('WorkGroup'),
         }
+
+    @staticmethod
+    def get_query_results(
+        aws_account_id, env_group, region, query_id, next_token=None, max_rows=None, columnar=False
+    ) -> dict:
+        client = AthenaClient._get_group_session(aws_account_id, env_group, region).client('athena', region_name=region)
+        return AthenaClient.read_query_results(
+            client, query_id, next_token=next_token, max_rows=max_rows, columnar=columnar
+        )
+
+    @staticmethod
+    def read_query_results(client, query_id, next_token=None, max_rows=None, max_bytes=None, columnar=False) -> dict:
+        """
+        Reads one page of the results of a finished query with GetQueryResults, without loading the whole result.
+        The page stops at max_rows rows or max_bytes bytes of serialized rows, in which case truncated is True
+        and nextToken can be used to read the next page. Columns carry the Athena types of the result set and,
+        in columnar format, the values of the column instead of rows of cells.
+        """
+        max_rows = min(max_rows or AthenaClient.MAX_ROWS, AthenaClient.MAX_ROWS)
+        max_bytes = max_bytes or AthenaClient.MAX_BYTES
+        rows = []
+        size = 0
+        truncated = False
+        while True:
+            limit = min(AthenaClient.PAGE_SIZE, max_rows - len(rows))
+            columns, page, page_next_token = AthenaClient._read_page(client, query_id, next_token, limit)
+            row_sizes = [len(json.dumps(row)) for row in page]
+            fit = 0
+            while fit < len(page) and size + row_sizes[fit] <= max_bytes:
+                size += row_sizes[fit]
+                fit += 1
+            if fit < len(page):
+                truncated = True
+                if fit == 0 and rows:
+                    break
+                # The page is read again with the rows that fit, to get the NextToken of the following row
+                columns, page, page_next_token = AthenaClient._read_page(client, query_id, next_token, max(fit, 1))
+            rows.extend(page)
+            next_token = page_next_token
+            if not next_token or truncated:
+                break
+            if len(rows) >= max_rows:
+                truncated = True
+                break
+
+        result = {'error': None, 'AthenaQueryId': query_id, 'truncated': truncated, 'nextToken': next_token}
+        if columnar:
+            for position, column in enumerate(columns):
+                column['values'] = [row[position] for row in rows]
+            result.update(columns=columns, rows=[])
+        else:
+            result.update(
+                columns=columns,
+                rows=[{'cells': [dict(column, value=value) for column, value in zip(columns, row)]} for row in rows],
+            )
+        return result
+
+    @staticmethod
+    def _read_page(client, query_id, next_token, limit):
+        """Returns the columns, the rows (as lists of values) and the NextToken of a page of GetQueryResults"""
+        kwargs = {'QueryExecutionId': query_id, 'MaxResults': limit}
+        if next_token:
+            kwargs['NextToken'] = next_token
+        else:
+            # The first page of a SELECT starts with a header row, that is requested on top of the limit
+            kwargs['MaxResults'] = min(limit + 1, AthenaClient.PAGE_SIZE)
+        response = client.get_query_results(**kwargs)
+        columns = [
+            {'columnName': column['Name'], 'typeName': column['Type']}
+            for column in response['ResultSet']['ResultSetMetadata']['ColumnInfo']
+        ]
+        rows = [[cell.get('VarCharValue') for cell in row['Data']] for row in response['ResultSet']['Rows']]
+        if not next_token and rows and rows[0] == [column['columnName'] for column in columns]:
+            rows = rows[1:]
+        return columns, rows, response.get('NextToken')
+
+    @staticmethod
+    def get_columns_from_cursor(cursor) -> list:
+        """Returns the columns of the query with their Athena types, as reported in cursor.description"""
+        return [{'columnName': column[0], 'typeName': column[1]} for column in cursor.description or []]
+
+    @staticmethod
+    def get_result_download_url(aws_account_id, env_group, region, output_location) -> str:
+        """Returns a presigned URL to download the CSV file with the full result of a query"""
+        bucket, key = output_location.replace('s3://', '', 1).split('/', 1)
+        client = AthenaClient._get_group_session(aws_account_id, env_group, region).client('s3', region_name=region)
+        return client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket, 'Key': key},
+            ExpiresIn=AthenaClient.DOWNLOAD_URL_EXPIRATION_SECONDS,
+        )
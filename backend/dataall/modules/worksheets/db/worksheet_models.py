@@ -1,7 +1,7 @@
 import datetime
 import enum
 
-from sqlalchemy import Column, DateTime, Integer, Enum, String
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Enum, String
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import query_expression
 
@@ -49,5 +49,7 @@ class WorksheetQueryResult(Base):
     OutputLocation = Column(String, nullable=False)
     error = Column(String, nullable=True)
     ElapsedTimeInMs = Column(Integer, nullable=True)
-    DataScannedInBytes = Column(Integer, nullable=True)
+    DataScannedInBytes = Column(BigInteger, nullable=True)
+    AthenaWorkGroup = Column(String, nullable=True)
+    cacheKey = Column(String, nullable=True, index=True)
     created = Column(DateTime, default=datetime.datetime.now)
@@ -2,11 +2,12 @@
 DAO layer that encapsulates the logic and interaction with the database for worksheets
 """
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
 
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.base.db import paginate
+from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
 from dataall.modules.worksheets.db.worksheet_models import Worksheet, WorksheetQueryResult
 from dataall.base.utils.naming_convention import (
     NamingConventionService,
@@ -59,3 +60,46 @@ class WorksheetRepository(EnvironmentResource):
             page=data.get('page', WorksheetRepository._DEFAULT_PAGE),
             page_size=data.get('pageSize', WorksheetRepository._DEFAULT_PAGE_SIZE),
         ).to_dict()
+
+    @staticmethod
+    def find_query_result(session, query_id) -> WorksheetQueryResult:
+        return session.query(WorksheetQueryResult).get(query_id)
+
+    @staticmethod
+    def find_cached_query_result(session, cache_key, since) -> WorksheetQueryResult:
+        return (
+            session.query(WorksheetQueryResult)
+            .filter(
+                and_(
+                    WorksheetQueryResult.cacheKey == cache_key,
+                    WorksheetQueryResult.status == 'SUCCEEDED',
+                    WorksheetQueryResult.created >= since,
+                )
+            )
+            .order_by(WorksheetQueryResult.created.desc())
+            .first()
+        )
+
+    @staticmethod
+    def find_tables_versions(session, aws_account_id, tables) -> dict:
+        """Returns the version of the Glue metadata of the (database, table) found in the account"""
+        query = session.query(
+            DatasetTable.GlueDatabaseName,
+            DatasetTable.GlueTableName,
+            DatasetTable.GlueTableVersion,
+            DatasetTable.updated,
+        ).filter(
+            and_(
+                DatasetTable.AWSAccountId == aws_account_id,
+                or_(
+                    *[
+                        and_(DatasetTable.GlueDatabaseName == database, DatasetTable.GlueTableName == table)
+                        for database, table in tables
+                    ]
+                ),
+            )
+        )
+        return {
+            (database, table): version or (updated.isoformat() if updated else '')
+            for database, table, version, updated in query.all()
+        }
@@ -0,0 +1,89 @@
+"""
+Cache of worksheet query results. A query is only served from the cache if the same team (Athena workgroup) ran
+the same read-only SQL on tables whose Glue metadata did not change since, within WORKSHEET_QUERY_CACHE_TTL_SECONDS.
+Changes to the data that do not update the Glue table (e.g. new files in the table location) are bounded by the TTL.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import List, Optional, Tuple
+
+from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
+
+log = logging.getLogger(__name__)
+
+_QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+_IDENTIFIER = r'(?:"(?:[^"]|"")+"|[\w$]+)'
+_TABLE_REFERENCE = re.compile(rf'\b(?:from|join)\s+({_IDENTIFIER}(?:\.{_IDENTIFIER})*)')
+_CTE_NAME = re.compile(rf'(?:\bwith|,)\s*({_IDENTIFIER})\s+as\s*\(')
+_FROM_CLAUSE_TOKEN = re.compile(r'[(),]|[\w$]+')
+# keywords that end the FROM clause of a (sub)query
+_FROM_CLAUSE_END = {'where', 'group', 'having', 'order', 'limit', 'offset', 'union', 'intersect', 'except', 'window'}
+
+
+class WorksheetQueryCache:
+    TTL_SECONDS = int(os.getenv('WORKSHEET_QUERY_CACHE_TTL_SECONDS', 900))
+
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """Lowercases the SQL and collapses whitespaces, except in string literals and quoted identifiers"""
+        parts = _QUOTED.split(sql.strip().rstrip(';').strip())
+        return ''.join(part if i % 2 else re.sub(r'\s+', ' ', part.lower()) for i, part in enumerate(parts))
+
+    @staticmethod
+    def source_tables(normalized_sql: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Returns the (database, table) read by a normalized SELECT query, or None if the query can not be cached:
+        it is not a SELECT, it reads a table without naming its database, or it joins tables with commas
+        (FROM db.t1, db.t2), whose table references are not parsed
+        """
+        if not normalized_sql.startswith(('select ', 'with ')):
+            return None
+        if WorksheetQueryCache._has_comma_join(normalized_sql):
+            return None
+        ctes = {name.strip('"').lower() for name in _CTE_NAME.findall(normalized_sql)}
+        tables = set()
+        for reference in _TABLE_REFERENCE.findall(normalized_sql):
+            names = [name.strip('"').lower() for name in re.findall(_IDENTIFIER, reference)]
+            if len(names) == 1 and names[0] in ctes:
+                continue
+            if len(names) != 2:
+                return None
+            tables.add((names[0], names[1]))
+        return sorted(tables) or None
+
+    @staticmethod
+    def _has_comma_join(normalized_sql: str) -> bool:
+        """Returns True if a FROM clause of the query or of its subqueries lists several items separated by commas"""
+        in_from = [False]  # per parenthesis depth, whether the tokens are in a FROM clause
+        for token in _FROM_CLAUSE_TOKEN.findall(_QUOTED.sub(' ', normalized_sql)):
+            if token == '(':
+                in_from.append(False)
+            elif token == ')':
+                if len(in_from) > 1:
+                    in_from.pop()
+            elif token == ',':
+                if in_from[-1]:
+                    return True
+            elif token == 'from':
+                in_from[-1] = True
+            elif token == 'select' or token in _FROM_CLAUSE_END:
+                in_from[-1] = False
+        return False
+
+    @staticmethod
+    def cache_key(session, aws_account_id: str, workgroup: str, sql: str) -> Optional[str]:
+        """Returns the cache key of the query, or None if its results can not be cached"""
+        normalized_sql = WorksheetQueryCache.normalize_sql(sql)
+        tables = WorksheetQueryCache.source_tables(normalized_sql)
+        if not tables:
+            return None
+        versions = WorksheetRepository.find_tables_versions(session, aws_account_id, tables)
+        if len(versions) != len(tables):
+            log.info(f'Query reads tables that are not managed by data.all, results are not cached: {tables}')
+            return None
+        key = json.dumps([workgroup, normalized_sql, [[*table, versions[table]] for table in tables]])
+        return hashlib.sha256(key.encode()).hexdigest()
@@ -1,3 +1,4 @@
+import datetime
 import logging
 
 from dataall.core.activity.db.activity_models import Activity
@@ -7,8 +8,9 @@ from dataall.base.context import get_context
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.modules.worksheets.aws.athena_client import AthenaClient
-from dataall.modules.worksheets.db.worksheet_models import Worksheet
+from dataall.modules.worksheets.db.worksheet_models import QueryType, Worksheet, WorksheetQueryResult
 from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
+from dataall.modules.worksheets.services.worksheet_query_cache import WorksheetQueryCache
 from dataall.modules.worksheets.services.worksheet_permissions import (
     MANAGE_WORKSHEETS,
     UPDATE_WORKSHEET,
@@ -21,6 +23,8 @@ from dataall.modules.worksheets.services.worksheet_permissions import (
 
 logger = logging.getLogger(__name__)
 
+QUERY_FINAL_STATES = ('SUCCEEDED', 'FAILED', 'CANCELLED')
+
 
 class WorksheetService:
     @staticmethod
@@ -133,7 +137,21 @@ class WorksheetService:
     @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
     @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
     @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
-    def run_sql_query(uri, worksheetUri, sqlQuery):
+    def run_sql_query(
+        uri,
+        worksheetUri,
+        sqlQuery,
+        athenaQueryId=None,
+        nextToken=None,
+        maxRows=None,
+        columnar=False,
+        downloadResult=False,
+    ):
+        """
+        Runs the query and returns the first page of its results. If athenaQueryId and nextToken are provided,
+        returns the next page of the results of that query instead of running it again.
+        With downloadResult, the results are not inlined and a presigned URL to the CSV result is returned.
+        """
         with get_context().db_engine.scoped_session() as session:
             environment = EnvironmentService.get_environment_by_uri(session, uri)
             worksheet = WorksheetService._get_worksheet_by_uri(session, worksheetUri)
@@ -142,12 +160,203 @@ class WorksheetService:
                 session, worksheet.SamlAdminGroupName, environment.environmentUri
             )
 
+            if athenaQueryId:
+                if not nextToken:
+                    raise exceptions.RequiredParameter(param_name='nextToken')
+                WorksheetService._check_query_workgroup(session, environment, env_group, athenaQueryId)
+                return AthenaClient.get_query_results(
+                    aws_account_id=environment.AwsAccountId,
+                    env_group=env_group,
+                    region=environment.region,
+                    query_id=athenaQueryId,
+                    next_token=nextToken,
+                    max_rows=maxRows,
+                    columnar=columnar,
+                )
+
             cursor = AthenaClient.run_athena_query(
                 aws_account_id=environment.AwsAccountId,
                 env_group=env_group,
-                s3_staging_dir=f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/',
+                s3_staging_dir=WorksheetService._s3_staging_dir(environment, env_group),
                 region=environment.region,
                 sql=sqlQuery,
             )
+            execution = {
+                'AthenaQueryId': cursor.query_id,
+                'OutputLocation': cursor.output_location,
+                'ElapsedTimeInMs': cursor.total_execution_time_in_millis,
+                'DataScannedInBytes': cursor.data_scanned_in_bytes,
+                'AwsAccountId': environment.AwsAccountId,
+                'region': environment.region,
+            }
+
+            if downloadResult:
+                return dict(
+                    execution,
+                    error=None,
+                    columns=AthenaClient.get_columns_from_cursor(cursor),
+                    rows=[],
+                    truncated=False,
+                    resultDownloadUrl=AthenaClient.get_result_download_url(
+                        aws_account_id=environment.AwsAccountId,
+                        env_group=env_group,
+                        region=environment.region,
+                        output_location=cursor.output_location,
+                    ),
+                )
+
+            result = AthenaClient.get_query_results(
+                aws_account_id=environment.AwsAccountId,
+                env_group=env_group,
+                region=environment.region,
+                query_id=cursor.query_id,
+                max_rows=maxRows,
+                columnar=columnar,
+            )
+            return dict(execution, **result)
+
+    @staticmethod
+    @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
+    def start_sql_query(uri, worksheetUri, sqlQuery):
+        """
+        Starts the query without waiting for its results, which are polled with poll_sql_query and read with
+        get_sql_query_results. If the team ran the same query on the same version of the tables recently,
+        the finished query is returned instead of starting a new one.
+        """
+        with get_context().db_engine.scoped_session() as session:
+            environment = EnvironmentService.get_environment_by_uri(session, uri)
+            worksheet = WorksheetService._get_worksheet_by_uri(session, worksheetUri)
+            env_group = EnvironmentService.get_environment_group(
+                session, worksheet.SamlAdminGroupName, environment.environmentUri
+            )
+
+            cache_key = WorksheetQueryCache.cache_key(
+                session, environment.AwsAccountId, env_group.environmentAthenaWorkGroup, sqlQuery
+            )
+            if cache_key:
+                since = datetime.datetime.now() - datetime.timedelta(seconds=WorksheetQueryCache.TTL_SECONDS)
+                cached_result = WorksheetRepository.find_cached_query_result(session, cache_key, since)
+                if cached_result:
+                    logger.info(f'Returning the cached results of query {cached_result.AthenaQueryId}')
+                    worksheet.lastSavedAthenaQueryIdForQuery = cached_result.AthenaQueryId
+                    return WorksheetService._query_result_to_dict(cached_result, cached=True)
+
+            s3_staging_dir = WorksheetService._s3_staging_dir(environment, env_group)
+            query_id = AthenaClient.start_query_execution(
+                aws_account_id=environment.AwsAccountId,
+                env_group=env_group,
+                s3_staging_dir=s3_staging_dir,
+                region=environment.region,
+                sql=sqlQuery,
+            )
+            query_result = WorksheetQueryResult(
+                worksheetUri=worksheet.worksheetUri,
+                AthenaQueryId=query_id,
+                status='QUEUED',
+                queryType=QueryType.data,
+                sqlBody=sqlQuery,
+                AwsAccountId=environment.AwsAccountId,
+                region=environment.region,
+                OutputLocation=f'{s3_staging_dir}{query_id}.csv',
+                AthenaWorkGroup=env_group.environmentAthenaWorkGroup,
+                cacheKey=cache_key,
+            )
+            session.add(query_result)
+            worksheet.lastSavedAthenaQueryIdForQuery = query_id
+            return WorksheetService._query_result_to_dict(query_result)
 
-            return AthenaClient.convert_query_output(cursor)
+    @staticmethod
+    @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
+    def poll_sql_query(uri, worksheetUri, athenaQueryId):
+        with get_context().db_engine.scoped_session() as session:
+            environment, env_group, query_result = WorksheetService._get_query_result(
+                session, uri, worksheetUri, athenaQueryId
+            )
+            if query_result.status not in QUERY_FINAL_STATES:
+                execution = AthenaClient.get_query_execution(
+                    aws_account_id=environment.AwsAccountId,
+                    env_group=env_group,
+                    region=environment.region,
+                    query_id=athenaQueryId,
+                )
+                query_result.status = execution['Status']
+                query_result.error = execution['Error']
+                query_result.OutputLocation = execution['OutputLocation'] or query_result.OutputLocation
+                query_result.ElapsedTimeInMs = execution['ElapsedTimeInMs']
+                query_result.DataScannedInBytes = execution['DataScannedInBytes']
+            return WorksheetService._query_result_to_dict(query_result)
+
+    @staticmethod
+    @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
+    def get_sql_query_results(uri, worksheetUri, athenaQueryId, nextToken=None, maxRows=None, columnar=False):
+        with get_context().db_engine.scoped_session() as session:
+            environment, env_group, query_result = WorksheetService._get_query_result(
+                session, uri, worksheetUri, athenaQueryId
+            )
+            if query_result.status != 'SUCCEEDED':
+                raise exceptions.InvalidInput(
+                    'athenaQueryId', athenaQueryId, f'a succeeded query ({query_result.status})'
+                )
+            results = AthenaClient.get_query_results(
+                aws_account_id=environment.AwsAccountId,
+                env_group=env_group,
+                region=environment.region,
+                query_id=athenaQueryId,
+                next_token=nextToken,
+                max_rows=maxRows,
+                columnar=columnar,
+            )
+            return dict(WorksheetService._query_result_to_dict(query_result), **results)
+
+    @staticmethod
+    def _get_query_result(session, uri, worksheetUri, athenaQueryId):
+        """Returns the query result of a query of the team of the worksheet, with its environment and team"""
+        environment = EnvironmentService.get_environment_by_uri(session, uri)
+        worksheet = WorksheetService._get_worksheet_by_uri(session, worksheetUri)
+        env_group = EnvironmentService.get_environment_group(
+            session, worksheet.SamlAdminGroupName, environment.environmentUri
+        )
+        query_result = WorksheetRepository.find_query_result(session, athenaQueryId)
+        if not query_result or query_result.AthenaWorkGroup != env_group.environmentAthenaWorkGroup:
+            raise exceptions.ObjectNotFound('WorksheetQueryResult', athenaQueryId)
+        return environment, env_group, query_result
+
+    @staticmethod
+    def _check_query_workgroup(session, environment, env_group, athenaQueryId):
+        """Raises ObjectNotFound if the query was not run in the Athena workgroup of the team"""
+        query_result = WorksheetRepository.find_query_result(session, athenaQueryId)
+        if query_result:
+            workgroup = query_result.AthenaWorkGroup
+        else:  # queries run by run_sql_query are not recorded
+            workgroup = AthenaClient.get_query_execution(
+                aws_account_id=environment.AwsAccountId,
+                env_group=env_group,
+                region=environment.region,
+                query_id=athenaQueryId,
+            )['WorkGroup']
+        if workgroup != env_group.environmentAthenaWorkGroup:
+            raise exceptions.ObjectNotFound('WorksheetQueryResult', athenaQueryId)
+
+    @staticmethod
+    def _query_result_to_dict(query_result: WorksheetQueryResult, cached=False) -> dict:
+        return {
+            'AthenaQueryId': query_result.AthenaQueryId,
+            'Status': query_result.status,
+            'Error': query_result.error,
+            'OutputLocation': query_result.OutputLocation,
+            'AwsAccountId': query_result.AwsAccountId,
+            'region': query_result.region,
+            'ElapsedTimeInMs': query_result.ElapsedTimeInMs,
+            'DataScannedInBytes': query_result.DataScannedInBytes,
+            'cached': cached,
+        }
+
+    @staticmethod
+    def _s3_staging_dir(environment, env_group) -> str:
+        return f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/'
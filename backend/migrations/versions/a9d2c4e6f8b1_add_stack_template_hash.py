@@ -0,0 +1,24 @@
+"""add_stack_template_hash
+
+Revision ID: a9d2c4e6f8b1
+Revises: e3b8f1c2a7d4
+Create Date: 2024-06-03 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a9d2c4e6f8b1'
+down_revision = 'e3b8f1c2a7d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('stack', sa.Column('templateHash', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('stack', 'templateHash')
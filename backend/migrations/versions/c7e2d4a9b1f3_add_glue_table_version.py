@@ -0,0 +1,24 @@
+"""add_glue_table_version
+
+Revision ID: c7e2d4a9b1f3
+Revises: a4f8b2c1d3e5
+Create Date: 2024-05-20 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2d4a9b1f3'
+down_revision = 'a4f8b2c1d3e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('dataset_table', sa.Column('GlueTableVersion', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('dataset_table', 'GlueTableVersion')
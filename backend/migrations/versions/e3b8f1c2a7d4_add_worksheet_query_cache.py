@@ -0,0 +1,30 @@
+"""add_worksheet_query_cache
+
+Revision ID: e3b8f1c2a7d4
+Revises: c7e2d4a9b1f3
+Create Date: 2024-05-27 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8f1c2a7d4'
+down_revision = 'c7e2d4a9b1f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('worksheet_query_result', 'DataScannedInBytes', type_=sa.BigInteger(), existing_nullable=True)
+    op.add_column('worksheet_query_result', sa.Column('AthenaWorkGroup', sa.String(), nullable=True))
+    op.add_column('worksheet_query_result', sa.Column('cacheKey', sa.String(), nullable=True))
+    op.create_index(op.f('ix_worksheet_query_result_cacheKey'), 'worksheet_query_result', ['cacheKey'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_worksheet_query_result_cacheKey'), table_name='worksheet_query_result')
+    op.drop_column('worksheet_query_result', 'cacheKey')
+    op.drop_column('worksheet_query_result', 'AthenaWorkGroup')
+    op.alter_column('worksheet_query_result', 'DataScannedInBytes', type_=sa.Integer(), existing_nullable=True)
@@ -219,10 +219,11 @@ class ContainerStack(pyNestedClass):
             command=[f'python{PYTHON_VERSION}', '-m', 'dataall.modules.catalog.tasks.catalog_indexer_task'],
             container_id=container_id,
             ecr_repository=self._ecr_repository,
-            environment=self._create_env(),
+            # incremental runs, the catalog is reconciled with a full run every CATALOG_INDEXER_RECONCILE_HOURS
+            environment={**self._create_env(), 'incremental': 'True'},
             image_tag=self._cdkproxy_image_tag,
             log_group=self.create_log_group(self._envname, self._resource_prefix, log_group_name='catalog-indexer'),
-            schedule_expression=Schedule.expression('rate(6 hours)'),
+            schedule_expression=Schedule.expression('rate(15 minutes)'),
             scheduled_task_id=f'{self._resource_prefix}-{self._envname}-catalog-indexer-schedule',
             task_id=f'{self._resource_prefix}-{self._envname}-catalog-indexer',
             task_role=self.task_role,
@@ -724,13 +725,26 @@ class ContainerStack(pyNestedClass):
         if email_custom_domain and ses_configuration_set:
             role_inline_policy.document.add_statements(
                 iam.PolicyStatement(
-                    actions=['ses:SendEmail'],
+                    actions=['ses:SendEmail', 'ses:SendBulkEmail'],
                     resources=[
                         f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
                         f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
+                        f'arn:aws:ses:{self.region}:{self.account}:template/*',
                     ],
                 )
             )
+            role_inline_policy.document.add_statements(
+                iam.PolicyStatement(
+                    actions=['ses:GetEmailTemplate', 'ses:CreateEmailTemplate', 'ses:UpdateEmailTemplate'],
+                    resources=[f'arn:aws:ses:{self.region}:{self.account}:template/*'],
+                )
+            )
+            role_inline_policy.document.add_statements(
+                iam.PolicyStatement(
+                    actions=['ses:GetAccount'],
+                    resources=['*'],
+                )
+            )
 
         task_role = iam.Role(
             self,
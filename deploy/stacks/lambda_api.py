@@ -265,7 +265,8 @@ class LambdaApiStack(pyNestedClass):
         self.aws_handler.add_event_source(
             lambda_event_sources.SqsEventSource(
                 queue=sqs_queue,
-                batch_size=1,
+                batch_size=10,
+                report_batch_item_failures=True,
             )
         )
 
@@ -273,13 +274,26 @@ class LambdaApiStack(pyNestedClass):
         if email_custom_domain is not None:
             self.aws_handler.add_to_role_policy(
                 iam.PolicyStatement(
-                    actions=['ses:SendEmail'],
+                    actions=['ses:SendEmail', 'ses:SendBulkEmail'],
                     resources=[
                         f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
                         f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
+                        f'arn:aws:ses:{self.region}:{self.account}:template/*',
                     ],
                 )
             )
+            self.aws_handler.add_to_role_policy(
+                iam.PolicyStatement(
+                    actions=['ses:GetEmailTemplate', 'ses:CreateEmailTemplate', 'ses:UpdateEmailTemplate'],
+                    resources=[f'arn:aws:ses:{self.region}:{self.account}:template/*'],
+                )
+            )
+            self.aws_handler.add_to_role_policy(
+                iam.PolicyStatement(
+                    actions=['ses:GetAccount'],
+                    resources=['*'],
+                )
+            )
 
         # Auth handler Lambda for cookie-based authentication
         self.auth_handler_dlq = self.set_dlq(f'{resource_prefix}-{envname}-authhandler-dlq')
@@ -0,0 +1,44 @@
+import json
+
+from dataall.base.api import bootstrap, get_executable_schema, gql
+from dataall.base.api.schema_artifact import (
+    build_schema_artifact,
+    get_executable_schema_from_artifact,
+    load_schema_artifact,
+)
+
+
+def test_schema_artifact_round_trip(tmp_path):
+    artifact = build_schema_artifact(bootstrap())
+    path = tmp_path / 'graphql_schema.json'
+    path.write_text(json.dumps(artifact))
+
+    loaded = load_schema_artifact(str(path))
+
+    assert loaded == artifact
+    assert 'getDataset' in loaded['resolvers']['Query']
+
+    schema = get_executable_schema_from_artifact(loaded)
+    expected = get_executable_schema()
+    assert set(schema.type_map) == set(expected.type_map)
+    assert set(schema.query_type.fields) == set(expected.query_type.fields)
+
+
+def test_schema_artifact_of_other_modules(tmp_path):
+    artifact = build_schema_artifact(bootstrap())
+    artifact['modules'] = ['another_module']
+    path = tmp_path / 'graphql_schema.json'
+    path.write_text(json.dumps(artifact))
+
+    assert load_schema_artifact(str(path)) is None
+    assert load_schema_artifact(str(tmp_path / 'missing.json')) is None
+
+
+def test_schema_artifact_binds_registered_resolvers():
+    artifact = build_schema_artifact(bootstrap())
+    schema = get_executable_schema_from_artifact(artifact)
+
+    # listDatasetTables is resolved by a lambda
+    for name in ['getDataset', 'listDatasetTables']:
+        adapted = schema.query_type.fields[name].resolve
+        assert adapted.__closure__[0].cell_contents is gql.QueryField.get_instance(name).resolver
@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.aws.lakeformation import LakeFormationBatch
+
+
+def _resource(i):
+    return {'Table': {'DatabaseName': 'db', 'Name': f'table{i}'}}
+
+
+def _failures(entries, codes):
+    """Builds the Failures of a batch response, codes maps the table name to the error code"""
+    failures = []
+    for entry in entries:
+        code = codes.get(entry['Resource']['Table']['Name'])
+        if code:
+            failures.append(
+                {'RequestEntry': {'Id': entry['Id']}, 'Error': {'ErrorCode': code, 'ErrorMessage': f'{code} message'}}
+            )
+    return {'Failures': failures}
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.batch_grant_permissions.side_effect = lambda Entries: _failures(Entries, {})
+    client.batch_revoke_permissions.side_effect = lambda Entries: _failures(Entries, {})
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_wait(mocker):
+    mocker.patch.object(LakeFormationBatch, 'WAIT_MIN_SECONDS', 0)
+    mocker.patch.object(LakeFormationBatch, 'WAIT_MAX_SECONDS', 0)
+
+
+def test_batch_sends_chunks_of_20_entries(client):
+    batch = LakeFormationBatch(client)
+    for i in range(25):
+        batch.grant('role', _resource(i), ['ALL'])
+    batch.revoke('role', _resource(0), ['SELECT'], ['SELECT'])
+
+    assert batch.flush() == []
+    assert [len(call.kwargs['Entries']) for call in client.batch_grant_permissions.call_args_list] == [20, 5]
+    revoked = client.batch_revoke_permissions.call_args.kwargs['Entries'][0]
+    assert revoked['PermissionsWithGrantOption'] == ['SELECT']
+    assert batch.flush() == []
+    assert client.batch_grant_permissions.call_count == 2
+
+
+def test_batch_retries_concurrent_modifications(client):
+    attempts = []
+
+    def grant(Entries):
+        attempts.append(Entries)
+        return _failures(Entries, {'table1': 'ConcurrentModificationException'} if len(attempts) == 1 else {})
+
+    client.batch_grant_permissions.side_effect = grant
+    batch = LakeFormationBatch(client)
+    batch.grant('role', _resource(0), ['ALL'])
+    batch.grant('role', _resource(1), ['ALL'])
+
+    assert batch.flush() == []
+    assert [entry['Resource'] for entry in attempts[1]] == [_resource(1)]
+
+
+def test_batch_returns_failed_entries(client):
+    client.batch_revoke_permissions.side_effect = lambda Entries: _failures(
+        Entries, {'table1': 'AccessDeniedException'}
+    )
+    batch = LakeFormationBatch(client)
+    batch.revoke('role1', _resource(0), ['ALL'])
+    batch.revoke('role2', _resource(1), ['ALL'])
+
+    [failure] = batch.flush()
+    assert failure.principal == 'role2'
+    assert failure.code == 'AccessDeniedException'
+    assert failure.to_client_error().response['Error']['Code'] == 'AccessDeniedException'
+
+
+def test_list_permissions_by_principal(client):
+    client.list_permissions.side_effect = [
+        {
+            'PrincipalResourcePermissions': [
+                {
+                    'Principal': {'DataLakePrincipalIdentifier': 'role1'},
+                    'Permissions': ['SELECT'],
+                    'PermissionsWithGrantOption': [],
+                }
+            ],
+            'NextToken': 'next',
+        },
+        {
+            'PrincipalResourcePermissions': [
+                {
+                    'Principal': {'DataLakePrincipalIdentifier': 'role1'},
+                    'Permissions': ['DESCRIBE'],
+                    'PermissionsWithGrantOption': ['DESCRIBE'],
+                },
+                {
+                    'Principal': {'DataLakePrincipalIdentifier': 'role2'},
+                    'Permissions': ['ALL'],
+                    'PermissionsWithGrantOption': [],
+                },
+            ]
+        },
+    ]
+
+    permissions = LakeFormationBatch.list_permissions_by_principal(client, _resource(0))
+
+    assert permissions == {'role1': ({'SELECT', 'DESCRIBE'}, {'DESCRIBE'}), 'role2': ({'ALL'}, set())}
+    assert client.list_permissions.call_args.kwargs == {'Resource': _resource(0), 'NextToken': 'next'}
@@ -0,0 +1,100 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.aws.ses import Ses
+
+
+@pytest.fixture(autouse=True)
+def ses_state(mocker):
+    mocker.patch.object(Ses, '_template_created', False)
+    mocker.patch.object(Ses, '_max_send_rate', None)
+    mocker.patch.object(Ses, '_next_send_time', 0)
+
+
+def _ses(max_send_rate=1000):
+    ses = Ses('noreply@dataall.com')
+    ses.client = MagicMock()
+    ses.client.exceptions.NotFoundException = type('NotFoundException', (Exception,), {})
+    ses.client.get_email_template.return_value = {
+        'TemplateContent': {'Subject': '{{{subject}}}', 'Html': '{{{message}}}'}
+    }
+    ses.client.get_account.return_value = {'SendQuota': {'MaxSendRate': max_send_rate}}
+    ses.client.send_bulk_email.side_effect = lambda **kwargs: {
+        'BulkEmailEntryResults': [
+            {'Status': 'SUCCESS', 'MessageId': f'id-{entry["Destination"]["ToAddresses"][0]}'}
+            for entry in kwargs['BulkEmailEntries']
+        ]
+    }
+    return ses
+
+
+def test_send_bulk_email(mocker):
+    ses = _ses()
+    emails = [{'to': f'user{i}@email.com', 'subject': f'subject {i}', 'message': '<b>message</b>'} for i in range(60)]
+
+    results = ses.send_bulk_email(emails)
+
+    calls = ses.client.send_bulk_email.call_args_list
+    assert [len(call.kwargs['BulkEmailEntries']) for call in calls] == [50, 10]
+    entry = calls[1].kwargs['BulkEmailEntries'][0]
+    assert entry['Destination'] == {'ToAddresses': ['user50@email.com']}
+    assert json.loads(entry['ReplacementEmailContent']['ReplacementTemplate']['ReplacementTemplateData']) == {
+        'subject': 'subject 50',
+        'message': '<b>message</b>',
+    }
+    assert results[50] == {
+        'to': 'user50@email.com',
+        'messageId': 'id-user50@email.com',
+        'status': 'SUCCESS',
+        'error': None,
+    }
+    # the template and the send quota are read once per process, not once per client
+    other = _ses()
+    other.send_bulk_email(emails[:1])
+    ses.client.get_email_template.assert_called_once()
+    ses.client.get_account.assert_called_once()
+    other.client.get_email_template.assert_not_called()
+    other.client.get_account.assert_not_called()
+
+
+def test_send_bulk_email_creates_template():
+    ses = _ses()
+    ses.client.get_email_template.side_effect = ses.client.exceptions.NotFoundException()
+
+    ses.send_bulk_email([{'to': 'user@email.com', 'subject': 'subject', 'message': '<b>message</b>'}])
+
+    # the subject and the html message are not escaped by the triple braces
+    ses.client.create_email_template.assert_called_once_with(
+        TemplateName=Ses.TEMPLATE_NAME,
+        TemplateContent={'Subject': '{{{subject}}}', 'Html': '{{{message}}}'},
+    )
+
+
+def test_send_bulk_email_updates_template():
+    ses = _ses()
+    ses.client.get_email_template.return_value = {
+        'TemplateContent': {'Subject': '{{subject}}', 'Html': '{{{message}}}'}
+    }
+
+    ses.send_bulk_email([{'to': 'user@email.com', 'subject': 'subject', 'message': '<b>message</b>'}])
+
+    ses.client.create_email_template.assert_not_called()
+    ses.client.update_email_template.assert_called_once_with(
+        TemplateName=Ses.TEMPLATE_NAME,
+        TemplateContent={'Subject': '{{{subject}}}', 'Html': '{{{message}}}'},
+    )
+
+
+def test_send_bulk_email_respects_send_rate(mocker):
+    sleep = mocker.patch('dataall.base.aws.ses.time.sleep')
+    emails = [{'to': f'user{i}@email.com', 'subject': 'subject', 'message': 'message'} for i in range(50)]
+
+    # the send rate is shared by the clients of the process
+    _ses(max_send_rate=10).send_bulk_email(emails)
+    _ses(max_send_rate=10).send_bulk_email(emails)
+
+    # the first 50 emails are sent right away, the next 50 after 5 seconds at 10 emails/s
+    sleep.assert_called_once()
+    assert 4.9 < sleep.call_args.args[0] <= 5
@@ -0,0 +1,48 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from dataall.base.aws.sqs import SqsQueue
+
+
+@pytest.fixture
+def sqs_client(mocker):
+    client = MagicMock()
+    client.send_message_batch.return_value = {'Successful': [], 'Failed': []}
+    mocker.patch.object(SqsQueue, '_client', client)
+    mocker.patch.object(SqsQueue, 'queue_url', 'https://sqs/queue.fifo')
+    mocker.patch.object(SqsQueue, 'disabled', False)
+    return client
+
+
+def test_send_batch(sqs_client, mocker):
+    mocker.patch.object(SqsQueue, 'TASKS_PER_MESSAGE', 2)
+    task_ids = [f'task{i}' for i in range(25)]
+
+    assert SqsQueue.send_batch(task_ids) == []
+
+    calls = sqs_client.send_message_batch.call_args_list
+    assert [len(call.kwargs['Entries']) for call in calls] == [10, 3]
+    sent = [json.loads(entry['MessageBody']) for call in calls for entry in call.kwargs['Entries']]
+    assert sent[0] == task_ids[:2]
+    assert [taskid for body in sent for taskid in body] == task_ids
+    sqs_client.send_message.assert_not_called()
+
+
+def test_send_batch_returns_unsent_tasks(sqs_client, mocker):
+    mocker.patch.object(SqsQueue, 'TASKS_PER_MESSAGE', 2)
+    sqs_client.send_message_batch.side_effect = [
+        {'Successful': [], 'Failed': [{'Id': '1', 'Code': 'InternalError'}]},
+        ClientError({'Error': {'Code': 'AccessDenied'}}, 'SendMessageBatch'),
+    ]
+    task_ids = [f'task{i}' for i in range(25)]
+
+    assert SqsQueue.send_batch(task_ids) == ['task2', 'task3', *task_ids[20:]]
+
+
+def test_send(sqs_client):
+    SqsQueue.send(None, ['task1'])
+    sqs_client.send_message.assert_called_once()
+    assert json.loads(sqs_client.send_message.call_args.kwargs['MessageBody']) == ['task1']
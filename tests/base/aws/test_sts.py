@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from dataall.base.aws.sts import AssumedRoleCredentialsCache, SessionHelper
+
+
+def _credentials(expires_in):
+    return {
+        'AccessKeyId': 'AKIA',
+        'SecretAccessKey': 'secret',
+        'SessionToken': 'token',
+        'Expiration': datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+    }
+
+
+def test_credentials_are_reused_until_refresh_margin():
+    cache = AssumedRoleCredentialsCache(refresh_margin=900)
+    assume_role = MagicMock(return_value=_credentials(3600))
+    assert cache.get('key', assume_role) is cache.get('key', assume_role)
+    assert assume_role.call_count == 1
+    assert cache.metrics() == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+def test_expiring_credentials_are_refreshed():
+    cache = AssumedRoleCredentialsCache(refresh_margin=900)
+    assume_role = MagicMock(side_effect=[_credentials(600), _credentials(3600)])
+    first = cache.get('key', assume_role)
+    second = cache.get('key', assume_role)
+    assert first is not second
+    assert assume_role.call_count == 2
+
+
+def test_key_locks_are_released():
+    cache = AssumedRoleCredentialsCache(refresh_margin=900)
+    for i in range(10):
+        cache.get(f'key{i}', MagicMock(return_value=_credentials(3600)))
+    with pytest.raises(ValueError):
+        cache.get('failing', MagicMock(side_effect=ValueError))
+    assert cache._key_locks == {}
+
+
+@pytest.fixture
+def assume_role(mocker):
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_external_id_secret', return_value='external-id')
+    base_session = MagicMock()
+    base_session.client.return_value.assume_role.return_value = {'Credentials': _credentials(3600)}
+    yield base_session.client.return_value.assume_role, base_session
+
+
+def test_get_session_assumes_role_once(assume_role):
+    sts_assume_role, base_session = assume_role
+    role_arn = 'arn:aws:iam::111111111111:role/dataallPivotRole'
+    for _ in range(3):
+        session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
+        assert session.get_credentials().get_frozen_credentials().access_key == 'AKIA'
+    sts_assume_role.assert_called_once()
+    assert SessionHelper.get_cache_metrics()['hits'] >= 2
+
+
+def test_remote_client_is_reused(mocker):
+    remote_session = mocker.patch('dataall.base.aws.sts.SessionHelper.remote_session')
+    remote_session.return_value.client.side_effect = lambda *args, **kwargs: MagicMock()
+    first = SessionHelper.remote_client('111111111111', 'eu-west-1', 'glue')
+    assert SessionHelper.remote_client('111111111111', 'eu-west-1', 'glue') is first
+    assert SessionHelper.remote_client('111111111111', 'eu-west-1', 'lakeformation') is not first
+    assert remote_session.call_count == 2
+
+
+def test_remote_calls_are_limited(mocker):
+    mocker.patch.object(SessionHelper, 'get_delegation_role_arn', return_value='arn:aws:iam::111111111111:role/pivot')
+    mocker.patch.object(SessionHelper, 'get_session', side_effect=lambda **kwargs: boto3.Session())
+    client = SessionHelper.remote_session('111111111111', 'eu-west-1').client('glue', region_name='eu-west-1')
+    acquire = MagicMock()
+
+    with Stubber(client) as stubber:
+        stubber.add_response('get_databases', {'DatabaseList': []})
+        stubber.add_response('get_databases', {'DatabaseList': []})
+        with SessionHelper.limit_remote_calls(acquire):
+            client.get_databases()
+        client.get_databases()
+
+    acquire.assert_called_once_with('111111111111')
@@ -0,0 +1,110 @@
+import json
+import os
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.cdkproxy import cdk_cli_wrapper
+from dataall.base.cdkproxy.cdk_cli_wrapper import deploy_cdk_stack, fingerprint_cloud_assembly
+from dataall.core.stacks.db.stack_models import Stack
+
+TEMPLATE = {'Resources': {'Bucket': {'Type': 'AWS::S3::Bucket', 'Properties': {'BucketName': 'bucket'}}}}
+
+
+def _write(path, content, indent=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=indent)
+
+
+def test_fingerprint_ignores_formatting_and_asset_sources(tmp_path):
+    _write(str(tmp_path / 'a' / 'stack.template.json'), TEMPLATE)
+    _write(str(tmp_path / 'b' / 'stack.template.json'), TEMPLATE, indent=2)
+    _write(str(tmp_path / 'b' / 'asset.1234' / 'package.template.json'), {'Resources': {}})
+    _write(str(tmp_path / 'c' / 'stack.template.json'), {'Resources': {}})
+
+    assert fingerprint_cloud_assembly(str(tmp_path / 'a')) == fingerprint_cloud_assembly(str(tmp_path / 'b'))
+    assert fingerprint_cloud_assembly(str(tmp_path / 'a')) != fingerprint_cloud_assembly(str(tmp_path / 'c'))
+
+
+@pytest.fixture
+def stack(db):
+    with db.scoped_session() as session:
+        stack = Stack(
+            targetUri='target',
+            accountid='111111111111',
+            region='eu-west-1',
+            stack='environment',
+            name='stack-name',
+            status='CREATE_COMPLETE',
+        )
+        session.add(stack)
+        session.commit()
+        yield stack
+        session.delete(stack)
+
+
+@pytest.fixture
+def cdk(mocker):
+    mocker.patch.object(cdk_cli_wrapper, 'FINGERPRINT_MODE', True)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.boto3.client')
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.update_stack_output')
+    mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.describe_stack',
+        return_value={'StackId': 'arn:stack', 'StackStatus': 'UPDATE_COMPLETE'},
+    )
+
+    def run_cdk(stack, command, app, env, cwd, extra_args=None):
+        if command.startswith('synth'):
+            _write(os.path.join(extra_args[1], 'stack.template.json'), TEMPLATE)
+        return MagicMock(returncode=0)
+
+    return mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper._run_cdk', side_effect=run_cdk)
+
+
+def _commands(cdk):
+    return [call.args[1] for call in cdk.call_args_list]
+
+
+def test_deploy_skips_unchanged_templates(db, stack, cdk):
+    deploy_cdk_stack(db, stack.stackUri)
+    assert _commands(cdk) == ['synth --all --quiet', 'deploy --all']
+
+    deploy_cdk_stack(db, stack.stackUri)
+    assert _commands(cdk) == ['synth --all --quiet', 'deploy --all', 'synth --all --quiet']
+
+    with db.scoped_session() as session:
+        deployed = session.query(Stack).get(stack.stackUri)
+        assert deployed.status == 'UPDATE_COMPLETE'
+        assert deployed.templateHash
+        assert deployed.events['deployment']['skipped']
+        assert set(deployed.events['deployment']['timings']) == {'synth', 'diff'}
+
+    deploy_cdk_stack(db, stack.stackUri, force=True)
+    assert _commands(cdk)[-2:] == ['synth --all --quiet', 'deploy --all']
+
+
+def test_deploy_with_synth_pool(db, stack, cdk, mocker):
+    mocker.patch.object(cdk_cli_wrapper, 'FINGERPRINT_MODE', False)
+    synth_pool = MagicMock()
+    synth_pool.synth.return_value = subprocess.CompletedProcess([], returncode=0)
+
+    deploy_cdk_stack(db, stack.stackUri, synth_pool=synth_pool)
+
+    assert synth_pool.synth.call_count == 1
+    assert _commands(cdk) == ['deploy --all']
+    # the cloud assembly synthesized by the pool is deployed
+    assert cdk.call_args.args[2] == synth_pool.synth.call_args.args[2]
+
+
+def test_deploy_with_synth_pool_and_context_lookups(db, stack, cdk, mocker):
+    mocker.patch.object(cdk_cli_wrapper, 'FINGERPRINT_MODE', False)
+    synth_pool = MagicMock()
+    synth_pool.synth.return_value = None
+
+    deploy_cdk_stack(db, stack.stackUri, synth_pool=synth_pool)
+
+    # the cdk cli resolves the lookups and synthesizes the app to the cloud assembly that is deployed
+    assert _commands(cdk) == ['synth --all --quiet', 'deploy --all']
+    assert cdk.call_args.args[2] == cdk.call_args_list[0].args[5][1]
@@ -0,0 +1,28 @@
+import json
+import os
+
+from dataall.base.cdkproxy.cdk_synth_pool import _environ, _missing_context
+
+
+def test_environ_is_restored(monkeypatch):
+    monkeypatch.setenv('envname', 'worker')
+    monkeypatch.delenv('AWS_SESSION_TOKEN', raising=False)
+
+    with _environ({'envname': 'deployment', 'AWS_SESSION_TOKEN': 'token'}):
+        assert os.environ['envname'] == 'deployment'
+        assert os.environ['AWS_SESSION_TOKEN'] == 'token'
+
+    assert os.environ['envname'] == 'worker'
+    assert 'AWS_SESSION_TOKEN' not in os.environ
+
+
+def test_missing_context(tmp_path):
+    manifest = {
+        'version': '36.0.0',
+        'missing': [{'key': 'vpc-provider:account=111111111111:region=eu-west-1', 'provider': 'vpc-provider'}],
+    }
+    (tmp_path / 'manifest.json').write_text(json.dumps(manifest))
+    assert _missing_context(str(tmp_path)) == ['vpc-provider:account=111111111111:region=eu-west-1']
+
+    (tmp_path / 'manifest.json').write_text(json.dumps({'version': '36.0.0'}))
+    assert _missing_context(str(tmp_path)) == []
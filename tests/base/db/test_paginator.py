@@ -0,0 +1,138 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from dataall.base.db import paginate
+from dataall.base.db.paginator import _decode_value, _encode_value
+from dataall.core.activity.db.activity_models import Activity
+
+
+@pytest.fixture(scope='module')
+def activities(db):
+    with db.scoped_session() as session:
+        items = [
+            Activity(
+                activityUri=f'paginator-{i:02d}',
+                targetUri=f'target-{i % 3}',
+                targetType='paginator',
+                action='paginator:test',
+                label='paginator',
+                owner='alice',
+                summary=f'activity {i}',
+                deleted=None if i % 4 == 0 else datetime(2024, 1, 1 + i % 5),
+            )
+            for i in range(25)
+        ]
+        session.add_all(items)
+    yield items
+    with db.scoped_session() as session:
+        session.query(Activity).filter(Activity.targetType == 'paginator').delete()
+
+
+def _query(session):
+    return session.query(Activity).filter(Activity.targetType == 'paginator').order_by(Activity.targetUri)
+
+
+def test_paginate_counts_in_database(db, activities):
+    with db.scoped_session() as session:
+        page = paginate(_query(session), page=3, page_size=10).to_dict()
+        assert page['count'] == 25
+        assert page['pages'] == 3
+        assert len(page['nodes']) == 5
+        assert not page['hasNext']
+        assert page['hasPrevious']
+
+
+def test_paginate_count_deduplicates_entities(db, activities):
+    with db.scoped_session() as session:
+        other = Activity.__table__.alias('other')
+        duplicating = (
+            session.query(Activity)
+            .join(other, other.c.targetType == Activity.targetType)
+            .filter(Activity.targetType == 'paginator')
+        )
+        page = paginate(duplicating, page=1, page_size=100).to_dict()
+        assert page['count'] == len(duplicating.all()) == 25
+
+
+def test_paginate_without_total(db, activities):
+    with db.scoped_session() as session:
+        page = paginate(_query(session), page=1, page_size=10, with_total=False).to_dict()
+        assert page['count'] is None
+        assert page['pages'] is None
+        assert len(page['nodes']) == 10
+        assert page['hasNext']
+
+
+def test_paginate_with_cursor(db, activities):
+    with db.scoped_session() as session:
+        offset_uris = [a.activityUri for a in _query(session).order_by(Activity.activityUri).all()]
+        cursor_uris = [a.activityUri for a in _paginate_with_cursor(_query(session), page_size=7)]
+        assert cursor_uris == offset_uris
+
+
+def test_paginate_keeps_ordering_without_cursor(db, activities):
+    with db.scoped_session() as session:
+        query = session.query(Activity).filter(Activity.targetType == 'paginator')
+        page = paginate(query.order_by(Activity.deleted.desc()), page=1, page_size=7).to_dict()
+        assert page['nextCursor'] is None
+        # postgres orders NULL values first in DESC order
+        assert [a.deleted for a in page['nodes']] == [None] * 7
+
+
+def test_paginate_invalid_cursor(db, activities):
+    with db.scoped_session() as session:
+        with pytest.raises(AttributeError):
+            paginate(_query(session), page=1, page_size=7, cursor='bm90LWEtY3Vyc29y')
+
+
+def _paginate_with_cursor(query, page_size):
+    items, cursor = [], None
+    while True:
+        page = paginate(query, page=1, page_size=page_size, cursor=cursor, with_cursor=True).to_dict()
+        items.extend(page['nodes'])
+        cursor = page['nextCursor']
+        if not page['hasNext']:
+            return items
+
+
+@pytest.mark.parametrize(
+    'ordering, descending, nulls_first',
+    [
+        (Activity.deleted.asc(), False, False),
+        (Activity.deleted.desc(), True, True),  # postgres default
+        (Activity.deleted.desc().nulls_last(), True, False),
+        (Activity.deleted.asc().nulls_first(), False, True),
+    ],
+)
+def test_paginate_with_cursor_on_nullable_column(db, activities, ordering, descending, nulls_first):
+    with db.scoped_session() as session:
+        query = session.query(Activity).filter(Activity.targetType == 'paginator').order_by(ordering)
+        uris = [a.activityUri for a in _paginate_with_cursor(query, page_size=4)]
+
+    with_deleted = sorted((a for a in activities if a.deleted), key=lambda a: a.activityUri)
+    with_deleted = [a.activityUri for a in sorted(with_deleted, key=lambda a: a.deleted, reverse=descending)]
+    without_deleted = sorted(a.activityUri for a in activities if not a.deleted)
+    expected = without_deleted + with_deleted if nulls_first else with_deleted + without_deleted
+    assert uris == expected
+
+
+def test_paginate_with_cursor_on_selected_columns(db, activities):
+    with db.scoped_session() as session:
+        query = (
+            session.query(Activity.activityUri, Activity.deleted)
+            .filter(Activity.targetType == 'paginator')
+            .order_by(Activity.deleted)
+        )
+        rows = _paginate_with_cursor(query, page_size=6)
+        assert [row.activityUri for row in rows] == [row.activityUri for row in query.order_by(Activity.activityUri)]
+        assert len(rows) == 25
+
+
+def test_cursor_values():
+    values = [datetime(2024, 1, 2, 3, 4), date(2024, 1, 2), Decimal('1.50'), 'text', 1, None]
+    assert [_decode_value(_encode_value(value)) for value in values] == values
+    with pytest.raises(TypeError):
+        _encode_value(Enum('Status', 'Approved').Approved)
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+from dataall.base.searchproxy import INDEX_ALIAS, INDEX_VERSION, create_versioned_index, index_version, swap_alias
+
+
+def test_create_versioned_index_for_bulk_load():
+    es = MagicMock()
+    index = create_versioned_index(es, bulk_load=True)
+
+    assert index.startswith(f'{INDEX_ALIAS}-{INDEX_VERSION}-')
+    body = es.indices.create.call_args.kwargs['body']
+    assert body['mappings']['_meta'] == {'version': INDEX_VERSION}
+    assert body['settings'] == {'index': {'refresh_interval': '-1', 'number_of_replicas': 0}}
+    assert 'aliases' not in body
+
+
+def test_create_versioned_index_with_alias():
+    es = MagicMock()
+    create_versioned_index(es)
+
+    assert es.indices.create.call_args.kwargs['body']['aliases'] == {INDEX_ALIAS: {}}
+
+
+def test_index_version():
+    es = MagicMock()
+    es.indices.get_mapping.return_value = {'dataall-index': {'mappings': {'properties': {}}}}
+    assert index_version(es) is None
+
+    es.indices.get_mapping.return_value = {'dataall-index-v2': {'mappings': {'_meta': {'version': INDEX_VERSION}}}}
+    assert index_version(es) == INDEX_VERSION
+
+
+def test_swap_alias_replaces_previous_index():
+    es = MagicMock()
+    es.indices.exists.return_value = True
+    es.indices.get.return_value = {'dataall-index-old': {}}
+    es.indices.get_settings.return_value = {'dataall-index-old': {'settings': {'index': {'number_of_replicas': '2'}}}}
+
+    swap_alias(es, 'dataall-index-new')
+
+    es.indices.put_settings.assert_called_once_with(
+        index='dataall-index-new', body={'index': {'refresh_interval': None, 'number_of_replicas': 2}}
+    )
+    es.indices.refresh.assert_called_once_with(index='dataall-index-new')
+    # the alias is moved and the previous index removed in one atomic request
+    es.indices.update_aliases.assert_called_once_with(
+        body={
+            'actions': [
+                {'add': {'index': 'dataall-index-new', 'alias': INDEX_ALIAS}},
+                {'remove_index': {'index': 'dataall-index-old'}},
+            ]
+        }
+    )
+
+
+def test_swap_alias_without_previous_index():
+    es = MagicMock()
+    es.indices.exists.return_value = False
+
+    swap_alias(es, 'dataall-index-new')
+
+    assert es.indices.put_settings.call_args.kwargs['body']['index']['number_of_replicas'] == 1
+    es.indices.update_aliases.assert_called_once_with(
+        body={'actions': [{'add': {'index': 'dataall-index-new', 'alias': INDEX_ALIAS}}]}
+    )
@@ -0,0 +1,87 @@
+import pytest
+
+from dataall.base.utils.iam_policy_utils import (
+    POLICY_LIMIT,
+    pack_resource_statements_in_chunks,
+    policy_size,
+    split_policy_statements_in_chunks,
+)
+
+
+def _statement(sid, resources, actions=None):
+    return {'Sid': sid, 'Effect': 'Allow', 'Action': actions or ['s3:GetObject'], 'Resource': resources}
+
+
+def _buckets(prefix, count):
+    return [f'arn:aws:s3:::{prefix}-bucket-with-a-rather-long-name-{i}' for i in range(count)]
+
+
+def _resources(chunks, sid):
+    return [r for chunk in chunks for s in chunk if s['Sid'].startswith(sid) for r in s['Resource']]
+
+
+def test_policy_size_is_minified_json():
+    assert policy_size(_statement('Sid', ['a'])) == len(
+        '{"Sid":"Sid","Effect":"Allow","Action":["s3:GetObject"],"Resource":["a"]}'
+    )
+
+
+def test_split_statements_first_fit_decreasing():
+    small = [_statement(f'Small{i}', _buckets('small', 1)) for i in range(4)]
+    large = [_statement(f'Large{i}', _buckets(f'large{i}', 60)) for i in range(2)]
+
+    chunks = split_policy_statements_in_chunks(small + large)
+
+    # the small statements fill the space left by the large ones instead of opening a new chunk
+    assert len(chunks) == 2
+    assert [chunk[0]['Sid'] for chunk in chunks] == ['Large0', 'Large1']
+    assert sorted(s['Sid'] for chunk in chunks for s in chunk) == sorted(s['Sid'] for s in small + large)
+
+
+def test_split_statements_too_large():
+    with pytest.raises(Exception):
+        split_policy_statements_in_chunks([_statement('Huge', _buckets('huge', 200))])
+
+
+def test_pack_resource_statements_merges_and_fits():
+    statements = [
+        _statement('BucketStatementS3', _buckets('a', 150)),
+        _statement('BucketStatementS3', _buckets('b', 150) + _buckets('a', 1)),
+        _statement('BucketStatementKMS', ['arn:aws:kms:eu-west-1:111111111111:key/key'], ['kms:*']),
+    ]
+
+    chunks = pack_resource_statements_in_chunks(statements)
+
+    assert all(policy_size({'Version': '2012-10-17', 'Statement': chunk}) <= POLICY_LIMIT for chunk in chunks)
+    assert _resources(chunks, 'BucketStatementS3') == _buckets('a', 150) + _buckets('b', 150)
+    assert [s['Sid'] for s in chunks[0]] == ['BucketStatementS31']
+    # the KMS key is packed in the space left by the S3 resources instead of a new chunk
+    assert [s['Sid'] for s in chunks[-1]] == ['BucketStatementS33', 'BucketStatementKMS3']
+    total_size = sum(policy_size(r) + 1 for r in _resources(chunks, ''))
+    assert len(chunks) == -(-total_size // POLICY_LIMIT)
+
+
+def test_pack_resource_statements_keeps_current_placement():
+    current_chunks = pack_resource_statements_in_chunks([_statement('BucketStatementS3', _buckets('a', 200))])
+    new_buckets = _buckets('new', 2)
+    removed = current_chunks[1][0]['Resource'][0]
+
+    chunks = pack_resource_statements_in_chunks(
+        [_statement('BucketStatementS3', [r for r in _buckets('a', 200) if r != removed] + new_buckets)],
+        current_chunks,
+    )
+
+    # only the last chunk, which lost a resource and has space for the new ones, changes
+    assert len(chunks) == len(current_chunks) == 2
+    assert chunks[0] == current_chunks[0]
+    assert chunks[1][0]['Resource'] == current_chunks[1][0]['Resource'][1:] + new_buckets
+
+
+def test_pack_resource_statements_repacks_fragmented_chunks():
+    current_chunks = pack_resource_statements_in_chunks([_statement('BucketStatementS3', _buckets('a', 200))])
+    remaining = [r for r in _buckets('a', 200) if r not in current_chunks[0][0]['Resource'][20:]]
+
+    chunks = pack_resource_statements_in_chunks([_statement('BucketStatementS3', remaining)], current_chunks)
+
+    assert len(chunks) < len(current_chunks)
+    assert sorted(_resources(chunks, 'BucketStatementS3')) == sorted(remaining)
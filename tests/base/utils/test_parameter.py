@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.utils.parameter import Parameter, ParameterCache, parameter_cache
+
+
+def test_parameter_cache_ttl(mocker):
+    now = mocker.patch('dataall.base.utils.parameter.time.monotonic', return_value=1000)
+    cache = ParameterCache()
+    cache.set_ttl('/dataall/test/reauth', 10)
+    cache.put('eu-west-1', '/dataall/test/reauth/apis', 'createDataset')
+    cache.put('eu-west-1', '/dataall/test/ecs/cluster/name', 'cluster')
+
+    now.return_value = 1009
+    assert cache.get('eu-west-1', '/dataall/test/reauth/apis') == (True, 'createDataset')
+    now.return_value = 1010
+    assert cache.get('eu-west-1', '/dataall/test/reauth/apis') == (False, None)
+    assert cache.get('eu-west-1', '/dataall/test/ecs/cluster/name') == (True, 'cluster')
+
+
+def test_parameter_cache_negative_entries_and_invalidation():
+    cache = ParameterCache()
+    cache.put('eu-west-1', '/dataall/test/missing', None)
+    cache.put('eu-west-1', '/dataall/test/present', 'value')
+    assert cache.get('eu-west-1', '/dataall/test/missing') == (True, None)
+    assert cache.get('us-east-1', '/dataall/test/present') == (False, None)
+
+    cache.invalidate('/dataall/test/missing')
+    assert cache.get('eu-west-1', '/dataall/test/missing') == (False, None)
+    assert cache.get('eu-west-1', '/dataall/test/present') == (True, 'value')
+    cache.invalidate()
+    assert cache.get('eu-west-1', '/dataall/test/present') == (False, None)
+
+
+@pytest.fixture
+def ssm(mocker):
+    client = MagicMock()
+    mocker.patch.object(Parameter, 'ssm', return_value=client)
+    yield client
+    parameter_cache.invalidate()
+
+
+def test_prefetch_parameters_in_batches(ssm):
+    ssm.get_parameters.side_effect = lambda Names: {
+        'Parameters': [{'Name': name, 'Value': name.upper()} for name in Names if 'missing' not in name],
+        'InvalidParameters': [name for name in Names if 'missing' in name],
+    }
+    Parameter.prefetch_parameters(env='test', paths=[f'param/{i}' for i in range(11)] + ['missing'])
+
+    assert ssm.get_parameters.call_count == 2
+    assert parameter_cache.get(Parameter.region(), '/dataall/test/param/3') == (True, '/DATAALL/TEST/PARAM/3')
+    assert parameter_cache.get(Parameter.region(), '/dataall/test/missing') == (True, None)
@@ -6,13 +6,16 @@ from unittest.mock import MagicMock
 import pytest
 from starlette.testclient import TestClient
 
+from dataall.base.aws.sts import SessionHelper
 from dataall.base.config import config
+from dataall.base.services.service_provider import group_emails_cache
+from dataall.base.utils import parameter_cache
 from dataall.base.db import get_engine, create_schema_and_tables, Engine
 from dataall.base.loader import load_modules, ImportMode, list_loaded_modules
 from dataall.core.groups.db.group_models import Group
 from dataall.core.permissions.services.permission_service import PermissionService
 from dataall.core.permissions.services.tenant_permissions import TENANT_ALL
-from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
+from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService, tenant_permission_cache
 from tests.client import create_app, ClientWrapper
 
 for module in config.get_property('modules'):
@@ -171,6 +174,16 @@ def patch_ssm(mocker):
     mocker.patch('dataall.base.utils.parameter.Parameter.get_parameter', return_value='param')
 
 
+@pytest.fixture(scope='function', autouse=True)
+def clear_aws_caches():
+    """clients, parameters, permissions and group emails cached in the process must not leak between tests"""
+    SessionHelper.clear_cache()
+    parameter_cache.invalidate()
+    tenant_permission_cache.invalidate()
+    group_emails_cache.invalidate()
+    yield
+
+
 @pytest.fixture(scope='module', autouse=True)
 def patch_stack_tasks(module_mocker):
     module_mocker.patch(
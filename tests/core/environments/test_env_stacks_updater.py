@@ -1,7 +1,16 @@
-from dataall.core.environment.tasks.env_stacks_updater import update_stacks
+import pytest
 
+from dataall.core.environment.tasks.env_stacks_updater import StackUpdateScheduler, update_stacks
 
-def test_stacks_update(db, org_fixture, env_fixture, mocker):
+
+@pytest.fixture
+def ecs_cluster(mocker):
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Parameter.get_parameter', return_value='cluster')
+    mocker.patch.object(StackUpdateScheduler, 'POLL_INTERVAL_SECONDS', 0)
+    return mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs.list_running_tasks', return_value={})
+
+
+def test_stacks_update(db, org_fixture, env_fixture, ecs_cluster, mocker):
     mocker.patch(
         'dataall.core.environment.tasks.env_stacks_updater.update_stack',
         return_value=True,
@@ -9,3 +18,51 @@ def test_stacks_update(db, org_fixture, env_fixture, mocker):
     envs, others = update_stacks(engine=db, envname='local')
     assert envs == 1
     assert others == 0
+
+
+def test_scheduler_respects_limits_and_waves(ecs_cluster, mocker):
+    mocker.patch.object(StackUpdateScheduler, 'MAX_CONCURRENCY', 3)
+    mocker.patch.object(StackUpdateScheduler, 'MAX_PER_ACCOUNT', 2)
+    running = {}
+    launched = []
+
+    def update_stack(target_uri, running_tasks_started_by, **kwargs):
+        if f'awsworker-{target_uri}' in running_tasks_started_by:
+            return None
+        assert len(running) < 3
+        assert sum(1 for uri in running.values() if uri[0] == target_uri[0]) < 2
+        launched.append(target_uri)
+        running[f'arn-{target_uri}'] = target_uri
+        return f'arn-{target_uri}'
+
+    def list_running_tasks(cluster_name):
+        tasks = {arn: f'awsworker-{uri}' for arn, uri in running.items()}
+        tasks['other'] = 'awsworker-a3'  # an update of a3 started by someone else
+        if running:
+            running.pop(next(iter(running)))  # one task completes at each poll
+        return tasks
+
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.update_stack', side_effect=update_stack)
+    ecs_cluster.side_effect = list_running_tasks
+
+    environments = [('a1', 'a'), ('a2', 'a'), ('a3', 'a'), ('b1', 'b'), ('a4', 'a')]
+    datasets = [('a5', 'a'), ('b2', 'b')]
+    StackUpdateScheduler(session=None, envname='local').run([environments, datasets])
+
+    assert sorted(launched[:4]) == ['a1', 'a2', 'a4', 'b1']
+    assert sorted(launched[4:]) == ['a5', 'b2']
+
+
+def test_stacks_update_skips_targets_without_stack(db, org_fixture, env_fixture, ecs_cluster, mocker):
+    finder = mocker.MagicMock()
+    finder.find_stack_uris.return_value = [env_fixture.environmentUri, 'missing']
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.StackFinder.all', return_value=[finder])
+    update_stack = mocker.patch(
+        'dataall.core.environment.tasks.env_stacks_updater.update_stack',
+        return_value=None,
+    )
+    update_stacks(engine=db, envname='local')
+
+    # the environment stack is updated in the wave of the environments and in the wave of the other stacks
+    updated = [call.kwargs['target_uri'] for call in update_stack.call_args_list]
+    assert updated == [env_fixture.environmentUri, env_fixture.environmentUri]
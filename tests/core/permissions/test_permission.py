@@ -1,7 +1,11 @@
 import pytest
 
+from dataall.base.context import RequestContext, dispose_context, get_context, set_context
+from dataall.core.permissions.db.resource_policy.resource_policy_repositories import ResourcePolicyRepository
+from dataall.core.permissions.db.tenant.tenant_policy_repositories import TenantPolicyRepository
 from dataall.core.permissions.db.permission.permission_models import PermissionType
 from dataall.core.permissions.services.permission_service import PermissionService
+from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.base.db import exceptions
 from dataall.core.permissions.services.environment_permissions import ENVIRONMENT_ALL
 from dataall.core.permissions.services.organization_permissions import ORGANIZATION_ALL
@@ -62,3 +66,100 @@ def test_unauthorized_tenant_policy(db, group):
                 permission_name='UNKNOW_PERMISSION',
                 tenant_name='dataall',
             )
+
+
+def test_tenant_permissions_are_cached(db, tenant, mocker):
+    permissions(db, [])
+    spy = mocker.spy(TenantPolicyRepository, 'list_groups_tenant_permissions')
+    groups = ['cached-team-1', 'cached-team-2', 'cached-team-3']
+    with db.scoped_session() as session:
+        TenantPolicyService.attach_groups_tenant_policy(
+            session=session, groups=groups[:2], permissions=[MANAGE_GROUPS], tenant_name=tenant.name
+        )
+        tenant_permissions = TenantPolicyService.get_groups_tenant_permissions(session, groups, tenant.name)
+        assert tenant_permissions == {groups[0]: {MANAGE_GROUPS}, groups[1]: {MANAGE_GROUPS}}
+        for _ in range(2):
+            assert TenantPolicyService.check_user_tenant_permission(
+                session=session,
+                username='alice',
+                groups=groups[:2],
+                permission_name=MANAGE_GROUPS,
+                tenant_name=tenant.name,
+            )
+        assert spy.call_count == 1
+
+        for group in groups[:2]:
+            TenantPolicyService.delete_tenant_policy(session=session, group=group, tenant_name=tenant.name)
+        with pytest.raises(exceptions.TenantUnauthorized):
+            TenantPolicyService.check_user_tenant_permission(
+                session=session,
+                username='alice',
+                groups=groups[:2],
+                permission_name=MANAGE_GROUPS,
+                tenant_name=tenant.name,
+            )
+
+
+@pytest.fixture
+def request_context(db, group):
+    set_context(RequestContext(db_engine=db, username='alice', groups=[group.name], user_id='alice'))
+    yield get_context()
+    dispose_context()
+
+
+def test_resource_permissions_are_cached_in_request(db, group, request_context, mocker):
+    permissions(db, ORGANIZATION_ALL)
+    spy = mocker.spy(ResourcePolicyRepository, 'find_user_resources_permissions')
+    with db.scoped_session() as session:
+        ResourcePolicyService.attach_resource_policy(
+            session=session,
+            group=group.name,
+            permissions=ORGANIZATION_ALL,
+            resource_uri='cached-resource',
+            resource_type='Organization',
+        )
+        for permission in ORGANIZATION_ALL:
+            assert ResourcePolicyService.check_user_resource_permission(
+                session=session,
+                username='alice',
+                groups=[group.name],
+                resource_uri='cached-resource',
+                permission_name=permission,
+            )
+        assert spy.call_count == 1
+
+        ResourcePolicyService.delete_resource_policy(session=session, group=group.name, resource_uri='cached-resource')
+        with pytest.raises(exceptions.ResourceUnauthorized):
+            ResourcePolicyService.check_user_resource_permission(
+                session=session,
+                username='alice',
+                groups=[group.name],
+                resource_uri='cached-resource',
+                permission_name=ORGANIZATION_ALL[0],
+            )
+
+
+def test_filter_authorized_resources(db, group):
+    permissions(db, ORGANIZATION_ALL)
+    with db.scoped_session() as session:
+        for uri in ['bulk-resource-1', 'bulk-resource-3']:
+            ResourcePolicyService.attach_resource_policy(
+                session=session,
+                group=group.name,
+                permissions=ORGANIZATION_ALL,
+                resource_uri=uri,
+                resource_type='Organization',
+            )
+        authorized = ResourcePolicyService.filter_authorized(
+            session=session,
+            groups=[group.name, 'other-group'],
+            resource_uris=['bulk-resource-3', 'bulk-resource-2', 'bulk-resource-1'],
+            permission_name=ORGANIZATION_ALL[0],
+        )
+        assert authorized == ['bulk-resource-3', 'bulk-resource-1']
+
+        effective_permissions = ResourcePolicyService.get_group_effective_permissions(
+            session, group_uri=group.name, resource_type='Organization'
+        )
+        assert effective_permissions['bulk-resource-1'] == set(ORGANIZATION_ALL)
+        assert 'bulk-resource-2' not in effective_permissions
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.service_handlers import WorkerHandler
+
+
+@pytest.fixture
+def worker():
+    worker = WorkerHandler()
+    threads = {}
+
+    @worker.handler(path='test.succeed')
+    def succeed(engine, task):
+        with engine.scoped_session() as session:
+            threads[task.taskUri] = (threading.get_ident(), session.query(Task).get(task.taskUri).status)
+        return {'target': task.targetUri}
+
+    @worker.handler(path='test.fail')
+    def fail(engine, task):
+        raise Exception('handler failed')
+
+    worker.threads = threads
+    return worker
+
+
+def _create_tasks(db, *actions, status='pending'):
+    with db.scoped_session() as session:
+        tasks = [Task(action=action, targetUri=f'target-{i}', status=status) for i, action in enumerate(actions)]
+        session.add_all(tasks)
+        session.commit()
+        return [task.taskUri for task in tasks]
+
+
+def _tasks(db, task_ids):
+    with db.scoped_session() as session:
+        return [session.query(Task).get(taskid) for taskid in task_ids]
+
+
+def test_process_runs_all_tasks(db, worker):
+    task_ids = _create_tasks(db, 'test.succeed', 'test.fail', 'test.succeed')
+
+    responses = worker.process(db, task_ids)
+
+    assert [response['status'] for response in responses] == ['completed', 'failed', 'completed']
+    assert [task.status for task in _tasks(db, task_ids)] == ['completed', 'failed', 'completed']
+    assert _tasks(db, task_ids)[0].response == {'target': 'target-0'}
+    assert _tasks(db, task_ids)[1].error == {'message': 'handler failed'}
+    # the handlers see their tasks as started
+    assert {status for _, status in worker.threads.values()} == {'started'}
+
+
+def test_process_batch_skips_tasks_not_pending(db, worker):
+    first = _create_tasks(db, 'test.succeed', 'test.unknown')
+    second = _create_tasks(db, 'test.succeed', status='completed')
+    third = _create_tasks(db, 'test.succeed')
+
+    results = worker.process_batch(db, [first, second, third])
+
+    assert [[response['taskUri'] for response in result] for result in results] == [first[:1], [], third]
+    assert [task.status for task in _tasks(db, first + second + third)] == [
+        'completed',
+        'pending',
+        'completed',
+        'completed',
+    ]
+    # the lists of tasks run on the threads of the worker
+    assert threading.get_ident() not in {thread for thread, _ in worker.threads.values()}
+
+
+def test_process_batch_claim_failure(db, worker, mocker):
+    mocker.patch.object(worker, 'claim_tasks', side_effect=Exception('database unavailable'))
+
+    assert worker.process_batch(db, [['task-1'], ['task-2']]) == [None, None]
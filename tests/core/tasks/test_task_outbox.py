@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.task_outbox import TaskOutbox
+
+
+@pytest.fixture
+def outbox():
+    return TaskOutbox(MagicMock(), MagicMock(return_value=[]))
+
+
+def _tasks(db, *targets):
+    with db.scoped_session() as session:
+        tasks = [Task(action='glue.table.update_column', targetUri=target) for target in targets]
+        session.add_all(tasks)
+    return [task.taskUri for task in tasks]
+
+
+def _status(db, taskid):
+    with db.scoped_session() as session:
+        return session.query(Task).get(taskid).status
+
+
+def test_tasks_are_sent_when_the_block_exits(db, outbox):
+    task_ids = _tasks(db, 'column1', 'column2', 'column3')
+
+    with outbox.collect():
+        for taskid in task_ids:
+            outbox.queue(db, [taskid])
+        outbox._send_batch.assert_not_called()
+
+    outbox._send_batch.assert_called_once_with(task_ids)
+    outbox._send.assert_not_called()
+
+
+def test_duplicated_tasks_are_skipped(db, outbox):
+    first, duplicate, other = _tasks(db, 'column1', 'column1', 'column2')
+
+    with outbox.collect():
+        outbox.queue(db, [first])
+        outbox.queue(db, [duplicate, other])
+
+    outbox._send_batch.assert_called_once_with([first, other])
+    assert _status(db, duplicate) == 'skipped'
+    assert _status(db, other) == 'pending'
+
+
+def test_unsent_tasks_are_failed(db, outbox):
+    sent, unsent = _tasks(db, 'column1', 'column2')
+    outbox._send_batch.return_value = [unsent]
+
+    with outbox.collect() as collected:
+        outbox.queue(db, [sent, unsent])
+
+    assert collected['unsent'] == [unsent]
+    assert _status(db, sent) == 'pending'
+    assert _status(db, unsent) == 'failed'
+
+
+def test_failed_send_does_not_raise(db, outbox):
+    (taskid,) = _tasks(db, 'column1')
+    outbox._send_batch.side_effect = Exception('SQS is not available')
+
+    with outbox.collect() as collected:
+        outbox.queue(db, [taskid])
+
+    assert collected['unsent'] == [taskid]
+    assert _status(db, taskid) == 'failed'
+
+
+def test_queue_outside_of_a_block(db, outbox):
+    outbox.queue(db, ['task1'])
+    outbox._send.assert_called_once_with(db, ['task1'])
+    outbox._send_batch.assert_not_called()
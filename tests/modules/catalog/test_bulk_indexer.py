@@ -0,0 +1,132 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from opensearchpy.exceptions import ConnectionError
+
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.bulk_indexer import BulkIndexer
+
+
+def _items(body, statuses=None):
+    """Builds a _bulk response for the request body, with the given status per document id"""
+    statuses = statuses or {}
+    lines = [json.loads(line) for line in body.splitlines()]
+    items = []
+    for line in lines:
+        for operation in ('index', 'delete'):
+            if operation in line:
+                doc_id = line[operation]['_id']
+                items.append({operation: {'_id': doc_id, 'status': statuses.get(doc_id, 200)}})
+    return {'errors': bool(statuses), 'items': items}
+
+
+@pytest.fixture
+def es():
+    es = MagicMock()
+    es.bulk.side_effect = lambda body: _items(body)
+    return es
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(mocker):
+    mocker.patch.object(BulkIndexer, 'BACKOFF_SECONDS', 0)
+
+
+def test_bulk_indexer_batches_by_size(es):
+    indexer = BulkIndexer(es_factory=lambda: es, index='dataall-index', batch_size=10, max_workers=2)
+    for i in range(25):
+        indexer.index(f'doc-{i}', {'name': f'doc {i}'})
+    indexer.delete('old-doc')
+    report = indexer.close()
+
+    assert es.bulk.call_count == 3
+    assert report.indexed == 25
+    assert report.deleted == 1
+    assert report.batches == 3
+    assert report.failed == 0
+
+
+def test_bulk_indexer_batches_by_bytes(es):
+    indexer = BulkIndexer(es_factory=lambda: es, index='dataall-index', batch_size=1000, batch_bytes=1024)
+    for i in range(10):
+        indexer.index(f'doc-{i}', {'description': 'x' * 500})
+    report = indexer.close()
+
+    assert es.bulk.call_count == 5
+    assert report.indexed == 10
+
+
+def test_bulk_indexer_retries_throttled_items(es):
+    attempts = []
+
+    def bulk(body):
+        attempts.append(body)
+        return _items(body, {'doc-1': 429} if len(attempts) == 1 else {})
+
+    es.bulk.side_effect = bulk
+    indexer = BulkIndexer(es_factory=lambda: es, index='dataall-index')
+    indexer.index('doc-1', {'name': 'throttled'})
+    indexer.index('doc-2', {'name': 'accepted'})
+    report = indexer.close()
+
+    assert len(attempts) == 2
+    assert 'doc-2' not in attempts[1]
+    assert report.indexed == 2
+    assert report.retried == 1
+    assert report.failed == 0
+
+
+def test_bulk_indexer_reports_failures(es):
+    es.bulk.side_effect = lambda body: _items(body, {'doc-1': 400, 'doc-2': 429, 'gone': 404})
+    indexer = BulkIndexer(es_factory=lambda: es, index='dataall-index', max_retries=2)
+    indexer.index('doc-1', {'name': 'invalid'})
+    indexer.index('doc-2', {'name': 'throttled'})
+    indexer.delete('gone')
+    report = indexer.close()
+
+    assert es.bulk.call_count == 3
+    assert report.deleted == 1
+    assert report.failed == 2
+    assert report.retried == 2
+    assert len(report.errors) == 2
+
+
+def test_bulk_indexer_retries_connection_errors(es):
+    responses = [ConnectionError('N/A', 'timeout', None)]
+
+    def bulk(body):
+        if responses:
+            raise responses.pop()
+        return _items(body)
+
+    es.bulk.side_effect = bulk
+    indexer = BulkIndexer(es_factory=lambda: es, index='dataall-index')
+    indexer.index('doc-1', {'name': 'doc'})
+    report = indexer.close()
+
+    assert es.bulk.call_count == 2
+    assert report.indexed == 1
+
+
+def test_last_run(mocker):
+    es = MagicMock()
+    mocker.patch.object(BaseIndexer, 'es', return_value=es)
+    es.indices.get_mapping.return_value = {'dataall-index-1': {'mappings': {'_meta': {'version': 'v1'}}}}
+    assert BaseIndexer.last_run() is None
+    assert BaseIndexer.last_reconcile() is None
+
+    run = datetime(2024, 5, 1, 10, 30)
+    BaseIndexer.save_run(run)
+    es.indices.put_mapping.assert_called_once_with(
+        index='dataall-index', body={'_meta': {'version': 'v1', 'lastRun': '2024-05-01T10:30:00'}}
+    )
+
+    es.indices.get_mapping.return_value = {
+        'dataall-index-1': {'mappings': {'_meta': {'version': 'v1', 'lastRun': run.isoformat()}}}
+    }
+    assert BaseIndexer.last_run() == run
+    assert BaseIndexer.last_reconcile() is None
+    BaseIndexer.save_run(run, reconcile=True)
+    assert es.indices.put_mapping.call_args.kwargs['body']['_meta']['lastReconcile'] == '2024-05-01T10:30:00'
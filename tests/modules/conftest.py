@@ -25,6 +25,7 @@ def patch_es(module_mocker):
     module_mocker.patch('dataall.base.searchproxy.search', return_value={})
     module_mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc', return_value={})
     module_mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index', return_value={})
+    module_mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.index_outdated', return_value=False)
 
 
 @pytest.fixture(scope='module')
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.modules.notifications.services.email_digest import EmailDigest
+
+
+@pytest.fixture
+def identity_provider(mocker):
+    provider = MagicMock()
+    provider.get_emails_for_groups.side_effect = lambda groups: {
+        group: [f'{group}-{i}@email.com' for i in range(2)] for group in groups
+    }
+    mocker.patch(
+        'dataall.modules.notifications.services.email_digest.ServiceProviderFactory.get_service_provider_instance',
+        return_value=provider,
+    )
+    return provider
+
+
+def test_digest_per_recipient(identity_provider, mocker):
+    ses_client = MagicMock()
+    ses_client.send_bulk_email.side_effect = lambda emails: [
+        {'to': email['to'], 'messageId': 'id', 'status': 'SUCCESS', 'error': None} for email in emails
+    ]
+    mocker.patch('dataall.modules.notifications.services.email_digest.Ses.get_ses_client', return_value=ses_client)
+
+    digest = EmailDigest()
+    for share in range(3):
+        digest.add(f'Reminder for share {share}', f'share {share} is pending', ['owners', 'stewards'])
+    digest.add('Share expiration', 'share 4 expires', ['requesters'], ['bob@email.com'])
+
+    results = digest.send()
+
+    identity_provider.get_emails_for_groups.assert_called_once()
+    ses_client.send_bulk_email.assert_called_once()
+    emails = {email['to']: email for email in ses_client.send_bulk_email.call_args.args[0]}
+    assert len(emails) == len(results) == 7
+    assert emails['owners-0@email.com']['subject'] == 'Data.all | 3 notifications require your attention'
+    assert all(f'share {share} is pending' in emails['stewards-1@email.com']['message'] for share in range(3))
+    assert emails['bob@email.com'] == {
+        'to': 'bob@email.com',
+        'subject': 'Share expiration',
+        'message': 'share 4 expires',
+    }
+    # the notifications are sent once
+    assert digest.send() == []
+
+
+def test_dry_run_writes_digests(identity_provider, mocker, tmp_path):
+    mocker.patch.object(EmailDigest, 'DRY_RUN_DIR', str(tmp_path))
+    get_ses_client = mocker.patch('dataall.modules.notifications.services.email_digest.Ses.get_ses_client')
+
+    digest = EmailDigest()
+    digest.add('subject', '<p>message</p>', recipient_email_list=['bob@email.com'])
+    results = digest.send()
+
+    get_ses_client.assert_not_called()
+    assert results[0]['status'] == 'DRY_RUN'
+    content = (tmp_path / 'bob@email.com.html').read_text()
+    assert results[0]['messageId'] in content
+    assert '<p>message</p>' in content
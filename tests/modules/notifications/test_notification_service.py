@@ -4,13 +4,19 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from dataall.base.services.service_provider import ServiceProvider
 from dataall.modules.notifications.handlers.notifications_handler import NotificationHandler
+from dataall.modules.notifications.services.ses_email_notification_service import SESEmailNotificationService
 from dataall.core.tasks.db.task_models import Task
 
 
 def mock_cognito_client(mocker):
     mock_client = MagicMock()
     mocker.patch('dataall.modules.notifications.services.ses_email_notification_service.Cognito', mock_client)
+    # groups are resolved with get_user_emailids_from_group through the cache of the service provider
+    mock_client().get_emails_for_groups.side_effect = lambda groups: ServiceProvider.get_emails_for_groups(
+        mock_client(), groups
+    )
     return mock_client
 
 
@@ -26,7 +32,7 @@ def mock_ses_client_(mocker):
 def test_notification_service_email(mocker, db):
     # Mock SES Client
     mock_ses_client = mock_ses_client_(mocker)
-    mock_ses_client().send_email.return_value = True
+    mock_ses_client().send_bulk_email.return_value = []
 
     # Mock Cognito Client
     cognito_client = mock_cognito_client(mocker)
@@ -64,9 +70,10 @@ def test_notification_service_email(mocker, db):
         and 'datasetStewardsGroup' in group_name_list_used_for_share
         and 'requesterGroupName' in group_name_list_used_for_share
     )
-    mock_ses_client().send_email.assert_called()
-    # Check if the email send method is called three times for ["bob@email.com", "bob-1@email.com", "email@email.com"]
-    assert mock_ses_client().send_email.call_count == 3
+    mock_ses_client().send_bulk_email.assert_called_once()
+    # Check if one email is sent to each of ["bob@email.com", "bob-1@email.com", "email@email.com"]
+    emails = mock_ses_client().send_bulk_email.call_args.args[0]
+    assert sorted(email['to'] for email in emails) == ['bob-1@email.com', 'bob@email.com', 'email@email.com']
 
 
 # Test to check when unknown notification type is used
@@ -102,7 +109,7 @@ def test_notification_service_when_incorrect_task_is_created(mocker, db):
 def test_notification_service_with_no_email_ids_in_group(mocker, db):
     # Mock SES Client
     mock_ses_client = mock_ses_client_(mocker)
-    mock_ses_client().send_email.return_value = True
+    mock_ses_client().send_bulk_email.return_value = []
 
     # Mock Cognito Client
     cognito_client = mock_cognito_client(mocker)
@@ -132,7 +139,7 @@ def test_notification_service_with_no_email_ids_in_group(mocker, db):
         NotificationHandler.notification_service(db, notification_task)
 
     # Check that the send email was not called
-    assert mock_ses_client().send_email.call_count == 0
+    assert mock_ses_client().send_bulk_email.call_count == 0
 
 
 # Test to check when sender email id is None. This can happen when the custom_domain is present/absent and the config for email is set to true in config.json
@@ -167,3 +174,15 @@ def test_notification_service_with_sender_email_id_is_none(mocker, db):
         with pytest.raises(Exception) as exception:
             NotificationHandler.notification_service(db, notification_task)
         assert str(exception.value) == 'email_sender_id environment variable is not set'
+
+
+def test_group_emails_are_cached(mocker):
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.side_effect = lambda group: [f'{group}@email.com']
+
+    for _ in range(3):
+        email_ids = SESEmailNotificationService.get_email_ids_from_groupList(
+            ['ownerGroup', 'stewardsGroup', 'ownerGroup'], cognito_client()
+        )
+        assert email_ids == {'ownerGroup@email.com', 'stewardsGroup@email.com'}
+    assert cognito_client().get_user_emailids_from_group.call_count == 2
@@ -1,5 +1,8 @@
+from datetime import datetime, timedelta
+
 import pytest
 
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.tasks.catalog_indexer_task import CatalogIndexerTask
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 
@@ -47,12 +50,20 @@ def table(org, env, db, sync_dataset):
     yield table
 
 
+@pytest.fixture(autouse=True)
+def last_reconcile(mocker):
+    mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.save_run')
+    return mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_reconcile', return_value=datetime.now()
+    )
+
+
 def test_catalog_indexer(db, org, env, sync_dataset, table, mocker):
     mocker.patch(
-        'dataall.modules.s3_datasets.indexers.table_indexer.DatasetTableIndexer.upsert_all', return_value=[table]
+        'dataall.modules.s3_datasets.indexers.table_indexer.DatasetTableIndexer.upsert_many', return_value=[table]
     )
     mocker.patch(
-        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert', return_value=sync_dataset
+        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert_many', return_value=[sync_dataset]
     )
     indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db)
     # Count should be One table + One Dataset = 2
@@ -61,9 +72,9 @@ def test_catalog_indexer(db, org, env, sync_dataset, table, mocker):
 
 def test_catalog_indexer_with_deletes(db, org, env, sync_dataset, table, mocker):
     # When Table no longer exists
-    mocker.patch('dataall.modules.s3_datasets.indexers.table_indexer.DatasetTableIndexer.upsert_all', return_value=[])
+    mocker.patch('dataall.modules.s3_datasets.indexers.table_indexer.DatasetTableIndexer.upsert_many', return_value=[])
     mocker.patch(
-        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert', return_value=sync_dataset
+        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert_many', return_value=[sync_dataset]
     )
     mocker.patch(
         'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.search_all',
@@ -81,3 +92,141 @@ def test_catalog_indexer_with_deletes(db, org, env, sync_dataset, table, mocker)
 
     # Count should be One Dataset = 1
     assert indexed_objects_counter == 1
+
+
+def test_catalog_indexer_incremental(db, sync_dataset, table, mocker):
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run',
+        return_value=datetime.now() - timedelta(hours=1),
+    )
+    index_path = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index', return_value=True)
+
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, incremental='True')
+
+    # The Dataset and its Table were created after the last run
+    assert indexed_objects_counter == 2
+    assert {call.kwargs['doc_id'] for call in index_path.call_args_list} == {sync_dataset.datasetUri, table.tableUri}
+
+
+def test_catalog_indexer_incremental_without_changes(db, sync_dataset, table, mocker):
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run',
+        return_value=datetime.now() + timedelta(hours=1),
+    )
+    delete_doc_path = mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc', return_value=True
+    )
+
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, with_deletes='True', incremental='True')
+
+    assert indexed_objects_counter == 0
+    delete_doc_path.assert_not_called()
+
+
+def test_catalog_indexer_incremental_deletes_tombstones(db, sync_dataset, table, mocker):
+    with db.scoped_session() as session:
+        deleted_table = session.query(DatasetTable).get(table.tableUri)
+        deleted_table.LastGlueTableStatus = 'Deleted'
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run',
+        return_value=datetime.now() - timedelta(hours=1),
+    )
+    delete_doc_path = mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc', return_value=True
+    )
+
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, incremental='True')
+
+    delete_doc_path.assert_called_once_with(doc_id=table.tableUri)
+    # Only the Dataset is indexed again
+    assert indexed_objects_counter == 1
+
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).LastGlueTableStatus = 'InSync'
+
+
+def test_catalog_indexer_incremental_first_run(db, sync_dataset, table, mocker):
+    mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run', return_value=None)
+    index_changes_path = mocker.patch(
+        'dataall.modules.s3_datasets.indexers.dataset_catalog_indexer.DatasetCatalogIndexer.index_changes'
+    )
+
+    # Without a previous run all the objects are indexed
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, incremental='True')
+
+    index_changes_path.assert_not_called()
+    assert indexed_objects_counter == 2
+
+
+def test_catalog_indexer_incremental_reconcile(db, sync_dataset, table, last_reconcile, mocker):
+    last_reconcile.return_value = datetime.now() - CatalogIndexerTask.RECONCILE_INTERVAL
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run',
+        return_value=datetime.now() + timedelta(hours=1),
+    )
+    # A table deleted from the database still has a document
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.search_all',
+        return_value=[{'_id': sync_dataset.datasetUri}, {'_id': table.tableUri}, {'_id': 'deleted-table'}],
+    )
+    delete_doc_path = mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc', return_value=True
+    )
+    save_run_path = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.save_run')
+
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, incremental='True')
+
+    assert indexed_objects_counter == 2
+    delete_doc_path.assert_called_once_with(doc_id='deleted-table')
+    assert save_run_path.call_args.kwargs == {'reconcile': True}
+
+
+def test_catalog_indexer_saves_run_without_changes(db, sync_dataset, table, mocker):
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.last_run',
+        return_value=datetime.now() + timedelta(hours=1),
+    )
+    save_run_path = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.save_run')
+
+    start = datetime.now()
+    assert CatalogIndexerTask.index_objects(engine=db, incremental='True') == 0
+
+    # The high-water mark advances although no document was written
+    (run,) = save_run_path.call_args.args
+    assert run >= start
+    assert save_run_path.call_args.kwargs == {'reconcile': False}
+
+
+def test_catalog_indexer_rebuild(db, sync_dataset, table, mocker):
+    es = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.es').return_value
+    mocker.patch(
+        'dataall.modules.catalog.tasks.catalog_indexer_task.create_versioned_index', return_value='dataall-index-new'
+    )
+    swap_alias_path = mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.swap_alias')
+    bulk_path = mocker.spy(BaseIndexer, 'bulk')
+
+    indexed_objects_counter = CatalogIndexerTask.index_objects(engine=db, rebuild='True')
+
+    assert indexed_objects_counter == 2
+    assert bulk_path.call_args_list[0].kwargs['index'] == 'dataall-index-new'
+    swap_alias_path.assert_called_once_with(es, 'dataall-index-new')
+    es.indices.delete.assert_not_called()
+
+
+def test_catalog_indexer_failed_rebuild(db, sync_dataset, table, mocker):
+    es = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.es').return_value
+    mocker.patch(
+        'dataall.modules.catalog.tasks.catalog_indexer_task.create_versioned_index', return_value='dataall-index-new'
+    )
+    mocker.patch(
+        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert_many', side_effect=Exception('boom')
+    )
+    swap_alias_path = mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.swap_alias')
+    mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.AlarmService')
+
+    with pytest.raises(Exception):
+        CatalogIndexerTask.index_objects(engine=db, rebuild='True')
+
+    # The search keeps using the previous index
+    swap_alias_path.assert_not_called()
+    es.indices.delete.assert_called_once_with(index='dataall-index-new', ignore=[404])
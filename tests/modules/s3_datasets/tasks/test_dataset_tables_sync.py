@@ -2,7 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
-from dataall.modules.s3_datasets.tasks.tables_syncer import sync_tables
+from dataall.modules.s3_datasets.tasks.tables_syncer import AccountSyncSummary, account_shard, sync_tables
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -100,3 +100,18 @@ def test_tables_sync(db, org, env, sync_dataset, table_fixture, mocker):
         saved_table: DatasetTable = session.query(DatasetTable).filter(DatasetTable.GlueTableName == 'table1').first()
         assert saved_table
         assert saved_table.GlueTableName == 'table1'
+
+
+def test_tables_sync_shards(db, sync_dataset, mocker):
+    sync_account = mocker.patch(
+        'dataall.modules.s3_datasets.tasks.tables_syncer.sync_account_tables',
+        return_value=([], AccountSyncSummary(account='account')),
+    )
+    shard_index = account_shard(sync_dataset.AwsAccountId, 2)
+
+    sync_tables(engine=db, shard_index=1 - shard_index, shard_count=2)
+    sync_account.assert_not_called()
+
+    sync_tables(engine=db, shard_index=shard_index, shard_count=2)
+    sync_account.assert_called_once()
+    assert sync_dataset.datasetUri in sync_account.call_args.args[2]
@@ -1,5 +1,5 @@
 import pytest
-from dataall.core.environment.tasks.env_stacks_updater import update_stacks
+from dataall.core.environment.tasks.env_stacks_updater import StackUpdateScheduler, update_stacks
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -8,6 +8,9 @@ def sync_dataset(create_dataset, org_fixture, env_fixture, db):
 
 
 def test_stacks_update(db, org, env, sync_dataset, mocker):
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Parameter.get_parameter', return_value='cluster')
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs.list_running_tasks', return_value={})
+    mocker.patch.object(StackUpdateScheduler, 'POLL_INTERVAL_SECONDS', 0)
     mocker.patch(
         'dataall.core.environment.tasks.env_stacks_updater.update_stack',
         return_value=True,
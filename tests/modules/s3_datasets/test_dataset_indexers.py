@@ -1,3 +1,5 @@
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
@@ -39,3 +41,28 @@ def test_upsert_tables(db, dataset_fixture, folder_fixture):
     with db.scoped_session() as session:
         tables = DatasetTableIndexer.upsert_all(session, dataset_uri=dataset_fixture.datasetUri)
         assert len(tables) == 1
+
+
+def _indexed_documents():
+    return {call.kwargs['doc_id']: call.kwargs['doc'] for call in BaseIndexer._index.call_args_list}
+
+
+def test_upsert_many_builds_same_documents(db, dataset_fixture, table_fixture, folder_fixture):
+    indexers = [DatasetTableIndexer, DatasetLocationIndexer, DatasetIndexer]
+    with db.scoped_session() as session:
+        BaseIndexer._index.reset_mock()
+        DatasetIndexer.upsert(session, dataset_uri=dataset_fixture.datasetUri)
+        DatasetTableIndexer.upsert(session, table_uri=table_fixture.tableUri)
+        DatasetLocationIndexer.upsert(session, folder_uri=folder_fixture.locationUri)
+        expected = _indexed_documents()
+
+        BaseIndexer._index.reset_mock()
+        dataset = DatasetRepository.get_dataset_by_uri(session, dataset_fixture.datasetUri)
+        environments = BaseIndexer._get_environments(session, [dataset.environmentUri])
+        for indexer in indexers:
+            indexer.upsert_many(session, [dataset], environments)
+        documents = _indexed_documents()
+
+    assert {dataset_fixture.datasetUri, table_fixture.tableUri, folder_fixture.locationUri} <= set(documents)
+    for uri, document in expected.items():
+        assert documents[uri] == document
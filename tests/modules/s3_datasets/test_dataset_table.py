@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.s3_datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.s3_datasets.services.dataset_table_data_filter_service import DatasetTableDataFilterService
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTableColumn, DatasetTable, DatasetTableDataFilter
@@ -247,6 +250,57 @@ def test_sync_tables_and_columns(client, table, dataset_fixture, db):
         assert deleted_table.LastGlueTableStatus == 'Deleted'
 
 
+def _glue_table(name, columns, **kwargs):
+    return {
+        'Name': name,
+        'StorageDescriptor': {'Columns': [{'Name': c, 'Type': t} for c, t in columns], 'Location': 's3://bucket/'},
+        **kwargs,
+    }
+
+
+def _columns(session, table_uri):
+    return {c.name: c for c in session.query(DatasetTableColumn).filter(DatasetTableColumn.tableUri == table_uri).all()}
+
+
+def test_sync_table_columns_applies_diff(db, dataset_fixture):
+    with db.scoped_session() as session:
+        table = session.query(DatasetTable).filter(DatasetTable.name == 'table1').first()
+        before = _columns(session, table.tableUri)
+        assert set(before) == {'col1', 'partition1'}
+        col1_uri = before['col1'].columnUri
+
+        DatasetTableRepository.sync_table_columns(
+            session, table, _glue_table('table1', [('col1', 'int'), ('col2', 'string')])
+        )
+        session.commit()
+
+        after = _columns(session, table.tableUri)
+        assert set(after) == {'col1', 'col2'}
+        assert after['col1'].columnUri == col1_uri
+        assert after['col1'].typeName == 'int'
+        assert after['col2'].columnType == 'column'
+        assert after['col2'].columnUri not in (None, col1_uri)
+
+
+def test_sync_tables_skips_unchanged_versions(db, dataset_fixture):
+    with db.scoped_session() as session:
+        table = session.query(DatasetTable).filter(DatasetTable.name == 'table1').first()
+        update_time = datetime(2024, 5, 1)
+
+        glue_table = _glue_table('table1', [('col1', 'int')], VersionId='1', UpdateTime=update_time)
+        DatasetTableService.sync_existing_tables(session, uri=dataset_fixture.datasetUri, glue_tables=[glue_table])
+        assert table.GlueTableVersion == DatasetTableRepository.glue_table_version(glue_table)
+        assert set(_columns(session, table.tableUri)) == {'col1'}
+
+        same_version = _glue_table('table1', [('col3', 'int')], VersionId='1', UpdateTime=update_time)
+        DatasetTableService.sync_existing_tables(session, uri=dataset_fixture.datasetUri, glue_tables=[same_version])
+        assert set(_columns(session, table.tableUri)) == {'col1'}
+
+        new_version = _glue_table('table1', [('col3', 'int')], VersionId='2', UpdateTime=update_time)
+        DatasetTableService.sync_existing_tables(session, uri=dataset_fixture.datasetUri, glue_tables=[new_version])
+        assert set(_columns(session, table.tableUri)) == {'col3'}
+
+
 def delete_table(client, tableUri, username, groups):
     return client.query(
         """
@@ -0,0 +1,154 @@
+"""
+Testing the concurrent processing of share items in SharingService, with a processor that only updates the
+share items status.
+"""
+
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.groups.db.group_models import Group
+from dataall.core.organizations.db.organization_models import Organization
+from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
+from dataall.modules.shares_base.db.share_object_models import ShareObjectItem
+from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
+from dataall.modules.shares_base.db.share_object_state_machines import ShareItemSM
+from dataall.modules.shares_base.services.share_manager_utils import AccountRateLimiter
+from dataall.modules.shares_base.services.share_processor_manager import (
+    ShareProcessorDefinition,
+    ShareProcessorManager,
+)
+from dataall.modules.shares_base.services.shares_enums import (
+    ShareableType,
+    ShareItemActions,
+    ShareItemStatus,
+    ShareObjectActions,
+)
+from dataall.modules.shares_base.services.sharing_service import SharingService
+
+
+class RecordingProcessor:
+    calls = []
+    fail_in_workers = False
+
+    def __init__(self, session, share_data, tables):
+        self.session = session
+        self.share_data = share_data
+        self.tables = tables
+
+    def process_approved_shares(self) -> bool:
+        RecordingProcessor.calls.append((threading.current_thread().name, [t.tableUri for t in self.tables]))
+        if RecordingProcessor.fail_in_workers and threading.current_thread() is not threading.main_thread():
+            raise Exception('Failed to share tables')
+        for table in self.tables:
+            share_item = ShareObjectRepository.find_sharable_item(
+                self.session, self.share_data.share.shareUri, table.tableUri
+            )
+            item_sm = ShareItemSM(ShareItemStatus.Share_Approved.value)
+            item_sm.update_state_single_item(
+                self.session, share_item, item_sm.run_transition(ShareObjectActions.Start.value)
+            )
+            item_sm.update_state_single_item(
+                self.session, share_item, item_sm.run_transition(ShareItemActions.Success.value)
+            )
+        return True
+
+
+@pytest.fixture(scope='module')
+def source_environment(env: Callable, org_fixture: Organization, group: Group) -> Environment:
+    yield env(org=org_fixture, account='3' * 12, envname='sharing_source', owner=group.owner, group=group.name)
+
+
+@pytest.fixture(scope='module')
+def source_environment_group(environment_group: Callable, source_environment: Environment, group: Group):
+    yield environment_group(source_environment, group.name)
+
+
+@pytest.fixture(scope='module')
+def target_environment(env: Callable, org_fixture: Organization, group2: Group) -> Environment:
+    yield env(org=org_fixture, account='4' * 12, envname='sharing_target', owner=group2.owner, group=group2.name)
+
+
+@pytest.fixture(scope='module')
+def target_environment_group(environment_group: Callable, target_environment: Environment, group2: Group):
+    yield environment_group(environment=target_environment, group=group2.name)
+
+
+@pytest.fixture(scope='module')
+def sharing_dataset(create_dataset: Callable, org_fixture: Organization, source_environment, source_environment_group):
+    yield create_dataset(organization=org_fixture, environment=source_environment, label='sharingdataset')
+
+
+@pytest.fixture(scope='module')
+def sharing_tables(table: Callable, sharing_dataset: S3Dataset):
+    yield [table(dataset=sharing_dataset, label=f'sharingtable{i}') for i in range(12)]
+
+
+@pytest.fixture
+def approved_share(
+    db, share, share_item_table, sharing_dataset, sharing_tables, target_environment, target_environment_group
+):
+    share = share(sharing_dataset, target_environment, target_environment_group)
+    for table in sharing_tables:
+        share_item_table(share, table, ShareItemStatus.Share_Approved.value)
+    yield share
+
+
+@pytest.fixture(autouse=True)
+def concurrent_processor(mocker):
+    RecordingProcessor.calls = []
+    RecordingProcessor.fail_in_workers = False
+    mocker.patch.dict(
+        ShareProcessorManager.SHARING_PROCESSORS,
+        {
+            ShareableType.Table: ShareProcessorDefinition(
+                ShareableType.Table, RecordingProcessor, DatasetTable, DatasetTable.tableUri, concurrent=True
+            )
+        },
+        clear=True,
+    )
+    mocker.patch.object(SharingService, 'MAX_WORKERS', 4)
+    mocker.patch.object(SharingService, 'ITEMS_PER_TASK', 3)
+    mocker.patch.object(SharingService, '_rate_limiter', AccountRateLimiter(rate=1000))
+
+
+def _items_status(db, share):
+    with db.scoped_session() as session:
+        items = session.query(ShareObjectItem).filter(ShareObjectItem.shareUri == share.shareUri).all()
+        return {item.itemUri: item.status for item in items}
+
+
+def test_approve_share_concurrently(db, approved_share, sharing_tables):
+    assert SharingService.approve_share(db, approved_share.shareUri)
+
+    first_thread, first_tables = RecordingProcessor.calls[0]
+    assert first_thread == threading.current_thread().name
+    assert len(first_tables) == 1
+    # the other 11 tables are processed in tasks of 3 tables, with one processor per task
+    assert sorted(len(tables) for _, tables in RecordingProcessor.calls[1:]) == [2, 3, 3, 3]
+    assert all(thread.startswith('share-processor') for thread, _ in RecordingProcessor.calls[1:])
+    processed = [uri for _, tables in RecordingProcessor.calls for uri in tables]
+    assert sorted(processed) == sorted(t.tableUri for t in sharing_tables)
+    assert set(_items_status(db, approved_share).values()) == {ShareItemStatus.Share_Succeeded.value}
+
+
+def test_approve_share_concurrently_with_failed_tasks(db, approved_share, sharing_tables):
+    RecordingProcessor.fail_in_workers = True
+
+    assert not SharingService.approve_share(db, approved_share.shareUri)
+
+    _, first_tables = RecordingProcessor.calls[0]
+    statuses = _items_status(db, approved_share)
+    assert statuses.pop(first_tables[0]) == ShareItemStatus.Share_Succeeded.value
+    assert set(statuses.values()) == {ShareItemStatus.Share_Failed.value}
+
+
+def test_account_rate_limiter():
+    limiter = AccountRateLimiter(rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire('111111111111', '222222222222')
+    assert time.monotonic() - started >= 0.09
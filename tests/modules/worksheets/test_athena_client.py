@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.modules.worksheets.aws.athena_client import AthenaClient
+
+COLUMNS = [{'Name': 'id', 'Type': 'integer'}, {'Name': 'name', 'Type': 'varchar'}]
+
+
+def _row(*values):
+    return {'Data': [{'VarCharValue': value} if value is not None else {} for value in values]}
+
+
+@pytest.fixture
+def athena():
+    """GetQueryResults of a SELECT with 25 rows, the NextToken is the position of the next row"""
+    rows = [_row('id', 'name')] + [_row(str(i), f'name{i}' if i != 3 else None) for i in range(25)]
+
+    def get_query_results(QueryExecutionId, MaxResults, NextToken=None):
+        start = int(NextToken or 0)
+        end = start + MaxResults
+        response = {'ResultSet': {'Rows': rows[start:end], 'ResultSetMetadata': {'ColumnInfo': COLUMNS}}}
+        if end < len(rows):
+            response['NextToken'] = str(end)
+        return response
+
+    client = MagicMock()
+    client.get_query_results.side_effect = get_query_results
+    return client
+
+
+@pytest.fixture(autouse=True)
+def page_size(mocker):
+    mocker.patch.object(AthenaClient, 'PAGE_SIZE', 10)
+
+
+def test_read_query_results_in_pages(athena):
+    result = AthenaClient.read_query_results(athena, 'query-id')
+
+    assert not result['truncated']
+    assert result['nextToken'] is None
+    assert result['columns'] == [
+        {'columnName': 'id', 'typeName': 'integer'},
+        {'columnName': 'name', 'typeName': 'varchar'},
+    ]
+    assert len(result['rows']) == 25
+    assert result['rows'][0]['cells'][1] == {'columnName': 'name', 'typeName': 'varchar', 'value': 'name0'}
+    assert result['rows'][3]['cells'][1]['value'] is None
+
+
+def test_read_query_results_truncated_by_rows(athena):
+    first = AthenaClient.read_query_results(athena, 'query-id', max_rows=12, columnar=True)
+
+    assert first['truncated']
+    assert first['rows'] == []
+    assert first['columns'][0]['values'] == [str(i) for i in range(12)]
+
+    second = AthenaClient.read_query_results(athena, 'query-id', next_token=first['nextToken'], columnar=True)
+
+    assert not second['truncated']
+    assert second['columns'][0]['values'] == [str(i) for i in range(12, 25)]
+
+
+def test_read_query_results_truncated_by_bytes(athena):
+    first = AthenaClient.read_query_results(athena, 'query-id', max_bytes=50, columnar=True)
+
+    assert first['truncated']
+    assert first['columns'][0]['values'] == ['0', '1', '2']
+
+    second = AthenaClient.read_query_results(athena, 'query-id', next_token=first['nextToken'], columnar=True)
+    assert second['columns'][0]['values'][0] == '3'
@@ -0,0 +1,221 @@
+import pytest
+
+from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
+from dataall.modules.worksheets.aws.athena_client import AthenaClient
+from dataall.modules.worksheets.services.worksheet_query_cache import WorksheetQueryCache
+
+START_QUERY = """
+    mutation startAthenaSqlQuery($environmentUri: String!, $worksheetUri: String!, $sqlQuery: String!) {
+        startAthenaSqlQuery(environmentUri: $environmentUri, worksheetUri: $worksheetUri, sqlQuery: $sqlQuery) {
+            AthenaQueryId
+            Status
+            cached
+        }
+    }
+"""
+
+POLL_QUERY = """
+    mutation pollAthenaSqlQuery($environmentUri: String!, $worksheetUri: String!, $athenaQueryId: String!) {
+        pollAthenaSqlQuery(environmentUri: $environmentUri, worksheetUri: $worksheetUri, athenaQueryId: $athenaQueryId) {
+            AthenaQueryId
+            Status
+            DataScannedInBytes
+        }
+    }
+"""
+
+FETCH_RESULTS = """
+    mutation fetchAthenaSqlQueryResults($environmentUri: String!, $worksheetUri: String!, $athenaQueryId: String!) {
+        fetchAthenaSqlQueryResults(
+            environmentUri: $environmentUri, worksheetUri: $worksheetUri, athenaQueryId: $athenaQueryId
+        ) {
+            AthenaQueryId
+            Status
+            truncated
+            columns {
+                columnName
+                typeName
+            }
+            rows {
+                cells {
+                    value
+                }
+            }
+        }
+    }
+"""
+
+RUN_QUERY = """
+    query runAthenaSqlQuery(
+        $environmentUri: String!, $worksheetUri: String!, $sqlQuery: String!, $athenaQueryId: String, $nextToken: String
+    ) {
+        runAthenaSqlQuery(
+            environmentUri: $environmentUri
+            worksheetUri: $worksheetUri
+            sqlQuery: $sqlQuery
+            athenaQueryId: $athenaQueryId
+            nextToken: $nextToken
+        ) {
+            rows {
+                cells {
+                    value
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(scope='module')
+def worksheet(client, group):
+    response = client.query(
+        """
+        mutation CreateWorksheet ($input:NewWorksheetInput){
+            createWorksheet(input:$input){
+                worksheetUri
+            }
+        }
+        """,
+        input={'label': 'async worksheet', 'SamlAdminGroupName': group.name, 'tags': []},
+        username='alice',
+        groups=[group.name],
+    )
+    return response.data.createWorksheet
+
+
+@pytest.fixture(scope='module')
+def source_table(db, env_fixture):
+    with db.scoped_session() as session:
+        table = DatasetTable(
+            label='sales',
+            name='sales',
+            owner='alice',
+            datasetUri='dataset',
+            AWSAccountId=env_fixture.AwsAccountId,
+            S3BucketName='bucket',
+            S3Prefix='sales',
+            GlueDatabaseName='db1',
+            GlueTableName='sales',
+            GlueTableVersion='1',
+        )
+        session.add(table)
+        session.commit()
+        yield table
+
+
+@pytest.fixture
+def athena(mocker):
+    query_ids = iter(['query-1', 'query-2', 'query-3'])
+    start = mocker.patch.object(AthenaClient, 'start_query_execution', side_effect=lambda **kwargs: next(query_ids))
+    mocker.patch.object(
+        AthenaClient,
+        'get_query_execution',
+        return_value={
+            'Status': 'SUCCEEDED',
+            'Error': None,
+            'OutputLocation': 's3://bucket/query.csv',
+            'ElapsedTimeInMs': 10,
+            'DataScannedInBytes': 100,
+            'WorkGroup': 'workgroup',
+        },
+    )
+    mocker.patch.object(
+        AthenaClient,
+        'get_query_results',
+        return_value={
+            'error': None,
+            'truncated': False,
+            'nextToken': None,
+            'columns': [{'columnName': 'total', 'typeName': 'bigint'}],
+            'rows': [{'cells': [{'columnName': 'total', 'typeName': 'bigint', 'value': '42'}]}],
+        },
+    )
+    return start
+
+
+def _run(client, query, group, **variables):
+    response = client.query(query, username='alice', groups=[group.name], **variables)
+    assert not response.errors, response.errors
+    return response.data
+
+
+def test_normalize_sql():
+    assert (
+        WorksheetQueryCache.normalize_sql("SELECT  *\n FROM Db1.Sales WHERE name = 'A  b';")
+        == "select * from db1.sales where name = 'A  b'"
+    )
+
+
+def test_source_tables():
+    assert WorksheetQueryCache.source_tables(
+        'with recent as (select * from db1.sales) select * from recent join "db2"."Stores" on true'
+    ) == [('db1', 'sales'), ('db2', 'stores')]
+    assert WorksheetQueryCache.source_tables('select * from sales') is None
+    assert WorksheetQueryCache.source_tables('drop table db1.sales') is None
+    assert WorksheetQueryCache.source_tables('select * from db1.sales, db2.stores') is None
+    assert (
+        WorksheetQueryCache.source_tables('select * from db1.sales join (select a, b from db2.stores) t on true, db2.x')
+        is None
+    )
+    assert WorksheetQueryCache.source_tables(
+        "select a, b from db1.sales where a in (1, 2) and b = 'x, y' order by a, b"
+    ) == [('db1', 'sales')]
+
+
+def test_async_query_and_cache(client, db, group, env_fixture, worksheet, source_table, athena):
+    variables = dict(environmentUri=env_fixture.environmentUri, worksheetUri=worksheet.worksheetUri)
+
+    started = _run(client, START_QUERY, group, sqlQuery='SELECT count(*) AS total FROM db1.sales', **variables)
+    assert started.startAthenaSqlQuery.AthenaQueryId == 'query-1'
+    assert started.startAthenaSqlQuery.Status == 'QUEUED'
+    assert not started.startAthenaSqlQuery.cached
+
+    polled = _run(client, POLL_QUERY, group, athenaQueryId='query-1', **variables)
+    assert polled.pollAthenaSqlQuery.Status == 'SUCCEEDED'
+    assert polled.pollAthenaSqlQuery.DataScannedInBytes == 100
+
+    results = _run(client, FETCH_RESULTS, group, athenaQueryId='query-1', **variables)
+    assert results.fetchAthenaSqlQueryResults.columns[0].typeName == 'bigint'
+    assert results.fetchAthenaSqlQueryResults.rows[0].cells[0].value == '42'
+
+    # Same query, formatted differently, on the same version of the table
+    cached = _run(client, START_QUERY, group, sqlQuery='select count(*) as total\n  from DB1.sales;', **variables)
+    assert cached.startAthenaSqlQuery.AthenaQueryId == 'query-1'
+    assert cached.startAthenaSqlQuery.cached
+    assert athena.call_count == 1
+
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(source_table.tableUri).GlueTableVersion = '2'
+
+    restarted = _run(client, START_QUERY, group, sqlQuery='SELECT count(*) AS total FROM db1.sales', **variables)
+    assert restarted.startAthenaSqlQuery.AthenaQueryId == 'query-2'
+    assert not restarted.startAthenaSqlQuery.cached
+
+
+def test_fetch_results_of_unknown_query(client, group, env_fixture, worksheet, athena):
+    response = client.query(
+        FETCH_RESULTS,
+        username='alice',
+        groups=[group.name],
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        athenaQueryId='unknown',
+    )
+    assert 'ResourceNotFound' in response.errors[0].message
+
+
+def test_run_query_next_page_of_other_workgroup(client, group, env_fixture, worksheet, athena):
+    variables = dict(
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        sqlQuery='select 1',
+        athenaQueryId='query-of-other-team',
+        nextToken='token',
+    )
+    page = _run(client, RUN_QUERY, group, **variables)
+    assert page.runAthenaSqlQuery.rows[0].cells[0].value == '42'
+
+    AthenaClient.get_query_execution.return_value = dict(AthenaClient.get_query_execution(), WorkGroup='other')
+    response = client.query(RUN_QUERY, username='alice', groups=[group.name], **variables)
+    assert 'ResourceNotFound' in response.errors[0].message
+    AthenaClient.get_query_results.assert_called_once()
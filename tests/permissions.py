@@ -542,6 +542,9 @@ EXPECTED_RESOLVERS: Mapping[str, TestData] = {
     field_id('Mutation', 'enableDataSubscriptions'): TestData(
         tenant_perm=MANAGE_ENVIRONMENTS, resource_perm=ENABLE_ENVIRONMENT_SUBSCRIPTIONS
     ),
+    field_id('Mutation', 'fetchAthenaSqlQueryResults'): TestData(
+        resource_perm=RUN_ATHENA_QUERY, tenant_perm=MANAGE_WORKSHEETS
+    ),
     field_id('Mutation', 'generateDatasetAccessToken'): TestData(
         tenant_perm=MANAGE_DATASETS, resource_perm=CREDENTIALS_DATASET
     ),
@@ -563,6 +566,7 @@ EXPECTED_RESOLVERS: Mapping[str, TestData] = {
     field_id('Mutation', 'markAllNotificationsAsRead'): TestData(
         tenant_ignore=IgnoreReason.APPSUPPORT, resource_ignore=IgnoreReason.CUSTOM
     ),
+    field_id('Mutation', 'pollAthenaSqlQuery'): TestData(resource_perm=RUN_ATHENA_QUERY, tenant_perm=MANAGE_WORKSHEETS),
     field_id('Mutation', 'postFeedMessage'): TestData(
         tenant_ignore=IgnoreReason.APPSUPPORT, resource_perm=TARGET_TYPE_PERM
     ),
@@ -596,6 +600,9 @@ EXPECTED_RESOLVERS: Mapping[str, TestData] = {
     field_id('Mutation', 'startDatasetProfilingRun'): TestData(
         tenant_perm=MANAGE_DATASETS, resource_perm=PROFILE_DATASET_TABLE
     ),
+    field_id('Mutation', 'startAthenaSqlQuery'): TestData(
+        resource_perm=RUN_ATHENA_QUERY, tenant_perm=MANAGE_WORKSHEETS
+    ),
     field_id('Mutation', 'startGlueCrawler'): TestData(tenant_perm=MANAGE_DATASETS, resource_perm=CRAWL_DATASET),
     field_id('Mutation', 'startMaintenanceWindow'): TestData(
         tenant_ignore=IgnoreReason.TENANT, resource_ignore=IgnoreReason.TENANT, tenant_admin_perm=True
@@ -77,6 +77,7 @@ def setup_Mutation_upVote(mocker, **kwargs):
 @patch('dataall.modules.notifications.services.notification_service.NotificationAccess.check_recipient')
 @patch('dataall.modules.metadata_forms.services.metadata_form_access_service.MetadataFormAccessService.is_owner')
 @patch('dataall.modules.catalog.services.glossaries_service.GlossariesResourceAccess.check_owner')
+@patch('dataall.core.permissions.services.resource_policy_service.ResourcePolicyService.filter_authorized')
 @patch('dataall.core.permissions.services.resource_policy_service.ResourcePolicyService.check_user_resource_permission')
 @patch('dataall.core.permissions.services.group_policy_service.GroupPolicyService.check_group_environment_permission')
 @patch('dataall.core.permissions.services.tenant_policy_service.TenantPolicyService.check_user_tenant_permission')
@@ -94,6 +95,7 @@ def test_permissions(
     mock_check_tenant,
     mock_check_group,
     mock_check_resource,
+    mock_filter_resource,
     mock_check_glossary_owner,
     mock_check_mf_owner,
     mock_check_notification_recipient,
@@ -131,6 +133,13 @@ def test_permissions(
     if not perm:  # if no expected permission is defined, we expect the check to not be called
         locals()[f'mock_check_{perm_type}'].assert_not_called()  # nosemgrep
         pytest.skip(msg + f' Reason: {reason.value}')
+    elif perm_type == 'resource' and mock_filter_resource.called:  # resources checked in bulk
+        mock_filter_resource.assert_any_call(
+            session=ANY,
+            resource_uris=ANY,
+            groups=groups,
+            permission_name=perm,
+        )
     elif perm_type == 'resource':
         mock_check_resource.assert_any_call(
             session=ANY,